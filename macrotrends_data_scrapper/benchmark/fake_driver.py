@@ -0,0 +1,402 @@
+import html
+import math
+import re
+import time
+from collections import Counter
+from functools import lru_cache
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from macrotrends_data_scrapper.benchmark.standin_grid import get_grid_config
+from macrotrends_data_scrapper.utils.grid_scripts import (
+    ACTIVE_TAB_SCRIPT,
+    APPLY_FILTERS_SCRIPT,
+    GO_TO_PAGE_SCRIPT,
+    GRID_HTML_SCRIPT,
+    GRID_SIGNATURE_SCRIPT,
+    SCRAP_DATA_SOURCE_SCRIPT,
+    SCRAP_VISIBLE_ROWS_SCRIPT,
+    WAIT_FOR_GRID_CHANGE_SCRIPT,
+)
+
+# XPaths used by the table scrapper, matched after their whitespace is removed
+_ROW_CELL_XPATH = re.compile(r"//\*\[@id='row(\d+)jqxGrid'\]/div\[(\d+)\]/div")
+_NAME_XPATH = re.compile(r"//\*\[@id='row(\d+)jqxGrid'\]/div\[1\]/div/div/a")
+_TAB_XPATH = re.compile(r"//\*\[@id='columns_(\w+)'\]/a")
+_PAGER_TEXT_XPATH = "//*[@id='pagerjqxGrid']/div/div[6]"
+_NEXT_PAGE_XPATH = "/html/body/div[1]/div[4]/div[2]/div/div/div/div/div[10]/div/div[4]/div"
+
+
+class FakeElement:
+    """Element returned by FakeDriver, it is always displayed and enabled.
+
+    Attributes
+    ----------
+    text : str
+        text of the element
+    """
+
+    def __init__(self, text: str, on_click=None):
+        self.text = text
+        self._on_click = on_click
+
+    def is_displayed(self) -> bool:
+        """Elements of the fake grid are always displayed."""
+        return True
+
+    def is_enabled(self) -> bool:
+        """Elements of the fake grid are always enabled."""
+        return True
+
+    def click(self):
+        """Click the element, e.g., a tab link or the next page button."""
+        if self._on_click is not None:
+            self._on_click()
+
+
+class FakeDriver:
+    """In-process stand-in of the WebDriver showing a table model, for microbenchmarks.
+
+    The subset of the WebDriver API used by TableScrapper is implemented
+    (i.e., get, find_element(s) by the XPaths of the grid, clicks through
+    WebDriverWait and the scripts of grid_scripts) on the records of the
+    stand-in grid (see standin_data), without a browser. The grid is
+    re-rendered synchronously, hence the time spent in a scrapping is the
+    overhead of the Python loop, of the data recorder and of the emulated
+    round trips (see command_latency_ms).
+
+    Values are formatted as the stand-in grid formats them, so the pages are
+    the same as the ones scrapped from the stand-in page in a browser.
+
+    Attributes
+    ----------
+    records : list[dict]
+        records of the grid, keyed by the datafields
+    grid_config : dict
+        configuration of the grid, see get_grid_config. Render delays are
+        ignored.
+    command_latency_ms : float
+        milliseconds slept on every command, to emulate the round trip of
+        the WebDriver protocol
+    commands : collections.Counter
+        number of commands received, by their names (e.g., "find_elements",
+        "execute_script")
+    current_url : str
+        url passed to get
+
+    Methods
+    -------
+    get(url):
+        Load the grid, on its first page and tab without any filter
+    find_elements(by, value):
+        Get the elements at an XPath of the grid
+    find_element(by, value):
+        Get the first element at an XPath of the grid
+    execute_script(script, *args):
+        Run a script of grid_scripts on the grid
+    execute_async_script(script, *args):
+        Run an asynchronous script of grid_scripts on the grid
+    """
+
+    def __init__(
+        self, records: "list[dict]", grid_config: dict = None, command_latency_ms: float = 0
+    ):
+        self.records = records
+        self.grid_config = get_grid_config() if grid_config is None else grid_config
+        self.command_latency_ms = command_latency_ms
+        self.commands = Counter()
+        self.current_url = None
+
+        self._tabs = {tab["name"]: tab for tab in self.grid_config["tabs"]}
+        self._scripts = {
+            GRID_SIGNATURE_SCRIPT: self._grid_signature,
+            GO_TO_PAGE_SCRIPT: self._go_to_page,
+            GRID_HTML_SCRIPT: self._grid_html,
+            SCRAP_VISIBLE_ROWS_SCRIPT: self._visible_row_matrix,
+            SCRAP_DATA_SOURCE_SCRIPT: self._data_source_matrix,
+            APPLY_FILTERS_SCRIPT: self._apply_filters,
+            ACTIVE_TAB_SCRIPT: lambda: self._tab["name"],
+        }
+        self._reset()
+
+    def get(self, url: str):
+        """Load the grid, on its first page and tab without any filter."""
+        self._receive("get")
+        self.current_url = url
+        self._reset()
+
+    def find_elements(self, by: str, value: str) -> "list[FakeElement]":
+        """Get the elements at an XPath of the grid, an empty list if there is none.
+
+        Raises
+        ------
+        ValueError
+            if the locator is not one of the XPaths used by the table scrapper
+        """
+        self._receive("find_elements")
+        return self._find(by, value)
+
+    def find_element(self, by: str, value: str) -> FakeElement:
+        """Get the first element at an XPath of the grid.
+
+        Raises
+        ------
+        NoSuchElementException
+            if there is no element at the XPath
+        """
+        self._receive("find_element")
+        elements = self._find(by, value)
+        if not elements:
+            raise NoSuchElementException(f"No element is found at: {value}")
+        return elements[0]
+
+    def execute_script(self, script: str, *args):
+        """Run a script of grid_scripts on the grid.
+
+        Raises
+        ------
+        ValueError
+            if the script is not one of grid_scripts
+        """
+        self._receive("execute_script")
+        if script not in self._scripts:
+            raise ValueError(f"Script is not emulated: {script.strip()[:60]}...")
+        return self._scripts[script](*args)
+
+    def execute_async_script(self, script: str, *args):
+        """Run an asynchronous script of grid_scripts on the grid.
+
+        Grid is re-rendered synchronously, hence waiting for a change returns
+        immediately: 0 if the grid is changed, -1 (i.e., timeout) otherwise.
+        """
+        self._receive("execute_async_script")
+        if script != WAIT_FOR_GRID_CHANGE_SCRIPT:
+            raise ValueError(f"Script is not emulated: {script.strip()[:60]}...")
+        previous_signature = args[0]
+        return 0 if self._grid_signature() != previous_signature else -1
+
+    def set_script_timeout(self, time_to_wait: float):
+        """Scripts of the fake grid do not time out."""
+        self._receive("set_script_timeout")
+
+    def close(self):
+        """Close the window, nothing to be released."""
+        self._receive("close")
+
+    def quit(self):
+        """Quit the driver, nothing to be released."""
+        self._receive("quit")
+
+    def _receive(self, command: str):
+        """Count a command and emulate its round trip."""
+        self.commands[command] += 1
+        if self.command_latency_ms:
+            time.sleep(self.command_latency_ms / 1000)
+
+    def _reset(self):
+        """Show the first page of the first tab without any filter."""
+        self._tab = self.grid_config["tabs"][0]
+        self._page_num = 0
+        self._row_indices = list(range(len(self.records)))
+
+    def _find(self, by: str, value: str) -> "list[FakeElement]":
+        """Get the elements at an XPath of the grid."""
+        if by != By.XPATH:
+            raise ValueError(f"Only XPath locators are emulated, got: {by}")
+        kind, *args = _parse_xpath(value)
+        if kind == "pager_text":
+            return [FakeElement(self._pager_text())]
+        if kind == "next_page":
+            return [FakeElement(">", on_click=lambda: self._go_to_page(self._page_num + 1))]
+        if kind == "tab":
+            (tab_name,) = args
+            if tab_name not in self._tabs:
+                return []
+            return [FakeElement(tab_name, on_click=lambda: self._show_tab(tab_name))]
+
+        row_number, cell_index = args
+        row_index = self._row_index(row_number)
+        if row_index is None:
+            return []
+        if kind == "name":
+            return [FakeElement(self._cell_text(row_index, self.grid_config["nameColumn"]))]
+        columns = self._visible_columns()
+        if cell_index > len(columns):
+            return []
+        return [FakeElement(self._cell_text(row_index, columns[cell_index - 1]))]
+
+    def _visible_columns(self) -> "list[dict]":
+        """Get the columns shown on the active tab, starting with the name and the ticker."""
+        return [
+            self.grid_config["nameColumn"], self.grid_config["tickerColumn"], *self._tab["columns"]
+        ]
+
+    def _row_index(self, row_number: int):
+        """Index of the record shown at a row of the page, None if the row is not shown."""
+        position = self._page_num * self.grid_config["rowsPerPage"] + row_number
+        if row_number >= self.grid_config["rowsPerPage"] or position >= len(self._row_indices):
+            return None
+        return self._row_indices[position]
+
+    def _num_of_pages(self) -> int:
+        """Get the number of pages of the (filtered) rows."""
+        rows_per_page = self.grid_config["rowsPerPage"]
+        return max(1, math.ceil(len(self._row_indices) / rows_per_page))
+
+    def _pager_text(self) -> str:
+        """Text of the pager, e.g., "21-40 of 45"."""
+        num_of_rows = len(self._row_indices)
+        if num_of_rows == 0:
+            return "0-0 of 0"
+        first_row = self._page_num * self.grid_config["rowsPerPage"]
+        last_row = min(first_row + self.grid_config["rowsPerPage"], num_of_rows)
+        return f"{first_row + 1}-{last_row} of {num_of_rows}"
+
+    def _cell_text(self, row_index: int, column: dict) -> str:
+        """Text of a cell as the stand-in grid formats it, "-" if the value is missing."""
+        value = self.records[row_index].get(column["datafield"])
+        if value is None or value == "":
+            return "-"
+        value_type = column.get("type", "text")
+        if value_type == "money":
+            return _format_money(float(value) * column["scale"])
+        if value_type == "percent":
+            return f"{float(value):.2f}%"
+        if value_type == "number":
+            return f"{float(value):.2f}"
+        return str(value)
+
+    def _show_tab(self, tab_name: str):
+        """Show the columns of a tab."""
+        self._tab = self._tabs[tab_name]
+
+    def _grid_signature(self) -> str:
+        """Signature of what the grid shows, see GRID_SIGNATURE_SCRIPT."""
+        first_row = self._row_index(0)
+        return f"{self._pager_text()}|{self._tab['name']}|{first_row}"
+
+    def _go_to_page(self, page_num: int) -> bool:
+        """Show a page, return whether another page was shown, see GO_TO_PAGE_SCRIPT."""
+        previous_page = self._page_num
+        self._page_num = max(0, min(page_num, self._num_of_pages() - 1))
+        return previous_page != self._page_num
+
+    def _row_values(self, row_index: int) -> "list[str]":
+        """Values of a row in the form of [ticker, name, column1, column2, ...]."""
+        name_column, ticker_column, *columns = self._visible_columns()
+        return [
+            self._cell_text(row_index, ticker_column),
+            self._cell_text(row_index, name_column),
+            *(self._cell_text(row_index, column) for column in columns),
+        ]
+
+    def _visible_row_matrix(self, num_of_rows: int) -> "list[list[str]]":
+        """Row matrix of the page, see SCRAP_VISIBLE_ROWS_SCRIPT."""
+        row_matrix = []
+        for row_number in range(num_of_rows):
+            row_index = self._row_index(row_number)
+            if row_index is None:
+                break
+            row_matrix.append(self._row_values(row_index))
+        return row_matrix
+
+    def _data_source_matrix(self) -> "list[list[str]]":
+        """Row matrix of every (filtered) row, see SCRAP_DATA_SOURCE_SCRIPT."""
+        return [self._row_values(row_index) for row_index in self._row_indices]
+
+    def _grid_html(self) -> str:
+        """Html of the grid as the stand-in page renders it, see GRID_HTML_SCRIPT."""
+        columns = self._visible_columns()
+        headers = "".join(
+            f'<div class="grid-cell">{html.escape(column["text"])}</div>' for column in columns
+        )
+        rows = []
+        for row_number in range(self.grid_config["rowsPerPage"]):
+            row_index = self._row_index(row_number)
+            if row_index is None:
+                break
+            cells = [
+                '<div class="grid-cell"><div><div><a href="#">'
+                f'{html.escape(self._cell_text(row_index, columns[0]))}</a></div></div></div>'
+            ]
+            cells.extend(
+                f'<div class="grid-cell"><div>{html.escape(self._cell_text(row_index, column))}'
+                '</div></div>'
+                for column in columns[1:]
+            )
+            rows.append(f'<div class="grid-row" id="row{row_number}jqxGrid">{"".join(cells)}</div>')
+        fillers = "<div></div>" * 7
+        return (
+            f'<div id="jqxGrid"><div id="columntablejqxGrid">{headers}</div>'
+            f'<div id="contenttablejqxGrid">{"".join(rows)}</div>{fillers}'
+            '<div id="pagerjqxGrid"><div><div class="pager-cell">Go to page:</div>'
+            f'<div class="pager-cell">{self._page_num + 1}</div>'
+            f'<div class="pager-cell">Show rows: {self.grid_config["rowsPerPage"]}</div>'
+            '<div class="pager-cell"><div class="pager-button">&gt;</div></div>'
+            '<div class="pager-cell"><div class="pager-button">&lt;</div></div>'
+            f'<div class="pager-cell">{self._pager_text()}</div></div></div></div>'
+        )
+
+    def _apply_filters(self, grid_filters: "list[dict]") -> list:
+        """Replace the filters of the grid, see APPLY_FILTERS_SCRIPT."""
+        num_of_rows_before = len(self._row_indices)
+        first_row_before = self._row_index(0)
+        self._row_indices = [
+            row_index for row_index, record in enumerate(self.records)
+            if all(_matches_grid_filter(record, grid_filter) for grid_filter in grid_filters)
+        ]
+        self._page_num = 0
+        return [num_of_rows_before, len(self._row_indices), first_row_before, self._row_index(0)]
+
+
+@lru_cache(maxsize=None)
+def _parse_xpath(xpath: str) -> tuple:
+    """Get the kind of the element at an XPath of the grid and its arguments.
+
+    Raises
+    ------
+    ValueError
+        if the XPath is not one of the XPaths used by the table scrapper
+    """
+    xpath = "".join(xpath.split())
+    if xpath == _PAGER_TEXT_XPATH:
+        return ("pager_text",)
+    if xpath == _NEXT_PAGE_XPATH:
+        return ("next_page",)
+    match = _TAB_XPATH.fullmatch(xpath)
+    if match:
+        return ("tab", match.group(1))
+    match = _NAME_XPATH.fullmatch(xpath)
+    if match:
+        return ("name", int(match.group(1)), 1)
+    match = _ROW_CELL_XPATH.fullmatch(xpath)
+    if match:
+        return ("cell", int(match.group(1)), int(match.group(2)))
+    raise ValueError(f"XPath is not emulated: {xpath}")
+
+
+def _format_money(value: float) -> str:
+    """Format a money value as the stand-in grid does, e.g., "$2.91T"."""
+    for suffix, scale in (("T", 1e12), ("B", 1e9), ("M", 1e6)):
+        if abs(value) >= scale:
+            return f"${value / scale:.2f}{suffix}"
+    return f"${value:.2f}"
+
+
+def _matches_grid_filter(record: dict, grid_filter: dict) -> bool:
+    """Check whether a record satisfies a filter of APPLY_FILTERS_SCRIPT."""
+    value = record.get(grid_filter["datafield"])
+    if "values" in grid_filter:
+        return value is not None and str(value).casefold() in {
+            filter_value.casefold() for filter_value in grid_filter["values"]
+        }
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return False  # missing values do not satisfy any bound
+    if grid_filter.get("min") is not None and number < grid_filter["min"]:
+        return False
+    if grid_filter.get("max") is not None and number > grid_filter["max"]:
+        return False
+    return True
@@ -0,0 +1,553 @@
+import argparse
+import csv
+import functools
+import json
+import math
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+from macrotrends_data_scrapper.benchmark.fake_driver import FakeDriver
+from macrotrends_data_scrapper.benchmark.standin_data import (
+    generate_records,
+    load_ground_truth_records,
+    to_scrapped_pages,
+)
+from macrotrends_data_scrapper.benchmark.standin_grid import (
+    StandInServer,
+    add_grid_arguments,
+    get_grid_config,
+    get_grid_config_from_args,
+    render_standin_page,
+)
+from macrotrends_data_scrapper.data_recorder import (
+    DataRecorder,
+    IndexedDataRecorder,
+    JournalDataRecorder,
+)
+from macrotrends_data_scrapper.http_scrapper import HttpTableScrapper
+from macrotrends_data_scrapper.parquet_recorder import ParquetDataRecorder
+from macrotrends_data_scrapper.scrap_the_table import TableScrapper
+from macrotrends_data_scrapper.sqlite_recorder import SQLiteDataRecorder
+from macrotrends_data_scrapper.traversal_planner import PAGE_MAJOR, TRAVERSAL_STRATEGIES
+
+# Engines which can be benchmarked: the extraction modes of TableScrapper and
+# the browserless HttpTableScrapper
+ENGINES = TableScrapper.EXTRACTION_MODES + ("http",)
+
+# Data recorders which can be benchmarked, by the names of the --recorder
+# option of main.py ("parquet" is the --output-format)
+RECORDERS = {
+    "csv": DataRecorder,
+    "indexed": IndexedDataRecorder,
+    "journal": JournalDataRecorder,
+    "sqlite": SQLiteDataRecorder,
+    "parquet": ParquetDataRecorder,
+}
+
+# Parameters scrapped by default, they are spread over three tabs
+DEFAULT_PARAMETERS = ["Market Cap", "P/E Ratio", "Exchange", "Return on Assets"]
+
+# Headers of the report tables, see format_result and format_recorder_result
+REPORT_HEADER = (
+    f"{'table':>8} {'engine':>10} {'rows':>8} {'boot_s':>7} {'wall_s':>8} "
+    f"{'pages/s':>9} {'cells/s':>10} {'turn_ms':>9} {'tab_ms':>9} {'tab_p95':>9} "
+    f"{'mem_mb':>8} {'commands':>9}"
+)
+RECORDER_REPORT_HEADER = (
+    f"{'table':>8} {'recorder':>10} {'rows':>8} {'wall_s':>8} {'pages/s':>9} "
+    f"{'first_ms':>9} {'last_ms':>9} {'growth':>8} {'flush_s':>8} {'mem_mb':>8}"
+)
+
+
+def benchmark_engine(
+    engine: str,
+    url: str,
+    parameters: list[str],
+    num_of_rows: int,
+    rows_per_page: int,
+    traversal_strategy: str = PAGE_MAJOR,
+    workers: int = 1,
+    trace_memory: bool = False,
+    driver_factory=None,
+) -> dict:
+    """Scrap the stand-in table with an engine and measure its throughput.
+
+    Parameters
+    ----------
+    engine : str
+        one of ENGINES
+    url : str
+        url of the stand-in stock screener page
+    parameters : list[str]
+        parameters to be scrapped
+    num_of_rows : int
+        number of rows of the stand-in table
+    rows_per_page : int
+        number of rows shown on a page of the stand-in table
+    traversal_strategy : str
+        traversal strategy of TableScrapper, see TRAVERSAL_STRATEGIES
+    workers : int
+        number of browser sessions of TableScrapper
+    trace_memory : bool
+        if True, the peak memory allocated by Python during scrap_the_table is
+        measured, which slows down the scrapping
+    driver_factory : callable
+        if provided, function returning the driver of TableScrapper instead of
+        launching a browser, e.g., one returning a FakeDriver
+
+    Returns
+    -------
+    result : dict
+        measurements of the run:
+        "boot_seconds": seconds until the page is loaded by the browser,
+        "wall_seconds": end-to-end seconds of scrap_the_table,
+        "rows": number of rows saved to the output file,
+        "pages_per_second" and "cells_per_second": throughput of scrap_the_table,
+        "page_turn_ms" and "tab_switch_ms": mean milliseconds waited for the
+        grid to be re-rendered (None if not measured),
+        "tab_switch_p95_ms": 95th percentile of the tab switch waits, and
+        "peak_memory_mb": peak memory allocated by Python (None if not traced),
+        "driver_commands": number of commands sent to the driver of the
+        first worker (None unless the driver is a FakeDriver)
+    """
+    with tempfile.TemporaryDirectory() as output_dir:
+        csv_file = os.path.join(output_dir, "benchmark.csv")
+
+        boot_start = time.perf_counter()
+        if engine == "http":
+            scrapper = HttpTableScrapper(str_logger="none", url=url)
+        else:
+            scrapper = TableScrapper(
+                str_logger="none",
+                extraction_mode=engine,
+                boot_in_background=False,
+                traversal_strategy=traversal_strategy,
+                url=url,
+                driver_factory=driver_factory,
+            )
+        boot_seconds = time.perf_counter() - boot_start
+
+        try:
+            with _MemoryTracer(trace_memory) as memory_tracer:
+                scrap_start = time.perf_counter()
+                if engine == "http":
+                    scrapper.scrap_the_table(parameters, csv_file=csv_file)
+                else:
+                    scrapper.scrap_the_table(parameters, csv_file=csv_file, workers=workers)
+                wall_seconds = time.perf_counter() - scrap_start
+            wait_times = getattr(scrapper, "wait_times", {"page_turn": [], "tab_switch": []})
+            driver_commands = None
+            if driver_factory is not None:
+                driver_commands = sum(scrapper.driver_manager.driver.commands.values())
+        finally:
+            # Driver is shut down, or the connections are closed, by the scrapper
+            del scrapper
+
+        with open(csv_file, "r", newline="") as output_file:
+            num_of_saved_rows = sum(1 for _ in csv.DictReader(output_file))
+
+    num_of_pages = math.ceil(num_of_rows / rows_per_page)
+    # Company name and ticker are scrapped as well
+    num_of_cells = num_of_saved_rows * (len(parameters) + 2)
+    return {
+        "engine": engine,
+        "rows": num_of_saved_rows,
+        "pages": num_of_pages,
+        "boot_seconds": boot_seconds,
+        "wall_seconds": wall_seconds,
+        "pages_per_second": num_of_pages / wall_seconds,
+        "cells_per_second": num_of_cells / wall_seconds,
+        "page_turn_ms": _mean_ms(wait_times["page_turn"]),
+        "tab_switch_ms": _mean_ms(wait_times["tab_switch"]),
+        "tab_switch_p95_ms": _percentile_ms(wait_times["tab_switch"], 95),
+        "peak_memory_mb": memory_tracer.peak_memory_mb,
+        "driver_commands": driver_commands,
+    }
+
+
+def benchmark_recorder(
+    recorder: str, company_attr_pages: "list[dict]", trace_memory: bool = False
+) -> dict:
+    """Save the pages to a data recorder and measure how its save time grows.
+
+    Parameters
+    ----------
+    recorder : str
+        one of RECORDERS
+    company_attr_pages : list[dict]
+        pages to be saved, see to_scrapped_pages
+    trace_memory : bool
+        if True, the peak memory allocated by Python while the pages are
+        saved is measured, which slows down the saving
+
+    Returns
+    -------
+    result : dict
+        measurements of the run:
+        "wall_seconds": seconds spent for saving the pages and flushing,
+        "pages_per_second" and "rows_per_second": throughput of the recorder,
+        "first_saves_ms" and "last_saves_ms": mean milliseconds of a save in
+        the first and in the last tenth of the pages,
+        "save_growth": ratio of the two, it grows with the number of pages if
+        the time of a save depends on the rows saved before (e.g., the CSV
+        file is rewritten at every save),
+        "flush_seconds": seconds spent for the final flush, and
+        "peak_memory_mb": peak memory allocated by Python (None if not traced)
+    """
+    num_of_rows = sum(len(company_attr_page) for company_attr_page in company_attr_pages)
+    save_seconds = []
+    with tempfile.TemporaryDirectory() as output_dir:
+        data_recorder = RECORDERS[recorder](os.path.join(output_dir, "benchmark.csv"))
+        with _MemoryTracer(trace_memory) as memory_tracer:
+            start = time.perf_counter()
+            for company_attr_page in company_attr_pages:
+                save_start = time.perf_counter()
+                data_recorder.save_to_csv(
+                    scrapped_data=company_attr_page, ticker_column_str="Ticker"
+                )
+                save_seconds.append(time.perf_counter() - save_start)
+            flush_start = time.perf_counter()
+            data_recorder.flush()
+            flush_seconds = time.perf_counter() - flush_start
+            wall_seconds = time.perf_counter() - start
+        # Files of the recorder are closed before the directory is removed
+        del data_recorder
+
+    tenth = max(1, len(save_seconds) // 10)
+    first_saves_ms = _mean_ms(save_seconds[:tenth])
+    last_saves_ms = _mean_ms(save_seconds[-tenth:])
+    return {
+        "recorder": recorder,
+        "rows": num_of_rows,
+        "pages": len(company_attr_pages),
+        "wall_seconds": wall_seconds,
+        "pages_per_second": len(company_attr_pages) / wall_seconds,
+        "rows_per_second": num_of_rows / wall_seconds,
+        "first_saves_ms": first_saves_ms,
+        "last_saves_ms": last_saves_ms,
+        "save_growth": last_saves_ms / first_saves_ms if first_saves_ms else None,
+        "flush_seconds": flush_seconds,
+        "peak_memory_mb": memory_tracer.peak_memory_mb,
+    }
+
+
+def run_benchmark(
+    sizes: list[int],
+    engines: list[str] = ENGINES,
+    parameters: list[str] = None,
+    grid_config: dict = None,
+    ground_truth_file: str = None,
+    traversal_strategy: str = PAGE_MAJOR,
+    workers: int = 1,
+    trace_memory: bool = False,
+    fake_driver: bool = False,
+    command_latency_ms: float = 0,
+):
+    """Serve stand-in tables of the given sizes and benchmark each engine on them.
+
+    Parameters
+    ----------
+    sizes : list[int]
+        numbers of rows of the stand-in tables
+    engines : list[str]
+        engines to be benchmarked, see ENGINES
+    parameters : list[str]
+        parameters to be scrapped, DEFAULT_PARAMETERS if None. Only their
+        values are generated, so that the pages of large tables are small.
+    grid_config : dict
+        configuration of the stand-in grid (i.e., rows per page, render
+        delays and the seed), see get_grid_config
+    ground_truth_file : str
+        if provided, the first rows of the tables are the companies of the
+        ground truth workbook (see load_ground_truth_records), the remaining
+        ones are synthetic
+    traversal_strategy : str
+        traversal strategy of TableScrapper, see TRAVERSAL_STRATEGIES
+    workers : int
+        number of browser sessions of TableScrapper
+    trace_memory : bool
+        if True, the peak memory allocated by Python is measured, see
+        benchmark_engine
+    fake_driver : bool
+        if True, the extraction modes scrap the tables through an in-process
+        FakeDriver instead of a browser, which measures the overhead of the
+        Python scrapping loop. No server is started and the render delays
+        are ignored, the http engine is not supported.
+    command_latency_ms : float
+        milliseconds slept by the FakeDriver on every command, to emulate the
+        round trip of the WebDriver protocol
+
+    Yields
+    ------
+    result : dict
+        measurements of an engine on a table, see benchmark_engine, with the
+        number of rows of the table ("table_rows")
+    """
+    parameters = DEFAULT_PARAMETERS if parameters is None else parameters
+    grid_config = get_grid_config() if grid_config is None else grid_config
+    if fake_driver and "http" in engines:
+        raise ValueError("The http engine does not use a driver, it cannot be faked")
+    base_records = None if ground_truth_file is None else load_ground_truth_records(
+        ground_truth_file
+    )
+    for num_of_rows in sizes:
+        records = generate_records(
+            num_of_rows, seed=grid_config["seed"], base_records=base_records, params=parameters
+        )
+        if fake_driver:
+            for engine in engines:
+                result = benchmark_engine(
+                    engine, "about:blank", parameters, num_of_rows, grid_config["rowsPerPage"],
+                    traversal_strategy=traversal_strategy,
+                    workers=workers,
+                    trace_memory=trace_memory,
+                    driver_factory=functools.partial(
+                        FakeDriver, records, grid_config, command_latency_ms
+                    ),
+                )
+                yield {"table_rows": num_of_rows, **result}
+            continue
+
+        with StandInServer(render_standin_page(records, grid_config)) as server:
+            del records  # only the page is kept
+            for engine in engines:
+                result = benchmark_engine(
+                    engine, server.url, parameters, num_of_rows, grid_config["rowsPerPage"],
+                    traversal_strategy=traversal_strategy,
+                    workers=workers,
+                    trace_memory=trace_memory,
+                )
+                yield {"table_rows": num_of_rows, **result}
+
+
+def run_recorder_benchmark(
+    sizes: list[int],
+    recorders: list[str] = tuple(RECORDERS),
+    parameters: list[str] = None,
+    rows_per_page: int = 20,
+    seed: int = 0,
+    trace_memory: bool = False,
+):
+    """Save synthetic tables of the given sizes page by page with each data recorder.
+
+    No browser is used, pages are in the form TableScrapper saves them.
+
+    Parameters
+    ----------
+    sizes : list[int]
+        numbers of rows of the tables
+    recorders : list[str]
+        data recorders to be benchmarked, see RECORDERS
+    parameters : list[str]
+        parameters of the pages, DEFAULT_PARAMETERS if None
+    rows_per_page : int
+        number of rows of a page
+    seed : int
+        seed of the synthetic values
+    trace_memory : bool
+        if True, the peak memory allocated by Python is measured, see
+        benchmark_recorder
+
+    Yields
+    ------
+    result : dict
+        measurements of a recorder on a table, see benchmark_recorder, with
+        the number of rows of the table ("table_rows")
+    """
+    parameters = DEFAULT_PARAMETERS if parameters is None else parameters
+    for num_of_rows in sizes:
+        company_attr_pages = list(to_scrapped_pages(
+            generate_records(num_of_rows, seed=seed, params=parameters),
+            parameters,
+            rows_per_page,
+        ))
+        for recorder in recorders:
+            result = benchmark_recorder(recorder, company_attr_pages, trace_memory=trace_memory)
+            yield {"table_rows": num_of_rows, **result}
+
+
+def format_result(result: dict) -> str:
+    """Format the measurements of an engine as a line of the report table."""
+    return (
+        f"{result['table_rows']:>8} {result['engine']:>10} {result['rows']:>8} "
+        f"{result['boot_seconds']:>7.2f} {result['wall_seconds']:>8.2f} "
+        f"{result['pages_per_second']:>9.2f} {result['cells_per_second']:>10.0f} "
+        f"{_format_optional(result['page_turn_ms']):>9} "
+        f"{_format_optional(result['tab_switch_ms']):>9} "
+        f"{_format_optional(result['tab_switch_p95_ms']):>9} "
+        f"{_format_optional(result['peak_memory_mb']):>8} "
+        f"{'-' if result['driver_commands'] is None else result['driver_commands']:>9}"
+    )
+
+
+def format_recorder_result(result: dict) -> str:
+    """Format the measurements of a data recorder as a line of the report table."""
+    return (
+        f"{result['table_rows']:>8} {result['recorder']:>10} {result['rows']:>8} "
+        f"{result['wall_seconds']:>8.2f} {result['pages_per_second']:>9.2f} "
+        f"{result['first_saves_ms']:>9.2f} {result['last_saves_ms']:>9.2f} "
+        f"{_format_optional(result['save_growth']):>8} {result['flush_seconds']:>8.2f} "
+        f"{_format_optional(result['peak_memory_mb']):>8}"
+    )
+
+
+class _MemoryTracer:
+    """Context measuring the peak memory allocated by Python in it, if enabled."""
+
+    def __init__(self, enabled: bool):
+        self.enabled = enabled
+        self.peak_memory_mb = None
+
+    def __enter__(self):
+        """Start tracing the memory allocations."""
+        if self.enabled:
+            tracemalloc.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        """Stop tracing and record the peak."""
+        if self.enabled:
+            _, peak_memory = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            self.peak_memory_mb = peak_memory / 2 ** 20
+
+
+def _format_optional(value) -> str:
+    """Format a measurement which may be missing."""
+    return "-" if value is None else f"{value:.1f}"
+
+
+def _mean_ms(seconds: list[float]):
+    """Mean of the durations in milliseconds, None if there is none."""
+    return statistics.mean(seconds) * 1000 if seconds else None
+
+
+def _percentile_ms(seconds: list[float], percentile: int):
+    """Percentile of the durations in milliseconds, None if there is none."""
+    if not seconds:
+        return None
+    if len(seconds) == 1:
+        return seconds[0] * 1000
+    return statistics.quantiles(seconds, n=100, method="inclusive")[percentile - 1] * 1000
+
+
+def main():
+    """Run the benchmark based on the provided arguments."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the scrappers against a local stand-in of the stock screener"
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[200],
+        help="Numbers of rows of the stand-in tables, e.g., 10000 30000 100000"
+    )
+    parser.add_argument(
+        "--engines",
+        nargs="*",
+        default=list(ENGINES),
+        choices=ENGINES,
+        help="Engines to be benchmarked: the extraction modes of the selenium backend "
+             "and the http backend. None of them is benchmarked if the option is empty"
+    )
+    parser.add_argument(
+        "--recorders",
+        nargs="*",
+        default=[],
+        choices=list(RECORDERS),
+        help="Data recorders to be benchmarked without a browser, by saving the synthetic "
+             "tables page by page"
+    )
+    parser.add_argument(
+        "--parameters-path",
+        dest="params_path",
+        type=str,
+        help="Path to the JSON file where the parameters to be scrapped is listed, "
+             f"default is {DEFAULT_PARAMETERS}"
+    )
+    add_grid_arguments(parser)
+    parser.add_argument(
+        "--traversal",
+        dest="traversal_strategy",
+        default=PAGE_MAJOR,
+        choices=TRAVERSAL_STRATEGIES,
+        help="Order in which the pages and the tabs are traversed by the selenium backend"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of browser sessions of the selenium backend"
+    )
+    parser.add_argument(
+        "--fake-driver",
+        action="store_true",
+        help="Scrap through an in-process fake driver instead of a browser, to measure the "
+             "overhead of the Python scrapping loop and of the data recorder"
+    )
+    parser.add_argument(
+        "--command-latency-ms",
+        type=float,
+        default=0,
+        help="Milliseconds slept by the fake driver on every command, to emulate the round "
+             "trip of the WebDriver protocol"
+    )
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="Measure the peak memory allocated by Python, which slows down the runs"
+    )
+    parser.add_argument(
+        "--output-json",
+        type=str,
+        help="Path to the JSON file where the measurements are written"
+    )
+    args = parser.parse_args()
+
+    parameters = None
+    if args.params_path:
+        with open(args.params_path, "r") as params_file:
+            parameters = json.load(params_file)
+
+    results = {"engines": [], "recorders": []}
+    if args.engines:
+        print(REPORT_HEADER)
+        for result in run_benchmark(
+            args.sizes,
+            engines=args.engines,
+            parameters=parameters,
+            grid_config=get_grid_config_from_args(args),
+            ground_truth_file=args.ground_truth_file,
+            traversal_strategy=args.traversal_strategy,
+            workers=args.workers,
+            trace_memory=args.trace_memory,
+            fake_driver=args.fake_driver,
+            command_latency_ms=args.command_latency_ms,
+        ):
+            print(format_result(result), flush=True)
+            results["engines"].append(result)
+
+    if args.recorders:
+        print(RECORDER_REPORT_HEADER)
+        for result in run_recorder_benchmark(
+            args.sizes,
+            recorders=args.recorders,
+            parameters=parameters,
+            rows_per_page=args.rows_per_page,
+            seed=args.seed,
+            trace_memory=args.trace_memory,
+        ):
+            print(format_recorder_result(result), flush=True)
+            results["recorders"].append(result)
+
+    if args.output_json:
+        with open(args.output_json, "w") as output_file:
+            json.dump(results, output_file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
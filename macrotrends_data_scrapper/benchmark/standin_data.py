@@ -0,0 +1,231 @@
+import random
+
+from macrotrends_data_scrapper.map_of_datafields import (
+    MAP_OF_DATAFIELDS,
+    NAME_DATAFIELD,
+    TICKER_DATAFIELD,
+)
+from macrotrends_data_scrapper.map_of_headers import MAP_OF_HEADERS
+from macrotrends_data_scrapper.map_of_value_types import MAP_OF_VALUE_TYPES
+
+# Records of the stand-in grid have the same form as the client-side data
+# source of the stock screener, i.e., they are keyed by the datafields of
+# MAP_OF_DATAFIELDS and the numeric values are not formatted, e.g.,
+# {"ticker": "AAPL", "comp_name": "Apple Inc", "market_val": 2910000.0, ...}
+
+# Money values of the data source which are in millions of dollars
+MONEY_SCALES = {"market_val": 1e6}
+
+# Columns of the ground truth sheets and the datafields they are stored in
+GROUND_TRUTH_COLUMNS = {
+    "Company Name": NAME_DATAFIELD,
+    "STOCK": TICKER_DATAFIELD,
+    "Market Cap (M $)": "market_val",
+    "P/E": "pe_ratio",
+    "ROA": "roa",
+}
+
+# Ground truth stores the ratios as fractions, the grid shows them as percentages
+GROUND_TRUTH_SCALES = {"roa": 100}
+
+# Values of the synthetic text parameters
+SYNTHETIC_TEXT_VALUES = {
+    "Industry": ["Computer Hardware", "Computer Software", "Banks-Major Regional",
+                 "Medical-Drugs", "Oil-Integrated", "Retail-Discount"],
+    "Exchange": ["NASDAQ", "NYSE", "AMEX"],
+    "Country": ["USA", "Canada", "China", "Germany", "Israel"],
+    "Sector": ["Computer and Technology", "Finance", "Medical", "Oils-Energy",
+               "Retail-Wholesale"],
+}
+
+# Ratio of the synthetic numeric values which are missing
+MISSING_VALUE_RATIO = 0.05
+
+
+def get_tab_columns() -> "dict[str, list[str]]":
+    """Get the columns shown on each tab of the grid.
+
+    Returns
+    -------
+    tab_columns : dict[str, list[str]]
+        parameters shown on each tab in the order of their columns, tabs are
+        in the order of MAP_OF_HEADERS. Columns whose parameters are not
+        listed in MAP_OF_HEADERS are None.
+    """
+    tab_columns = {}
+    for param, tab_and_column in MAP_OF_HEADERS.items():
+        ((tab_name, column_index),) = tab_and_column.items()
+        columns = tab_columns.setdefault(tab_name, [])
+        columns.extend([None] * (column_index - len(columns)))
+        columns[column_index - 1] = param
+    return tab_columns
+
+
+def generate_records(
+    num_of_rows: int,
+    seed: int = 0,
+    base_records: "list[dict]" = None,
+    params: list[str] = None
+) -> "list[dict]":
+    """Generate the records of a stand-in grid.
+
+    Parameters
+    ----------
+    num_of_rows : int
+        number of records
+    seed : int
+        seed of the random values, the same records are generated for the same seed
+    base_records : list[dict]
+        records whose values are used for the first rows (e.g., the ones of
+        load_ground_truth_records), values missing in them are synthetic.
+        Records exceeding num_of_rows are ignored.
+    params : list[str]
+        if provided, only the values of these parameters are generated, the
+        other columns of the grid are shown as missing. It keeps the pages
+        of large tables (e.g., 100k rows) small.
+
+    Returns
+    -------
+    records : list[dict]
+        records keyed by the datafields, tickers are unique
+    """
+    rng = random.Random(seed)
+    datafields_of_params = {
+        param: datafield for param, datafield in MAP_OF_DATAFIELDS.items()
+        if params is None or param in params
+    }
+    base_records = (base_records or [])[:num_of_rows]
+    used_tickers = {record[TICKER_DATAFIELD] for record in base_records}
+
+    records = []
+    ticker_index = 0
+    for row_index in range(num_of_rows):
+        if row_index < len(base_records):
+            base_record = base_records[row_index]
+            ticker = base_record[TICKER_DATAFIELD]
+            name = base_record.get(NAME_DATAFIELD) or ticker
+        else:
+            ticker = _synthetic_ticker(ticker_index)
+            while ticker in used_tickers:
+                ticker_index += 1
+                ticker = _synthetic_ticker(ticker_index)
+            ticker_index += 1
+            used_tickers.add(ticker)
+            name = f"{ticker.capitalize()} Holdings Inc"
+            base_record = {}
+
+        record = {
+            TICKER_DATAFIELD: ticker,
+            NAME_DATAFIELD: name,
+            **_generate_values(rng, datafields_of_params),
+        }
+        record.update({key: value for key, value in base_record.items() if value is not None})
+        records.append(record)
+    return records
+
+
+def to_scrapped_pages(records: "list[dict]", params: list[str], rows_per_page: int):
+    """Convert the records into the pages scrapped by TableScrapper.
+
+    Parameters
+    ----------
+    records : list[dict]
+        records of the grid
+    params : list[str]
+        parameters of the pages
+    rows_per_page : int
+        number of companies of a page
+
+    Yields
+    ------
+    company_attr_page : dict(dict)
+        companies of a page associated with the values of the parameters, in
+        the form saved to a data recorder, e.g., {"A": {"name": "A Holdings
+        Inc", "Market Cap": "1520.3"}}. Missing values are empty strings.
+    """
+    for first_row in range(0, len(records), rows_per_page):
+        company_attr_page = {}
+        for record in records[first_row:first_row + rows_per_page]:
+            company_attr = {"name": record[NAME_DATAFIELD]}
+            for param in params:
+                value = record.get(MAP_OF_DATAFIELDS[param])
+                company_attr[param] = "" if value is None else str(value)
+            company_attr_page[record[TICKER_DATAFIELD]] = company_attr
+        yield company_attr_page
+
+
+def load_ground_truth_records(xlsx_file: str) -> "list[dict]":
+    """Read the companies of the ground truth workbook as records of the grid.
+
+    Every sheet whose header row has a "STOCK" column is read. Only the
+    columns listed in GROUND_TRUTH_COLUMNS are kept, a company listed in
+    several sheets is merged into a single record.
+
+    Parameters
+    ----------
+    xlsx_file : str
+        path to the workbook, e.g., ground_truth.xlsx
+
+    Returns
+    -------
+    records : list[dict]
+        records keyed by the datafields, in the order of their first appearance
+    """
+    import openpyxl  # only needed to read the ground truth
+
+    records = {}
+    workbook = openpyxl.load_workbook(xlsx_file, read_only=True, data_only=True)
+    try:
+        for sheet in workbook.worksheets:
+            column_indices = None
+            for row in sheet.iter_rows(values_only=True):
+                if column_indices is None:
+                    if "STOCK" in row:
+                        column_indices = {
+                            GROUND_TRUTH_COLUMNS[header]: index for index, header in enumerate(row)
+                            if header in GROUND_TRUTH_COLUMNS
+                        }
+                    continue
+
+                ticker = row[column_indices[TICKER_DATAFIELD]]
+                if not isinstance(ticker, str) or not ticker.strip():
+                    continue  # rows below the table, e.g., the summary of the ranks
+                record = records.setdefault(ticker.strip(), {TICKER_DATAFIELD: ticker.strip()})
+                for datafield, index in column_indices.items():
+                    value = row[index]
+                    if datafield == TICKER_DATAFIELD or value is None:
+                        continue
+                    if isinstance(value, (int, float)):
+                        value = round(value * GROUND_TRUTH_SCALES.get(datafield, 1), 4)
+                    record.setdefault(datafield, value)
+    finally:
+        workbook.close()
+    return list(records.values())
+
+
+def _generate_values(rng: random.Random, datafields_of_params: "dict[str, str]") -> dict:
+    """Generate random values of the datafields of the parameters."""
+    record = {}
+    for param, datafield in datafields_of_params.items():
+        value_type = MAP_OF_VALUE_TYPES.get(param, "text")
+        if value_type == "text":
+            record[datafield] = rng.choice(SYNTHETIC_TEXT_VALUES.get(param, ["-"]))
+        elif rng.random() < MISSING_VALUE_RATIO:
+            record[datafield] = None
+        elif datafield in MONEY_SCALES:
+            record[datafield] = round(10 ** rng.uniform(1, 6.5), 2)
+        elif value_type == "money":
+            record[datafield] = round(rng.uniform(0.1, 500), 2)
+        else:
+            record[datafield] = round(rng.uniform(-50, 100), 2)
+    return record
+
+
+def _synthetic_ticker(index: int) -> str:
+    """Get the index-th ticker of the sequence A, B, ..., Z, AA, AB, ..."""
+    ticker = ""
+    index += 1
+    while index > 0:
+        index, remainder = divmod(index - 1, 26)
+        ticker = chr(ord("A") + remainder) + ticker
+    return ticker
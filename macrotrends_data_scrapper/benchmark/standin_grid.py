@@ -0,0 +1,304 @@
+import argparse
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from macrotrends_data_scrapper.benchmark.standin_data import (
+    MONEY_SCALES,
+    generate_records,
+    get_tab_columns,
+    load_ground_truth_records,
+)
+from macrotrends_data_scrapper.map_of_datafields import (
+    MAP_OF_DATAFIELDS,
+    NAME_DATAFIELD,
+    TICKER_DATAFIELD,
+)
+from macrotrends_data_scrapper.map_of_value_types import MAP_OF_VALUE_TYPES
+
+# Path of the stand-in page on the server, the same as the one of the stock screener
+SCREENER_PATH = "/stocks/stock-screener"
+
+
+def get_grid_config(
+    rows_per_page: int = 20,
+    render_delay_ms: float = 0,
+    render_jitter_ms: float = 0,
+    slow_page_ratio: float = 0,
+    slow_page_delay_ms: float = 0,
+    seed: int = 0,
+) -> dict:
+    """Get the configuration of the stand-in grid.
+
+    Parameters
+    ----------
+    rows_per_page : int
+        number of rows shown on a page
+    render_delay_ms : float
+        milliseconds waited before the grid is re-rendered after a page turn,
+        a tab switch or a filtering
+    render_jitter_ms : float
+        maximum of the random milliseconds added to each render delay
+    slow_page_ratio : float
+        ratio of the pages which are slow to be rendered, slow pages are
+        picked by the seed, hence they are the same in every run
+    slow_page_delay_ms : float
+        milliseconds added to the render delay of the slow pages
+    seed : int
+        seed of the jitter and of the slow pages
+
+    Returns
+    -------
+    grid_config : dict
+        configuration embedded in the stand-in page, where the columns of
+        each tab are listed with their datafields, headers, value types and
+        scales (see MONEY_SCALES)
+    """
+    tabs = []
+    for tab_name, params in get_tab_columns().items():
+        columns = []
+        for column_index, param in enumerate(params, start=1):
+            if param is None:
+                # Column that is not scrapped, its values are missing
+                columns.append({
+                    "datafield": f"{tab_name}_column_{column_index}",
+                    "text": f"Column {column_index}", "type": "text", "scale": 1,
+                })
+                continue
+            datafield = MAP_OF_DATAFIELDS[param]
+            columns.append({
+                "datafield": datafield,
+                "text": param,
+                "type": MAP_OF_VALUE_TYPES.get(param, "text"),
+                "scale": MONEY_SCALES.get(datafield, 1),
+            })
+        tabs.append({"name": tab_name, "columns": columns})
+
+    return {
+        "rowsPerPage": rows_per_page,
+        "renderDelayMs": render_delay_ms,
+        "renderJitterMs": render_jitter_ms,
+        "slowPageRatio": slow_page_ratio,
+        "slowPageDelayMs": slow_page_delay_ms,
+        "seed": seed,
+        "nameColumn": {"datafield": NAME_DATAFIELD, "text": "Company", "type": "text"},
+        "tickerColumn": {"datafield": TICKER_DATAFIELD, "text": "Ticker", "type": "text"},
+        "tabs": tabs,
+    }
+
+
+def render_standin_page(records: "list[dict]", grid_config: dict = None) -> str:
+    """Render the html of the stand-in page showing the records.
+
+    The records are embedded as the client-side data source of the grid (i.e.,
+    "var originalData = [...];"), as the stock screener does, hence the page
+    can be scrapped by HttpTableScrapper as well.
+
+    Parameters
+    ----------
+    records : list[dict]
+        records of the grid, see standin_data
+    grid_config : dict
+        configuration of the grid, see get_grid_config. Default one is used if
+        it is not provided.
+
+    Returns
+    -------
+    page : str
+        html of the stand-in page
+    """
+    if grid_config is None:
+        grid_config = get_grid_config()
+    template_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "standin_grid.html")
+    with open(template_path, "r", encoding="utf-8") as template_file:
+        template = template_file.read()
+    return template.replace(
+        "/*GRID_CONFIG*/", _to_script_literal(grid_config)
+    ).replace(
+        "/*ORIGINAL_DATA*/", _to_script_literal(records)
+    )
+
+
+class StandInServer:
+    """Local HTTP server serving a stand-in of the stock screener page.
+
+    Server runs in a background thread, use it as a context manager or call
+    start and stop.
+
+    Attributes
+    ----------
+    page : str
+        html served at SCREENER_PATH, see render_standin_page
+    host : str
+        address the server listens on
+    port : int
+        port the server listens on, a free port is picked if it is 0
+
+    Methods
+    -------
+    start():
+        Start serving in a background thread
+    stop():
+        Shut down the server
+    """
+
+    def __init__(self, page: str, host: str = "127.0.0.1", port: int = 0):
+        self.page = page
+        self.host = host
+        self.port = port
+        self._server = None
+        self._server_thread = None
+
+    @property
+    def url(self) -> str:
+        """Url of the stand-in stock screener page."""
+        return f"http://{self.host}:{self.port}{SCREENER_PATH}"
+
+    def start(self):
+        """Start serving in a background thread."""
+        page_bytes = self.page.encode("utf-8")
+
+        class _StandInRequestHandler(BaseHTTPRequestHandler):
+            """Serve the stand-in page without logging each request to the console."""
+
+            def do_GET(self):  # noqa: N802
+                """Send the stand-in page, or 404 for any other path."""
+                if self.path.split("?")[0] != SCREENER_PATH:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(page_bytes)))
+                self.end_headers()
+                self.wfile.write(page_bytes)
+
+            def log_message(self, format, *args):
+                """Do not log the requests."""
+
+        self._server = ThreadingHTTPServer((self.host, self.port), _StandInRequestHandler)
+        self.port = self._server.server_port
+        self._server_thread = threading.Thread(
+            target=self._server.serve_forever, name="standin-server", daemon=True
+        )
+        self._server_thread.start()
+
+    def stop(self):
+        """Shut down the server."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server_thread.join()
+        self._server = None
+
+    def __enter__(self):
+        """Start the server."""
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        """Shut down the server."""
+        self.stop()
+
+
+def _to_script_literal(value) -> str:
+    """Convert a value to a JavaScript literal which can be embedded in a script tag."""
+    return json.dumps(value, separators=(",", ":")).replace("</", "<\\/")
+
+
+def add_grid_arguments(parser: argparse.ArgumentParser):
+    """Add the arguments of the stand-in grid (size, data and latencies) to a parser."""
+    parser.add_argument(
+        "--rows-per-page",
+        type=int,
+        default=20,
+        help="Number of rows shown on a page of the stand-in grid"
+    )
+    parser.add_argument(
+        "--render-delay-ms",
+        type=float,
+        default=0,
+        help="Milliseconds waited by the stand-in grid before it is re-rendered"
+    )
+    parser.add_argument(
+        "--render-jitter-ms",
+        type=float,
+        default=0,
+        help="Maximum of the random milliseconds added to each render delay"
+    )
+    parser.add_argument(
+        "--slow-page-ratio",
+        type=float,
+        default=0,
+        help="Ratio of the pages which are slow to be rendered, e.g., 0.01"
+    )
+    parser.add_argument(
+        "--slow-page-delay-ms",
+        type=float,
+        default=0,
+        help="Milliseconds added to the render delay of the slow pages"
+    )
+    parser.add_argument(
+        "--ground-truth",
+        dest="ground_truth_file",
+        type=str,
+        help="Path to ground_truth.xlsx whose companies are used as the first rows of the "
+             "stand-in grid"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed of the synthetic values, the render jitter and the slow pages"
+    )
+
+
+def get_grid_config_from_args(args) -> dict:
+    """Get the configuration of the stand-in grid from the arguments, see add_grid_arguments."""
+    return get_grid_config(
+        rows_per_page=args.rows_per_page,
+        render_delay_ms=args.render_delay_ms,
+        render_jitter_ms=args.render_jitter_ms,
+        slow_page_ratio=args.slow_page_ratio,
+        slow_page_delay_ms=args.slow_page_delay_ms,
+        seed=args.seed,
+    )
+
+
+def main():
+    """Serve a stand-in of the stock screener until interrupted."""
+    parser = argparse.ArgumentParser(
+        description="Serve a local stand-in of the stock screener of macro-trends.net"
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=5000,
+        help="Number of rows of the stand-in grid"
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=8000,
+        help="Port the server listens on"
+    )
+    add_grid_arguments(parser)
+    args = parser.parse_args()
+
+    base_records = None
+    if args.ground_truth_file:
+        base_records = load_ground_truth_records(args.ground_truth_file)
+    records = generate_records(args.rows, seed=args.seed, base_records=base_records)
+    with StandInServer(
+        render_standin_page(records, get_grid_config_from_args(args)), port=args.port
+    ) as server:
+        print(f"Stand-in stock screener is served at {server.url}, press Ctrl+C to stop")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 import csv
+import json
 from copy import deepcopy
 from typing import Any
 import os
@@ -20,8 +21,13 @@ class DataRecorder():
     tickers_in_file : list
         Tickers already contained in the csv file. It is stored as a state to
         reduce I/O operations on the csv file.
+    saves_are_durable : bool
+        whether the saved data is on the disk as soon as save_to_csv returns.
+        Recorders keeping the data in memory until flush set it to False.
     """
 
+    saves_are_durable = True
+
     def __init__(self, csv_file_name: str):
         self.csv_file_name = csv_file_name \
             if csv_file_name.endswith(".csv") else csv_file_name + ".csv"
@@ -149,6 +155,14 @@ class DataRecorder():
             data_for_new_tickers,
         )
 
+    def flush(self):
+        """Write the recorded data to the csv file.
+
+        Every call of save_to_csv already writes to the csv file, so there is
+        nothing left to be written. Recorders keeping the data in memory write
+        it to the file here.
+        """
+
     @staticmethod
     def _update_existing_rows(
         csv_file,
@@ -249,6 +263,272 @@ class DataRecorder():
         return column_names_input_data
 
 
+class IndexedDataRecorder(DataRecorder):
+    """Keeps the recorded data in memory and writes it to a CSV file only on flush.
+
+    Rows are indexed by their tickers and the values are stored column by
+    column, so saving a page costs as much as the number of rows on the page
+    rather than the size of the file. Data is written to the file when flush is
+    called, or every checkpoint_every saves if it is provided.
+
+    Attributes
+    ----------
+    csv_file_name : str
+        path to the csv file where the data will be stored.
+    checkpoint_every : int
+        number of saves after which the data is flushed to the csv file. If
+        None, the data is flushed only when flush is called.
+    headers_in_file : list
+        headers of the recorded data, in the order they are written.
+    """
+
+    saves_are_durable = False
+
+    def __init__(self, csv_file_name: str, checkpoint_every: int = None):
+        super().__init__(csv_file_name)
+        self.checkpoint_every = checkpoint_every
+        self._row_index = None  # ticker -> position of the row in the columns
+        self._columns = {}  # header -> values of the column
+        self._num_of_rows = 0
+        self._num_of_saves_since_flush = 0
+
+    def save_to_csv(self, scrapped_data: dict[str:dict[str:Any]], ticker_column_str: str = None):
+        """Upsert scrapped data into the memory, flush it to the csv file at checkpoints.
+
+        Parameters
+        ----------
+        scrapped_data : dict
+            dictionary where keys are tickers, values are another dictionary
+            with key contain the name of the scrapped parameter and the value
+            containing the value of the scrapped parameter. Example is
+            scrapped_data = {"AAPL": {"MarketCap":100}}
+
+        ticker_column_str : str
+            String of the column where the ticker values are stored in the csv
+            file. It must be one of the values in the first row, if csv file exists.
+        """
+        if ticker_column_str is None:
+            ticker_column_str = "Ticker"
+
+        self._upsert(scrapped_data, ticker_column_str)
+
+        self._num_of_saves_since_flush += 1
+        if self.checkpoint_every is not None \
+                and self._num_of_saves_since_flush >= self.checkpoint_every:
+            self.flush()
+
+    def _upsert(self, scrapped_data: dict[str:dict[str:Any]], ticker_column_str: str):
+        """Update the rows of the existing tickers and append rows for the new ones."""
+        if self._row_index is None:
+            self._load_csv(ticker_column_str)
+
+        self.headers_in_file = _merge_unique_with_order(
+            self.headers_in_file,
+            self._extract_parameter_names_from_scrap_data(scrapped_data, ticker_column_str)
+        )
+
+        ticker_column = self._get_column(ticker_column_str)
+        for ticker, company_data_scrapped in scrapped_data.items():
+            row_position = self._row_index.get(ticker)
+            if row_position is None:
+                row_position = self._append_empty_row()
+                self._row_index[ticker] = row_position
+                ticker_column[row_position] = ticker
+            for header, value in company_data_scrapped.items():
+                self._get_column(header)[row_position] = value
+
+    def flush(self):
+        """Write the recorded data to the csv file.
+
+        The file is written to a temporary file first and then replaced, so an
+        interrupted flush does not corrupt the existing csv file.
+        """
+        if self._row_index is None:
+            return  # nothing is recorded yet
+
+        temp_file = self.csv_file_name + ".temp"
+        columns = [self._get_column(header) for header in self.headers_in_file]
+        with open(temp_file, "w", newline="") as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(self.headers_in_file)
+            writer.writerows(zip(*columns))
+        os.replace(temp_file, self.csv_file_name)
+        self._num_of_saves_since_flush = 0
+
+    def _load_csv(self, ticker_column_str: str):
+        """Read the existing csv file (if any) into the memory."""
+        self._row_index = {}
+        if not self._is_file_exist:
+            self.headers_in_file = [ticker_column_str]
+            return
+
+        with open(self.csv_file_name, "r", newline="") as csvfile:
+            reader = csv.reader(csvfile)
+            self.headers_in_file = next(reader)
+            assert ticker_column_str in self.headers_in_file, \
+                f"Ticker column provided (={ticker_column_str}) " \
+                "does not exist in the first row of the existing CSV file. " \
+                f"Headers in the file are: ({self.headers_in_file})"
+
+            columns = [self._get_column(header) for header in self.headers_in_file]
+            ticker_column_index = self.headers_in_file.index(ticker_column_str)
+            for row in reader:
+                row_position = self._append_empty_row()
+                self._row_index[row[ticker_column_index]] = row_position
+                for column, value in zip(columns, row):
+                    column[row_position] = value
+
+    def _get_column(self, header: str) -> list:
+        """Get the values of a column, create an empty column if it does not exist."""
+        column = self._columns.get(header)
+        if column is None:
+            column = [""] * self._num_of_rows
+            self._columns[header] = column
+        return column
+
+    def _append_empty_row(self) -> int:
+        """Append an empty row to all columns and return its position."""
+        for column in self._columns.values():
+            column.append("")
+        self._num_of_rows += 1
+        return self._num_of_rows - 1
+
+
+class JournalDataRecorder(IndexedDataRecorder):
+    """Appends each save to a journal file and compacts the journal into the CSV file.
+
+    Every call of save_to_csv appends a single line to the journal file (i.e.,
+    csv_file_name + ".journal"), hence the cost of a save does not grow with
+    the size of the CSV file. Data is also kept in memory as in
+    IndexedDataRecorder, and written to the CSV file every checkpoint_every
+    saves and on flush, after which the journal is emptied. If the scrapping
+    is terminated unexpectedly, the journal is replayed on top of the CSV file
+    the next time a recorder targets the same file.
+
+    Attributes
+    ----------
+    csv_file_name : str
+        path to the csv file where the data will be stored.
+    journal_file_name : str
+        path to the journal file.
+    checkpoint_every : int
+        number of saves after which the journal is compacted into the csv file.
+    fsync : bool
+        whether each journal record is forced to the disk. It protects against
+        power losses, in addition to the crashes of the process.
+    """
+
+    saves_are_durable = True  # every save is appended to the journal
+
+    def __init__(self, csv_file_name: str, checkpoint_every: int = 100, fsync: bool = False):
+        super().__init__(csv_file_name, checkpoint_every=checkpoint_every)
+        self.journal_file_name = self.csv_file_name + ".journal"
+        self.fsync = fsync
+        self._journal_file = None
+
+    def __del__(self):
+        """Close the journal file."""
+        # Attribute is missing if __init__ has failed
+        journal_file = getattr(self, "_journal_file", None)
+        if journal_file is not None:
+            journal_file.close()
+
+    def save_to_csv(self, scrapped_data: dict[str:dict[str:Any]], ticker_column_str: str = None):
+        """Append scrapped data to the journal, compact the journal at checkpoints.
+
+        Parameters
+        ----------
+        scrapped_data : dict
+            dictionary where keys are tickers, values are another dictionary
+            with key contain the name of the scrapped parameter and the value
+            containing the value of the scrapped parameter. Example is
+            scrapped_data = {"AAPL": {"MarketCap":100}}
+
+        ticker_column_str : str
+            String of the column where the ticker values are stored in the csv
+            file. It must be one of the values in the first row, if csv file exists.
+        """
+        if ticker_column_str is None:
+            ticker_column_str = "Ticker"
+
+        if self._row_index is None:
+            # Replay the journal left by a previous run before appending to it
+            self._load_csv(ticker_column_str)
+
+        if self._journal_file is None:
+            self._journal_file = self._open_journal()
+        record = {"ticker_column": ticker_column_str, "data": scrapped_data}
+        self._journal_file.write(json.dumps(record, default=str) + "\n")
+        self._journal_file.flush()
+        if self.fsync:
+            os.fsync(self._journal_file.fileno())
+
+        super().save_to_csv(scrapped_data, ticker_column_str)
+
+    def flush(self):
+        """Compact the journal into the csv file.
+
+        CSV file is replaced before the journal is emptied. If the process
+        stops in between, replaying the journal again is harmless since
+        replaying a record overwrites the same values.
+        """
+        if self._row_index is None:
+            ticker_column_str = self._read_ticker_column_from_journal()
+            if ticker_column_str is None:
+                return  # nothing is recorded and no journal is left
+            self._load_csv(ticker_column_str)
+
+        super().flush()
+
+        if self._journal_file is not None:
+            self._journal_file.close()
+            self._journal_file = None
+        if os.path.exists(self.journal_file_name):
+            os.remove(self.journal_file_name)
+
+    def _load_csv(self, ticker_column_str: str):
+        """Read the existing csv file (if any) and replay the journal on top of it."""
+        super()._load_csv(ticker_column_str)
+        for record in self._read_journal():
+            self._upsert(record["data"], record["ticker_column"])
+
+    def _open_journal(self):
+        """Open the journal to append records, each record starting on a new line.
+
+        Last byte of the journal is checked in binary mode, since the offsets
+        of a file opened in text mode are not byte offsets.
+        """
+        with open(self.journal_file_name, "ab+") as journal_file:
+            if journal_file.tell() > 0:
+                journal_file.seek(-1, os.SEEK_END)
+                if journal_file.read(1) != b"\n":
+                    # Previous run has stopped while a record was being written
+                    journal_file.write(b"\n")
+        return open(self.journal_file_name, "a", encoding="utf-8")
+
+    def _read_journal(self) -> "list[dict]":
+        """Read the records of the journal, partially written records are dropped."""
+        if not os.path.exists(self.journal_file_name):
+            return []
+
+        records = []
+        # A partially written character is decoded as a replacement character
+        with open(
+            self.journal_file_name, "r", encoding="utf-8", errors="replace"
+        ) as journal_file:
+            for line in journal_file:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue  # process has stopped while the record was being written
+        return records
+
+    def _read_ticker_column_from_journal(self):
+        """Get the ticker column of the first journal record, None if there is no record."""
+        records = self._read_journal()
+        return records[0]["ticker_column"] if records else None
+
+
 def _put_as_first_element(input_list: list, value):
     """Put the value in the list as the first element, if the value exist in the list.
 
@@ -0,0 +1,118 @@
+try:
+    from lxml import etree
+except ImportError:  # lxml is only required to parse the html of the grid
+    etree = None
+
+# Html of the grid is the outerHTML of the element whose id is "jqxGrid" (see
+# GRID_HTML_SCRIPT). It has the row/column structure the XPaths of
+# scrape_plan rely on: "row{i}jqxGrid" rows whose first cell holds the company
+# name, second cell holds the ticker and the remaining cells hold the columns
+# of the active tab, and the pager whose div/div[6] is "first-last of total".
+
+if etree is not None:
+    # Selectors are compiled once, they are evaluated on every page and tab.
+    # Elements are looked up by their ids instead of searching the whole tree.
+    _ROWS = etree.XPath("id($row_ids)")
+    _PAGER_TEXT = etree.XPath("id('pagerjqxGrid')/div/div[6]")
+
+
+def parse_grid_html(grid_html: str):
+    """Parse the html of the grid into an element tree.
+
+    Raises
+    ------
+    ImportError
+        if lxml is not installed
+    """
+    if etree is None:
+        raise ImportError(
+            "lxml is required to parse the html of the grid, install it by: pip install lxml"
+        )
+    return etree.HTML(grid_html)
+
+
+def parse_row_matrix(grid_html: str, num_of_rows: int = None) -> "list[list[str]]":
+    """Read the visible rows of the grid from its html.
+
+    Parameters
+    ----------
+    grid_html : str
+        html of the grid, see GRID_HTML_SCRIPT
+    num_of_rows : int
+        number of rows shown on the page, read from the pager if it is None
+
+    Returns
+    -------
+    row_matrix : list[list[str]]
+        one list per row in the form of [ticker, name, column1, column2, ...],
+        the same form SCRAP_VISIBLE_ROWS_SCRIPT returns
+    """
+    grid_tree = parse_grid_html(grid_html)
+    if num_of_rows is None:
+        (first_row, last_row, _) = _read_pager(grid_tree)
+        num_of_rows = last_row - first_row + 1
+
+    row_matrix = []
+    row_ids = " ".join(f"row{row_index}jqxGrid" for row_index in range(num_of_rows))
+    for row in _ROWS(grid_tree, row_ids=row_ids):
+        # Cells are read by the paths of the XPaths of scrape_plan, i.e.,
+        # div[1]/div/div/a is the name, div[2]/div is the ticker and
+        # div[2 + column_index]/div is a column of the tab. This runs for
+        # every cell, hence the children are iterated without XPaths.
+        cells = [cell for cell in row if cell.tag == "div"]
+        if not cells:
+            row_matrix.append(["", ""])
+            continue
+        name_link = _first_child(_first_child(_first_child(cells[0], "div"), "div"), "a")
+        row_values = [_cell_text(cell) for cell in cells[1:]] or [""]
+        row_values.insert(1, "" if name_link is None else _text(name_link))
+        row_matrix.append(row_values)
+    return row_matrix
+
+
+def parse_pager(grid_html: str) -> "tuple[int, int, int]":
+    """Read the first row number, the last row number and the total number of rows.
+
+    Parameters
+    ----------
+    grid_html : str
+        html of the grid, see GRID_HTML_SCRIPT
+
+    Returns
+    -------
+    pager : tuple[int, int, int]
+        numbers shown by the pager, e.g., (21, 40, 6321) for "21-40 of 6321"
+    """
+    return _read_pager(parse_grid_html(grid_html))
+
+
+def _read_pager(grid_tree) -> "tuple[int, int, int]":
+    """Read the numbers shown by the pager of a parsed grid, see parse_pager."""
+    pager_text = _text(_PAGER_TEXT(grid_tree)[0])
+    (first_and_last, _, total) = pager_text.split(" ")
+    (first, last) = first_and_last.split("-")
+    return int(first), int(last), int(total)
+
+
+def _cell_text(cell) -> str:
+    """Get the text of the first element of a cell, as read by the XPath "div[k]/div"."""
+    child = _first_child(cell, "div")
+    return "" if child is None else _text(child)
+
+
+def _first_child(element, tag: str):
+    """Get the first child of an element with the tag, None if there is none."""
+    if element is None or len(element) == 0:
+        return None
+    if element[0].tag == tag:
+        return element[0]  # iterating over the children is slower
+    return next(element.iterchildren(tag), None)
+
+
+def _text(element) -> str:
+    """Get the rendered text of an element, its whitespace is collapsed as the WebDriver does."""
+    if len(element) == 0:
+        text = element.text or ""  # most cells hold only text
+    else:
+        text = "".join(element.itertext())
+    return " ".join(text.split())
@@ -0,0 +1,140 @@
+import datetime
+import gzip
+import json
+import os
+import re
+
+# Snapshots are the html of the grid (see GRID_HTML_SCRIPT) recorded for each
+# (page, tab) visited by TableScrapper, one gzip file per snapshot. Pages are
+# identified by the number of their first row, e.g., the snapshot of the
+# "descriptive" tab of the second page of 20 rows is "row21_descriptive.html.gz".
+# Manifest of the snapshots lists the parameters they are recorded for.
+
+SNAPSHOT_FILE_PATTERN = re.compile(r"row(\d+)_(\w+)\.html\.gz")
+MANIFEST_FILE_NAME = "snapshots.json"
+
+
+class GridSnapshotRecorder:
+    """Writes the html of the grid for each visited (page, tab) as a compressed snapshot.
+
+    Snapshots can be scrapped again without a browser, e.g., for parameters
+    which were not scrapped while they were recorded but are shown on the
+    recorded tabs, see SnapshotReplayer. Snapshots of different pages are
+    written to different files, hence a recorder can be shared by workers.
+
+    Attributes
+    ----------
+    snapshot_dir : str
+        directory of the snapshots
+    scrap_params : list[str]
+        parameters scrapped while the snapshots are recorded, written to the
+        manifest
+    compress_level : int
+        gzip compression level of the snapshots
+
+    Methods
+    -------
+    save(first_row, tab_name, grid_html):
+        Write the snapshot of a tab of a page
+    save_manifest(url):
+        Write the manifest of the snapshots
+    """
+
+    def __init__(
+        self,
+        snapshot_dir: str,
+        scrap_params: list[str],
+        clear: bool = True,
+        compress_level: int = 6,
+    ):
+        """Create the snapshot directory.
+
+        Parameters
+        ----------
+        snapshot_dir : str
+            directory of the snapshots, created if it does not exist
+        scrap_params : list[str]
+            parameters scrapped while the snapshots are recorded
+        clear : bool
+            if True, snapshots recorded before (e.g., of a larger table) are
+            removed. They should be kept when a terminated scrapping is resumed.
+        compress_level : int
+            gzip compression level of the snapshots
+        """
+        self.snapshot_dir = snapshot_dir
+        self.scrap_params = list(scrap_params)
+        self.compress_level = compress_level
+        os.makedirs(snapshot_dir, exist_ok=True)
+        if clear:
+            for snapshot_file in list_snapshot_files(snapshot_dir).values():
+                for snapshot_file_name in snapshot_file.values():
+                    os.remove(snapshot_file_name)
+
+    def save(self, first_row: int, tab_name: str, grid_html: str):
+        """Write the snapshot of a tab of a page.
+
+        Parameters
+        ----------
+        first_row : int
+            number of the first row of the page, as shown by the pager
+        tab_name : str
+            name of the active tab
+        grid_html : str
+            html of the grid, see GRID_HTML_SCRIPT
+        """
+        snapshot_file_name = os.path.join(self.snapshot_dir, f"row{first_row}_{tab_name}.html.gz")
+        with open(snapshot_file_name, "wb") as snapshot_file:
+            snapshot_file.write(
+                gzip.compress(grid_html.encode("utf-8"), compresslevel=self.compress_level)
+            )
+
+    def save_manifest(self, url: str = None):
+        """Write the manifest of the snapshots, i.e., the scrapped parameters and the url."""
+        manifest = {
+            "scrap_params": self.scrap_params,
+            "url": url,
+            "recorded_at": datetime.datetime.now().isoformat(timespec="seconds"),
+        }
+        with open(os.path.join(self.snapshot_dir, MANIFEST_FILE_NAME), "w") as manifest_file:
+            json.dump(manifest, manifest_file, indent=4)
+
+
+def list_snapshot_files(snapshot_dir: str) -> "dict[int, dict[str, str]]":
+    """List the snapshot files of the pages.
+
+    Parameters
+    ----------
+    snapshot_dir : str
+        directory of the snapshots
+
+    Returns
+    -------
+    snapshot_files : dict[int, dict[str, str]]
+        paths to the snapshots of each tab, by the first row numbers of the
+        pages in increasing order
+    """
+    snapshot_files = {}
+    if not os.path.isdir(snapshot_dir):
+        return snapshot_files
+    for file_name in os.listdir(snapshot_dir):
+        match = SNAPSHOT_FILE_PATTERN.fullmatch(file_name)
+        if match:
+            snapshot_files.setdefault(int(match.group(1)), {})[match.group(2)] = os.path.join(
+                snapshot_dir, file_name
+            )
+    return dict(sorted(snapshot_files.items()))
+
+
+def read_snapshot(snapshot_file_name: str) -> str:
+    """Read the html of the grid from a snapshot file."""
+    with open(snapshot_file_name, "rb") as snapshot_file:
+        return gzip.decompress(snapshot_file.read()).decode("utf-8")
+
+
+def read_manifest(snapshot_dir: str):
+    """Read the manifest of the snapshots, None if it does not exist."""
+    manifest_file_name = os.path.join(snapshot_dir, MANIFEST_FILE_NAME)
+    if not os.path.exists(manifest_file_name):
+        return None
+    with open(manifest_file_name, "r") as manifest_file:
+        return json.load(manifest_file)
@@ -0,0 +1,217 @@
+import json
+import re
+
+import urllib3
+
+from macrotrends_data_scrapper.data_recorder import DataRecorder
+from macrotrends_data_scrapper.gui_scrap_the_table import TableScrapperGUI
+from macrotrends_data_scrapper.map_of_datafields import (
+    MAP_OF_DATAFIELDS,
+    NAME_DATAFIELD,
+    TICKER_DATAFIELD,
+)
+from macrotrends_data_scrapper.screener_filters import filter_records
+from macrotrends_data_scrapper.utils.Logger import Logger
+
+
+class HttpTableScrapper:
+    """
+    Class to be used to scrap the table data in macro-trends without a browser.
+
+    The stock screener page embeds the whole table as a JSON array which the
+    grid is bound to. This class fetches the page over a pooled, keep-alive
+    HTTP connection and parses that array directly, hence no WebDriver is
+    launched and no JavaScript is rendered. Scrapped values are the raw values
+    of the data source (e.g., 2910000.0 instead of "$2.91T").
+
+    Attributes
+    ----------
+    url : str
+        url of the stock screener page
+    http : urllib3.PoolManager
+        connection pool reused for every request of the scrapper
+
+    Methods
+    -------
+    scrap_the_table():
+        scrap the whole table and save it to a csv file
+
+    close():
+        close the pooled connections
+    """
+
+    payload_pattern = re.compile(r"var\s+originalData\s*=\s*(\[.*?\]);", re.DOTALL)
+
+    user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36' \
+                 ' (KHTML, like Gecko) Chrome/83.0.4103.116 Safari/537.36'
+
+    def __init__(
+        self,
+        str_logger="info",
+        url="https://www.macrotrends.net/stocks/stock-screener",
+        pool_maxsize=1,
+        timeout=30.0,
+    ):
+        """
+        Construct instant variables.
+
+        Parameters
+        ----------
+        str_logger : str
+            the functionality string of the logger object
+        url : str
+            url of the stock screener page
+        pool_maxsize : int
+            number of connections kept alive per host
+        timeout : float
+            timeout of a request in seconds
+        """
+        self.url = url
+        self.logger = Logger(self.__class__.__name__, str_logger)
+        self.http = urllib3.PoolManager(
+            maxsize=pool_maxsize,
+            headers={"User-Agent": self.user_agent},
+            timeout=urllib3.Timeout(total=timeout),
+            retries=urllib3.Retry(total=3, backoff_factor=0.5),
+        )
+
+    def __del__(self):
+        """Close the pooled connections."""
+        if hasattr(self, "http"):
+            self.close()
+
+    def close(self):
+        """Close the pooled connections."""
+        self.http.clear()
+
+    def scrap_the_table(
+        self, parameters_to_be_scrapped=None,
+        csv_file: str = "result.csv",
+        ticker_column_str: str = "Ticker",
+        filters: dict = None
+    ):
+        """Scrap the whole table in macro-trend and save it to a csv file.
+
+        Parameters
+        ----------
+        parameters_to_be_scrapped : list[str]
+            user inputted list of parameters to be scrapper
+        csv_file : str
+            name of the file of data to be recorded.
+        ticker_column_str: str
+            name of the Ticker column
+        filters : dict
+            if provided, only the companies satisfying the filters (see
+            screener_filters) are saved
+        """
+        if parameters_to_be_scrapped is None:
+            # Call GUI to interact with the user
+            gui = TableScrapperGUI()
+            parameters_to_be_scrapped = gui.run_gui()  # Get desired params from user
+
+        self.logger.info(f"Search Params = {parameters_to_be_scrapped}...")
+        self.logger.info("SCRAPPING STARTED...")
+
+        company_attr_dict = self.scrap_records(parameters_to_be_scrapped, filters)
+
+        data_recorder = DataRecorder(csv_file_name=csv_file)
+        data_recorder.save_to_csv(
+            scrapped_data=company_attr_dict,
+            ticker_column_str=ticker_column_str
+        )
+
+        self.logger.info("SCRAPPING IS DONE!!!")
+        self.logger.info(f"SCRAPPED DATA: {parameters_to_be_scrapped} ")
+
+    def scrap_records(self, parameters_to_be_scrapped: list[str], filters: dict = None) -> dict:
+        """Fetch the table and return the scrapped parameters per company ticker.
+
+        Parameters
+        ----------
+        parameters_to_be_scrapped : list[str]
+            list of parameters to be scrapped, see MAP_OF_DATAFIELDS
+        filters : dict
+            if provided, only the companies satisfying the filters (see
+            screener_filters) are returned
+
+        Returns
+        -------
+        company_attr_dict : dict(dict)
+            dictionary of the companies associated with their scrapped
+            parameters, e.g., {"AAPL": {"name": "Apple Inc", "Market Cap": ...}}
+        """
+        unknown_params = [
+            param for param in parameters_to_be_scrapped if param not in MAP_OF_DATAFIELDS
+        ]
+        if unknown_params:
+            raise KeyError(f"No datafield is known for the parameters: {unknown_params}")
+
+        records = self._parse_payload(self._fetch_page())
+        self.logger.debug(f"{len(records)} records are fetched from {self.url}")
+        if filters:
+            records = filter_records(records, filters)
+            self.logger.debug(f"{len(records)} records satisfy the filters")
+        return self._convert_records(records, parameters_to_be_scrapped)
+
+    def _fetch_page(self) -> str:
+        """Download the stock screener page through the connection pool."""
+        response = self.http.request("GET", self.url)
+        if response.status != 200:
+            raise ConnectionError(
+                f"Request to {self.url} failed with status code {response.status}"
+            )
+        return response.data.decode("utf-8")
+
+    @classmethod
+    def _parse_payload(cls, page: str) -> "list[dict]":
+        """Extract the records of the table embedded in the page.
+
+        Parameters
+        ----------
+        page : str
+            html of the stock screener page
+
+        Returns
+        -------
+        records : list[dict]
+            records of the client-side data source of the grid
+        """
+        match = cls.payload_pattern.search(page)
+        if match is None:
+            raise ValueError("Table data could not be found in the fetched page")
+        return json.loads(match.group(1))
+
+    @staticmethod
+    def _convert_records(records: "list[dict]", parameters_to_be_scrapped: list[str]) -> dict:
+        """Convert records of the data source into per-ticker dictionaries.
+
+        Parameters
+        ----------
+        records : list[dict]
+            records of the client-side data source of the grid
+        parameters_to_be_scrapped : list[str]
+            list of parameters to be scrapped, see MAP_OF_DATAFIELDS
+
+        Returns
+        -------
+        company_attr_dict : dict(dict)
+            dictionary of the companies associated with their scrapped parameters
+        """
+        company_attr_dict = {}
+        for record in records:
+            company_attr = {"name": record.get(NAME_DATAFIELD, "")}
+            for param in parameters_to_be_scrapped:
+                value = record.get(MAP_OF_DATAFIELDS[param])
+                company_attr[param] = "" if value is None else value
+            company_attr_dict[record[TICKER_DATAFIELD]] = company_attr
+        return company_attr_dict
+
+
+def main():
+    """Run the HttpTableScrapper."""
+    scrapper = HttpTableScrapper()
+    scrapper.scrap_the_table(csv_file="Output.csv", ticker_column_str="Ticker")
+
+
+if __name__ == "__main__":
+    main()
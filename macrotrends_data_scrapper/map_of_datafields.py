@@ -0,0 +1,64 @@
+# Names of the fields in the client-side data source of the stock screener
+# (i.e., the records the jqxGrid is bound to). Keys are the parameter names used
+# in MAP_OF_HEADERS, values are the field names of the records. The fields
+# bound to the columns of the grid can be listed in the browser console by
+# $('#jqxGrid').jqxGrid('columns').records.map(c => c.datafield)
+
+TICKER_DATAFIELD = "ticker"
+NAME_DATAFIELD = "comp_name"
+
+MAP_OF_DATAFIELDS = {
+    "Industry": "zacks_m_ind_desc",
+    "Market Cap": "market_val",
+    "Closing Price": "close_price",
+    "1 Year % Change": "price_change_52_week",
+    "P/E Ratio": "pe_ratio",
+    "Dividend Yield": "div_yield",
+
+    "Exchange": "exchange",
+    "Country": "country_code",
+    "Sector": "zacks_x_sector_desc",
+
+    "12 Month Dividend": "div_12_months",
+    "12 Month EPS": "eps_12_months",
+    "Dividend Payout Ratio": "div_payout_ratio",
+
+    "1 Week % Change": "price_change_1_week",
+    "1 Month % Change": "price_change_4_week",
+    "3 Month % Change": "price_change_13_week",
+    "6 Month % Change": "price_change_26_week",
+    "YTD % Change": "price_change_ytd",
+    "Price vs 50D SMA": "price_vs_50_day_sma",
+    "Price vs 200D SMA": "price_vs_200_day_sma",
+
+    "3 Year CAGR %": "cagr_3_year",
+    "5 Year CAGR %": "cagr_5_year",
+    "10 Year CAGR %": "cagr_10_year",
+    "20 Year CAGR %": "cagr_20_year",
+    "30 Year CAGR %": "cagr_30_year",
+    "40 Year CAGR %": "cagr_40_year",
+    "50 Year CAGR %": "cagr_50_year",
+
+    "Price/Earnings Ratio": "pe_ratio_12_months",
+    "PEG Ratio": "peg_ratio",
+    "Price/Sales Ratio": "ps_ratio",
+    "Operating Margin": "operating_margin",
+    "Pre-Tax Margin": "pretax_margin",
+    "Net Margin": "net_margin",
+
+    "Price/Book Ratio": "pb_ratio",
+    r"Price/Cash\ Ratio": "pc_ratio",
+    "Return on Equity": "roe",
+    "Return on Assets": "roa",
+    "Inventory Turnover": "inventory_turnover",
+    "Current Ratio": "current_ratio",
+    "Quick Ratio": "quick_ratio",
+    "Debt/Equity Ratio": "debt_to_equity",
+
+    "12 Month Sales Growth": "sales_growth_12_months",
+    "5 Year\nSales Growth": "sales_growth_5_year",
+    "12 Month\nEPS Growth": "eps_growth_12_months",
+    "5 Year\nEPS Growth": "eps_growth_5_year",
+    "Last Quarter\nEPS Surprise %": "eps_surprise_last_quarter",
+    "Estimated EPS\nGrowth Next Year": "eps_growth_next_year",
+}
@@ -0,0 +1,63 @@
+# Types of the values shown in the columns of the stock screener. Keys are the
+# parameter names used in MAP_OF_HEADERS, values are one of:
+#   "text"    : kept as it is, e.g., "Computer Hardware"
+#   "money"   : US dollars, possibly with a magnitude suffix, e.g., "$2.91T"
+#   "percent" : percentage points, e.g., "12.4%" is parsed as 12.4
+#   "number"  : plain number, e.g., "28.35"
+# Parameters missing in this map (e.g., the company name) are kept as text.
+
+MAP_OF_VALUE_TYPES = {
+    "Industry": "text",
+    "Market Cap": "money",
+    "Closing Price": "money",
+    "1 Year % Change": "percent",
+    "P/E Ratio": "number",
+    "Dividend Yield": "percent",
+
+    "Exchange": "text",
+    "Country": "text",
+    "Sector": "text",
+
+    "12 Month Dividend": "money",
+    "12 Month EPS": "money",
+    "Dividend Payout Ratio": "percent",
+
+    "1 Week % Change": "percent",
+    "1 Month % Change": "percent",
+    "3 Month % Change": "percent",
+    "6 Month % Change": "percent",
+    "YTD % Change": "percent",
+    "Price vs 50D SMA": "percent",
+    "Price vs 200D SMA": "percent",
+
+    "3 Year CAGR %": "percent",
+    "5 Year CAGR %": "percent",
+    "10 Year CAGR %": "percent",
+    "20 Year CAGR %": "percent",
+    "30 Year CAGR %": "percent",
+    "40 Year CAGR %": "percent",
+    "50 Year CAGR %": "percent",
+
+    "Price/Earnings Ratio": "number",
+    "PEG Ratio": "number",
+    "Price/Sales Ratio": "number",
+    "Operating Margin": "percent",
+    "Pre-Tax Margin": "percent",
+    "Net Margin": "percent",
+
+    "Price/Book Ratio": "number",
+    r"Price/Cash\ Ratio": "number",
+    "Return on Equity": "percent",
+    "Return on Assets": "percent",
+    "Inventory Turnover": "number",
+    "Current Ratio": "number",
+    "Quick Ratio": "number",
+    "Debt/Equity Ratio": "number",
+
+    "12 Month Sales Growth": "percent",
+    "5 Year\nSales Growth": "percent",
+    "12 Month\nEPS Growth": "percent",
+    "5 Year\nEPS Growth": "percent",
+    "Last Quarter\nEPS Surprise %": "percent",
+    "Estimated EPS\nGrowth Next Year": "percent",
+}
@@ -0,0 +1,133 @@
+import os
+from typing import Any
+
+from macrotrends_data_scrapper.map_of_value_types import MAP_OF_VALUE_TYPES
+from macrotrends_data_scrapper.value_parser import NUMERIC_VALUE_TYPES
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is only required for the parquet output
+    pa = None
+    pq = None
+
+
+class ParquetDataRecorder:
+    """Writes the scrapped data to a columnar Parquet file, one row group per saved page.
+
+    Columns of the file are the ones of the first saved page. Their types are
+    set by the types of the parameters (see MAP_OF_VALUE_TYPES) rather than
+    inferred from the first page, whose values of a column may all be missing:
+    if the values are parsed (see ValueParsingRecorder), the numeric
+    parameters are stored as float64 columns, every other column is stored as
+    text. Unlike the CSV recorders, the file is written append-only: an
+    existing file is overwritten and companies are not merged across saves.
+    Hence, all parameters of a company should be saved together, which is the
+    case for the page by page and the "datasource" scrapping of TableScrapper.
+    File is finalized on flush.
+
+    Attributes
+    ----------
+    parquet_file_name : str
+        path to the parquet file where the data will be stored.
+    compression : str
+        compression codec of the columns, e.g., "zstd", "snappy", "gzip"
+    typed_values : bool
+        whether the values of the numeric parameters are saved as numbers,
+        i.e., parsed by ValueParsingRecorder
+    schema : pyarrow.Schema
+        schema of the file, set by the first saved page
+    saves_are_durable : bool
+        always False, the file is readable only after flush
+    """
+
+    saves_are_durable = False
+
+    def __init__(
+        self, parquet_file_name: str, compression: str = "zstd", typed_values: bool = False
+    ):
+        if pa is None:
+            raise ImportError(
+                "pyarrow is required to write parquet files, install it by: pip install pyarrow"
+            )
+        self.parquet_file_name = parquet_file_name \
+            if parquet_file_name.endswith(".parquet") \
+            else os.path.splitext(parquet_file_name)[0] + ".parquet"
+        self.compression = compression
+        self.typed_values = typed_values
+        self.schema = None
+        self._writer = None
+        self._is_finalized = False
+
+    def save_to_csv(self, scrapped_data: dict[str:dict[str:Any]], ticker_column_str: str = None):
+        """Write scrapped data as a new row group of the parquet file.
+
+        The method is named after the interface of DataRecorder, so that the
+        recorders are interchangeable in TableScrapper.scrap_the_table
+
+        Parameters
+        ----------
+        scrapped_data : dict
+            dictionary where keys are tickers, values are another dictionary
+            with key contain the name of the scrapped parameter and the value
+            containing the value of the scrapped parameter. Example is
+            scrapped_data = {"AAPL": {"MarketCap":100}}
+
+        ticker_column_str : str
+            name of the column where the ticker values are stored
+        """
+        if ticker_column_str is None:
+            ticker_column_str = "Ticker"
+
+        if self._is_finalized:
+            raise RuntimeError(f"{self.parquet_file_name} is already finalized by flush")
+
+        if self.schema is None:
+            # Ticker and name are the first two columns, the others are in the order they appear
+            column_names = list(dict.fromkeys(
+                [ticker_column_str, "name"] + [
+                    column for company_data in scrapped_data.values() for column in company_data
+                ]
+            ))
+            if not any("name" in company_data for company_data in scrapped_data.values()):
+                column_names.remove("name")
+            self.schema = pa.schema([
+                (column, self._get_column_type(column)) for column in column_names
+            ])
+        else:
+            column_names = self.schema.names
+            unknown_columns = {
+                column for company_data in scrapped_data.values() for column in company_data
+            }.difference(column_names)
+            if unknown_columns:
+                raise ValueError(
+                    f"Columns {sorted(unknown_columns)} are not in the schema of the "
+                    f"parquet file, which has the columns: {column_names}"
+                )
+
+        columns = {column: [] for column in column_names}
+        for ticker, company_data_scrapped in scrapped_data.items():
+            columns[ticker_column_str].append(ticker)
+            for column in column_names[1:]:
+                value = company_data_scrapped.get(column)
+                columns[column].append(None if value == "" else value)
+
+        table = pa.Table.from_pydict(columns, schema=self.schema)
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(
+                self.parquet_file_name, self.schema, compression=self.compression
+            )
+        self._writer.write_table(table)
+
+    def flush(self):
+        """Finalize the parquet file, no data can be saved afterwards."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            self._is_finalized = True
+
+    def _get_column_type(self, column: str):
+        """Get the type of a column by the type of its parameter, see MAP_OF_VALUE_TYPES."""
+        if self.typed_values and MAP_OF_VALUE_TYPES.get(column) in NUMERIC_VALUE_TYPES:
+            return pa.float64()
+        return pa.string()
@@ -0,0 +1,107 @@
+import queue
+import threading
+from typing import Any
+
+# Put to the queue to stop the writer thread
+_STOP_WRITING = object()
+
+
+class PipelinedDataRecorder:
+    """Wraps a data recorder such that the data is saved by a writer thread.
+
+    Saved pages are put to a bounded queue which is drained into the wrapped
+    recorder by a background thread, so the scrapper keeps driving the browser
+    while the previous pages are written to the disk. When the queue is full,
+    saving blocks until the writer catches up (i.e., backpressure), hence at
+    most max_pending_pages pages are kept in memory.
+
+    Once a page is saved, the wrapped recorder is used only by the writer
+    thread until the next flush: flush waits until all pending pages are
+    written, then the writer thread flushes the wrapped recorder and exits.
+    An error raised by the wrapped recorder is raised on the next save or
+    flush; if a page cannot be saved, the pages saved before it are still
+    flushed, but the error of the failed save is raised rather than an error
+    of that flush. TableScrapper.scrap_the_table flushes also when the
+    scrapping ends with an error or KeyboardInterrupt, so no scrapped page is
+    lost.
+
+    Attributes
+    ----------
+    data_recorder : DataRecorder
+        recorder to which the pages are saved by the writer thread
+    max_pending_pages : int
+        maximum number of pages waiting to be written
+    saves_are_durable : bool
+        always False, pages are on the disk only after flush
+    """
+
+    saves_are_durable = False
+
+    def __init__(self, data_recorder, max_pending_pages: int = 4):
+        if max_pending_pages < 1:
+            raise ValueError(f"max_pending_pages (={max_pending_pages}) must be positive")
+        self.data_recorder = data_recorder
+        self.max_pending_pages = max_pending_pages
+        self._page_queue = queue.Queue(maxsize=max_pending_pages)
+        self._writer_thread = None
+        self._writer_error = None
+
+    def save_to_csv(self, scrapped_data: dict[str:dict[str:Any]], ticker_column_str: str = None):
+        """Queue scrapped data to be saved by the writer thread.
+
+        Parameters
+        ----------
+        scrapped_data : dict
+            dictionary where keys are tickers, values are another dictionary
+            with key contain the name of the scrapped parameter and the value
+            containing the value of the scrapped parameter. It should not be
+            modified after it is saved.
+
+        ticker_column_str : str
+            name of the column where the ticker values are stored
+        """
+        self._raise_writer_error()
+        if self._writer_thread is None:
+            self._writer_thread = threading.Thread(
+                target=self._write_pages, name="data-recorder-writer", daemon=True
+            )
+            self._writer_thread.start()
+        self._page_queue.put((scrapped_data, ticker_column_str))
+
+    def flush(self):
+        """Wait until all queued pages are saved, then flush the wrapped recorder."""
+        if self._writer_thread is None:
+            self._raise_writer_error()
+            self.data_recorder.flush()  # nothing is saved since the last flush
+            return
+        # Wrapped recorder is flushed by the writer thread, see _write_pages
+        self._page_queue.put(_STOP_WRITING)
+        self._writer_thread.join()
+        self._writer_thread = None
+        self._raise_writer_error()
+
+    def _write_pages(self):
+        """Save the queued pages with the wrapped recorder until stopped, then flush it."""
+        while True:
+            page = self._page_queue.get()
+            if page is _STOP_WRITING:
+                break
+            if self._writer_error is not None:
+                continue  # keep draining, so that the scrapper is not blocked
+            try:
+                self.data_recorder.save_to_csv(*page)
+            except BaseException as error:  # re-raised in the scrapper thread
+                self._writer_error = error
+
+        # Pages saved before an error of the writer are flushed as well
+        try:
+            self.data_recorder.flush()
+        except BaseException as error:
+            if self._writer_error is None:  # error of the failed save is raised instead
+                self._writer_error = error
+
+    def _raise_writer_error(self):
+        """Raise the error of the writer thread, if any, only once."""
+        if self._writer_error is not None:
+            error, self._writer_error = self._writer_error, None
+            raise error
@@ -0,0 +1,117 @@
+import json
+import os
+
+from macrotrends_data_scrapper.map_of_headers import MAP_OF_HEADERS
+from macrotrends_data_scrapper.screener_filters import normalize_filters
+
+
+class ScrapCheckpoint:
+    """Persists the last page whose data is committed to the recorder.
+
+    Checkpoint file stores the parameters and the tabs being scrapped, the
+    filters of the companies, and the number of rows per page and in total,
+    together with the 0-based index of the last committed page. A checkpoint is
+    only resumed if it was written for the same parameters, filters and paging
+    (which determine the pages, e.g., companies are listed or delisted between
+    the runs), otherwise scrapping starts from the first page.
+
+    Attributes
+    ----------
+    checkpoint_file_name : str
+        path to the checkpoint file
+    scrap_params : list[str]
+        parameters being scrapped
+    tab_names : list[str]
+        tabs of the parameters being scrapped
+    filters : dict
+        normalized filters of the companies being scrapped, None if not filtered
+    rows_per_page : int
+        number of rows per page of the table, set by load
+    num_of_rows : int
+        number of (matching) rows of the table, set by load
+    last_committed_page : int
+        0-based index of the last committed page, None if no page is committed
+    """
+
+    def __init__(self, checkpoint_file_name: str, scrap_params: list[str], filters: dict = None):
+        self.checkpoint_file_name = checkpoint_file_name
+        self.scrap_params = sorted(scrap_params)
+        self.tab_names = sorted({list(MAP_OF_HEADERS[param].keys())[0] for param in scrap_params})
+        self.filters = normalize_filters(filters) if filters else None
+        self.rows_per_page = None
+        self.num_of_rows = None
+        self.last_committed_page = None
+
+    @property
+    def next_page(self) -> int:
+        """0-based index of the first page which is not committed yet."""
+        return 0 if self.last_committed_page is None else self.last_committed_page + 1
+
+    def load(self, rows_per_page: int, num_of_rows: int) -> bool:
+        """Load the last committed page from the checkpoint file.
+
+        Parameters
+        ----------
+        rows_per_page : int
+            number of rows per page of the table at present
+        num_of_rows : int
+            number of (matching) rows of the table at present
+
+        Returns
+        -------
+        is_loaded : bool
+            True if the checkpoint file exists and it was written for the same
+            parameters and paging, False otherwise.
+        """
+        self.rows_per_page = rows_per_page
+        self.num_of_rows = num_of_rows
+        if not os.path.exists(self.checkpoint_file_name):
+            return False
+
+        with open(self.checkpoint_file_name, "r") as checkpoint_file:
+            checkpoint = json.load(checkpoint_file)
+        if checkpoint["parameters"] != self.scrap_params \
+                or checkpoint["tab_names"] != self.tab_names \
+                or checkpoint.get("filters") != self.filters \
+                or checkpoint.get("rows_per_page") != rows_per_page \
+                or checkpoint.get("num_of_rows") != num_of_rows:
+            return False
+
+        self.last_committed_page = checkpoint["last_committed_page"]
+        return True
+
+    def commit(self, page_index: int):
+        """Mark a page as committed, it is persisted on the next save.
+
+        Parameters
+        ----------
+        page_index : int
+            0-based index of the page
+        """
+        self.last_committed_page = page_index
+
+    def save(self):
+        """Write the checkpoint file, if any page is committed."""
+        if self.last_committed_page is None:
+            return
+
+        temp_file = self.checkpoint_file_name + ".temp"
+        with open(temp_file, "w") as checkpoint_file:
+            json.dump(
+                {
+                    "parameters": self.scrap_params,
+                    "tab_names": self.tab_names,
+                    "filters": self.filters,
+                    "rows_per_page": self.rows_per_page,
+                    "num_of_rows": self.num_of_rows,
+                    "last_committed_page": self.last_committed_page,
+                },
+                checkpoint_file,
+            )
+        os.replace(temp_file, self.checkpoint_file_name)
+
+    def clear(self):
+        """Remove the checkpoint file, e.g., when the scrapping is completed."""
+        self.last_committed_page = None
+        if os.path.exists(self.checkpoint_file_name):
+            os.remove(self.checkpoint_file_name)
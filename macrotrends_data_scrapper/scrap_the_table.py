@@ -1,4 +1,10 @@
 # Import libraries
+import math
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as ec
 from selenium.webdriver.support.ui import WebDriverWait
@@ -6,7 +12,41 @@ from tqdm import tqdm
 
 from macrotrends_data_scrapper.map_of_headers import MAP_OF_HEADERS
 from macrotrends_data_scrapper.data_recorder import DataRecorder
+from macrotrends_data_scrapper.grid_html import parse_row_matrix
+from macrotrends_data_scrapper.grid_snapshots import GridSnapshotRecorder
+from macrotrends_data_scrapper.pipelined_recorder import PipelinedDataRecorder
+from macrotrends_data_scrapper.map_of_datafields import TICKER_DATAFIELD
+from macrotrends_data_scrapper.scrap_checkpoint import ScrapCheckpoint
+from macrotrends_data_scrapper.scrape_plan import (
+    PageState,
+    ScrapePlan,
+    convert_row_matrix,
+    row_xpaths,
+    tab_xpath,
+)
+from macrotrends_data_scrapper.screener_filters import to_grid_filters
+from macrotrends_data_scrapper.ticker_positions import TickerPositionCache
+from macrotrends_data_scrapper.traversal_planner import (
+    AUTO,
+    PAGE_MAJOR,
+    TAB_MAJOR,
+    TRAVERSAL_STRATEGIES,
+    choose_traversal_strategy,
+    order_tabs,
+)
+from macrotrends_data_scrapper.value_parser import ValueParsingRecorder
 from macrotrends_data_scrapper.utils.Logger import Logger
+from macrotrends_data_scrapper.utils.grid_scripts import (
+    ACTIVE_TAB_SCRIPT,
+    APPLY_FILTERS_SCRIPT,
+    GO_TO_PAGE_SCRIPT,
+    GRID_HTML_SCRIPT,
+    GRID_SIGNATURE_SCRIPT,
+    SCRAP_DATA_SOURCE_SCRIPT,
+    SCRAP_VISIBLE_ROWS_SCRIPT,
+    WAIT_FOR_GRID_CHANGE_SCRIPT,
+)
+from macrotrends_data_scrapper.utils.browser_session import BrowserSession
 from macrotrends_data_scrapper.utils.manage_driver import DriverManager
 from macrotrends_data_scrapper.gui_scrap_the_table import TableScrapperGUI
 
@@ -19,15 +59,55 @@ class TableScrapper:
     ----------
     str_logger : str
         logger_level
+    extraction_mode : str
+        how the cells of a page are read from the website. One of
+        EXTRACTION_MODES:
+        "element": every cell is read by a separate WebDriver query.
+        "bulk": all visible rows of the active tab are read by a single
+        script executed in the browser.
+        "html": the html of the grid is read once per page and tab, and its
+        rows are parsed locally with lxml (see grid_html).
+        "datasource": all rows of the table are read from the client-side
+        data source of the grid once per tab, without paging.
+    traversal_strategy : str
+        order in which the pages and the tabs are traversed, one of
+        TRAVERSAL_STRATEGIES
+    url : str
+        url of the stock screener page
+    driver_manager : DriverManager
+        manager of the driver which has loaded the website, accessing it
+        blocks until the driver is booted
+    wait_times : dict[str, list[float]]
+        seconds waited for the table to be re-rendered after each page turn
+        ("page_turn"), each tab switch ("tab_switch") and applying the
+        filters ("filter")
 
     Methods
     -------
     scrap_the_table():
-        return the table data in dictionary format
+        save the table data to a data recorder
+    iter_pages():
+        yield the table data page by page
+    iter_rows():
+        yield the table data company by company
 
     """
 
-    def __init__(self, str_logger="info"):
+    EXTRACTION_MODES = ("element", "bulk", "html", "datasource")
+
+    # Seconds waited for the first tab switch if the page does not mark the active tab,
+    # see _change_tab
+    unknown_tab_wait_time = 3
+
+    def __init__(
+        self, str_logger="info",
+        extraction_mode="element",
+        persistent_session=False,
+        boot_in_background=True,
+        traversal_strategy="page-major",
+        url="https://www.macrotrends.net/stocks/stock-screener",
+        driver_factory=None
+    ):
         """
         Construct instant variables.
 
@@ -35,26 +115,128 @@ class TableScrapper:
         ----------
         str_logger : str
               the functionality string of the logger object
+        extraction_mode : str
+              how the cells of a page are read, one of EXTRACTION_MODES
+        persistent_session : bool
+              if True, a long-lived browser with a persistent profile is
+              reused across runs (see BrowserSession) instead of launching a
+              new browser for each TableScrapper
+        boot_in_background : bool
+              if True, the driver is created and the website is loaded in a
+              background thread, so that the constructor returns immediately
+              and the browser boots while, e.g., the parameters are selected
+              on the GUI. Scrapping blocks until the website is loaded, and
+              an error raised while booting is raised on first use of the
+              driver_manager.
+        traversal_strategy : str
+              order in which the pages and the tabs are traversed when the
+              pages are scrapped one by one, one of TRAVERSAL_STRATEGIES (see
+              traversal_planner). "tab-major" keeps the pages in memory until
+              their last tab is visited.
+        url : str
+              url of the stock screener page, e.g., the one of a local
+              stand-in server (see benchmark.standin_grid)
+        driver_factory : callable
+              if provided, function without arguments returning the driver
+              to be used instead of launching a browser, e.g., one returning
+              an in-process FakeDriver (see benchmark.fake_driver). It is
+              called for every worker.
         """
+        if extraction_mode not in self.EXTRACTION_MODES:
+            raise ValueError(
+                f"Unknown extraction mode (={extraction_mode}). "
+                f"Valid modes are: {self.EXTRACTION_MODES}"
+            )
+        if traversal_strategy not in TRAVERSAL_STRATEGIES:
+            raise ValueError(
+                f"Unknown traversal strategy (={traversal_strategy}). "
+                f"Valid strategies are: {TRAVERSAL_STRATEGIES}"
+            )
+        self.extraction_mode = extraction_mode
+        self.traversal_strategy = traversal_strategy
+        self.str_logger = str_logger
+        self.driver_factory = driver_factory
+
         # URL of the website this table scrapper works
-        url = "https://www.macrotrends.net/stocks/stock-screener"
+        self.url = url
 
-        self.driver_manager = DriverManager()  # Initialize driver manager object
-        self.driver_manager.set_up_driver(url=url)  # Set up the driver by using the url
+        # Initialize driver manager object, in the background if desired
+        browser_session = BrowserSession(logger_str=str_logger) if persistent_session else None
+        if boot_in_background:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="driver-boot")
+            self._driver_manager_future = executor.submit(
+                self._boot_driver, url, browser_session, driver_factory
+            )
+            executor.shutdown(wait=False)  # thread exits once the driver is booted
+        else:
+            self._driver_manager_future = Future()
+            self._driver_manager_future.set_result(
+                self._boot_driver(url, browser_session, driver_factory)
+            )
         self.logger = Logger(self.__class__.__name__, str_logger)
-        self.company_attr_dict = {}
+
+        # Seconds waited for the table to be re-rendered after each page turn,
+        # tab switch and filtering
+        self.wait_times = {"page_turn": [], "tab_switch": [], "filter": []}
+        self._script_timeout = None
+
+        # Tab the grid is showing, None if unknown
+        self._active_tab = None
+        # Row counts of the page shown and the plan of the parameters being scrapped
+        self._page_state = PageState()
+        self._scrape_plan = None
+        # Recorder of the html of the grid for each visited (page, tab), if any
+        self._snapshot_recorder = None
 
     def __del__(self):
         """Shut down the driver."""
-        self.driver_manager.kill_driver()
+        if not hasattr(self, "_driver_manager_future"):
+            return  # driver is not created on invalid arguments
+        try:
+            driver_manager = self._driver_manager_future.result()
+        except Exception:
+            return  # driver could not be booted, nothing to shut down
+        driver_manager.kill_driver()
+
+    @property
+    def driver_manager(self) -> DriverManager:
+        """Driver manager whose driver has loaded the website, blocks until it is booted."""
+        return self._driver_manager_future.result()
+
+    @staticmethod
+    def _boot_driver(
+        url: str, browser_session: BrowserSession = None, driver_factory=None
+    ) -> DriverManager:
+        """Create the driver and load the website."""
+        driver_manager = DriverManager(
+            browser_session=browser_session,
+            driver=None if driver_factory is None else driver_factory()
+        )
+        try:
+            driver_manager.set_up_driver(url=url)  # Set up the driver by using the url
+        except Exception:
+            driver_manager.kill_driver()
+            raise
+        return driver_manager
 
     def scrap_the_table(
         self, parameters_to_be_scrapped=None,
         csv_file: str = "result.csv",
-        ticker_column_str: str = "Ticker"
+        ticker_column_str: str = "Ticker",
+        workers: int = 1,
+        data_recorder: DataRecorder = None,
+        parse_values: bool = False,
+        resume: bool = False,
+        pipelined: bool = False,
+        filters: dict = None,
+        snapshot_dir: str = None,
+        ticker_positions_file: str = None
     ):
         """Scrap the whole table including all tabs and pages in macro-trend.
 
+        Scrapped data is saved to the data recorder and nothing is returned,
+        use iter_pages or iter_rows to get the data back instead.
+
         Parameters
         ----------
         parameters_to_be_scrapped : list[str]
@@ -63,19 +245,45 @@ class TableScrapper:
             name of the file of data to be recorded.
         ticker_column_str: str
             name of the Ticker column
-
-        Returns
-        -------
-        company_attr_dict : dict
-            dictionary of the companies associated with their properties
+        workers : int
+            number of browser sessions scrapping disjoint page ranges in
+            parallel. It has no effect in "datasource" extraction mode.
+        data_recorder : DataRecorder
+            recorder to which the scrapped data is saved. If None, a
+            DataRecorder saving to csv_file is used. It is flushed when the
+            scrapping ends, also when it ends with an error.
+        parse_values : bool
+            if True, values of the numeric parameters (see MAP_OF_VALUE_TYPES)
+            are parsed into numbers before they are saved, e.g., "$2.91T" is
+            saved as 2910000000000.0
+        resume : bool
+            if True, the last committed page is persisted to a checkpoint file
+            (i.e., csv_file + ".checkpoint") and a terminated scrapping of the
+            same parameters, filters and paging of the table continues from the
+            page after it. Pages are committed as soon as the recorder writes
+            them to the disk, or when the recorder is flushed.
+        pipelined : bool
+            if True, the pages are saved to the recorder by a writer thread
+            (see PipelinedDataRecorder), so the browser is driven to the next
+            page while the previous page is written to the disk.
+        filters : dict
+            if provided, only the companies satisfying the filters (see
+            screener_filters) are scrapped. Filters are applied on the grid
+            before the pages are traversed, hence only the matching rows are
+            paged through.
+        snapshot_dir : str
+            if provided, the html of the grid is recorded to this directory
+            for each visited (page, tab) as a compressed snapshot (see
+            grid_snapshots), so that the table can be scrapped again without
+            a browser by SnapshotReplayer. It has no effect in "datasource"
+            extraction mode.
+        ticker_positions_file : str
+            if provided, the page of each ticker is recorded to this file
+            (see TickerPositionCache) when the unfiltered table is scrapped
+            page by page by a single worker, so that refresh_tickers visits
+            only the pages of the tickers.
         """
-        if parameters_to_be_scrapped is None:
-            # Call GUI to interact with the user
-            gui = TableScrapperGUI()
-            parameters_to_be_scrapped = gui.run_gui()  # Get desired params from user
-
-        # Sort search parameters for efficient interaction with the website
-        scrap_params = self._sort_search_parameters(parameters_to_be_scrapped)
+        scrap_params = self._get_scrap_params(parameters_to_be_scrapped)
 
         # Print to CL what is searched
         self.logger.info(f"Search Params = {scrap_params}...")
@@ -83,34 +291,541 @@ class TableScrapper:
         # Let scrapping begin
         self.logger.info("SCRAPPING STARTED...")
 
-        # Get number of rows per page and total
-        (init_num, final_num, max_num) = self._get_num_of_rows(self.driver_manager.driver)
-
-        tqdm_length = max_num - init_num
         # NOTE: DataRecorder is initialized at every scrapping since it contains
         # some states and reusing it might be dangerous without caution. So it
         # is best to re-initalize it for each scrapping purpose.
-        data_recorder = DataRecorder(csv_file_name=csv_file)
-        with tqdm(total=tqdm_length) as pbar:
-            while final_num != max_num:
-                # Scrap the current page
-                company_attr_current_page = self._scrap_the_page(scrap_params)
-                (init_num, final_num, _) = self._get_num_of_rows(self.driver_manager.driver)
-                # Update the progress bar
-                pbar.update(int(final_num - init_num + 1))
+        if data_recorder is None:
+            data_recorder = DataRecorder(csv_file_name=csv_file)
+        if parse_values:
+            data_recorder = ValueParsingRecorder(data_recorder)
+        if pipelined:
+            # Values are parsed by the writer thread as well
+            data_recorder = PipelinedDataRecorder(data_recorder)
 
-                # Click on the clickable arrow on the table to progress in the pages
-                self._progress_one_page()
+        checkpoint = None
+        if resume:
+            if self.extraction_mode == "datasource" or workers > 1:
+                self.logger.warning(
+                    "Resuming is only supported when the pages are scrapped one by one "
+                    "by a single worker, scrapping starts from the beginning."
+                )
+            else:
+                checkpoint = ScrapCheckpoint(csv_file + ".checkpoint", scrap_params, filters)
+                # Paging of the matching rows is compared to the one of the checkpoint,
+                # applying the same filters again in _iter_pages keeps the grid as it is
+                if filters:
+                    self._apply_filters(filters)
+                (init_num, final_num, max_num) = self._get_page_state().pager
+                checkpoint.load(final_num - init_num + 1, max_num)
+        first_page = 0 if checkpoint is None else checkpoint.next_page
+
+        if snapshot_dir is not None:
+            if self.extraction_mode == "datasource":
+                self.logger.warning(
+                    "Snapshots are only recorded when the pages are scrapped one by one, "
+                    "no snapshot is recorded."
+                )
+            else:
+                # Snapshots of the committed pages are kept when the scrapping is resumed
+                self._snapshot_recorder = GridSnapshotRecorder(
+                    snapshot_dir, scrap_params, clear=first_page == 0
+                )
 
+        # Pages of the tickers are recorded when the unfiltered table is
+        # scrapped page by page, see refresh_tickers
+        ticker_positions = None
+        is_unfiltered_page_by_page = \
+            self.extraction_mode != "datasource" and workers <= 1 and not filters
+        if ticker_positions_file is not None and is_unfiltered_page_by_page:
+            ticker_positions = TickerPositionCache(ticker_positions_file)
+            ticker_positions.load(self._get_rows_per_page())
+
+        try:
+            # Page indices are only meaningful, hence checkpoint is only used,
+            # when the pages are scrapped one by one
+            for page_index, company_attr_page in enumerate(
+                self._iter_pages(scrap_params, workers, first_page, filters),
+                start=first_page
+            ):
                 # Save the progress to the CSV file
                 data_recorder.save_to_csv(
-                    scrapped_data=company_attr_current_page,
+                    scrapped_data=company_attr_page,
                     ticker_column_str=ticker_column_str
                 )
 
+                if checkpoint is not None:
+                    checkpoint.commit(page_index)
+                    if data_recorder.saves_are_durable:
+                        checkpoint.save()
+                if ticker_positions is not None:
+                    ticker_positions.record_page(page_index, list(company_attr_page))
+        finally:
+            # Recorders keeping the data in memory write it to the disk
+            data_recorder.flush()
+            if checkpoint is not None:
+                # Committed pages are on the disk after the flush
+                checkpoint.save()
+            if ticker_positions is not None:
+                ticker_positions.save()
+            if self._snapshot_recorder is not None:
+                self._snapshot_recorder.save_manifest(self.url)
+                self._snapshot_recorder = None
+
+        if checkpoint is not None:
+            checkpoint.clear()  # scrapping is completed, next run starts from the beginning
+
         self.logger.info("SCRAPPING IS DONE!!!")
         self.logger.info(f"SCRAPPED DATA: {scrap_params} ")
 
+    def refresh_tickers(
+        self, tickers: list[str],
+        parameters_to_be_scrapped=None,
+        csv_file: str = "result.csv",
+        ticker_column_str: str = "Ticker",
+        data_recorder: DataRecorder = None,
+        parse_values: bool = False,
+        ticker_positions_file: str = None
+    ) -> "list[str]":
+        """Scrap only the given companies and update their rows in the recorder.
+
+        Pages of the tickers recorded by the previous runs of scrap_the_table
+        (see its ticker_positions_file) are visited directly. Tickers whose
+        pages are not known, or which are not on their recorded pages anymore,
+        are searched by filtering the grid on the tickers, so at most a few
+        pages are scrapped in any case.
+
+        Parameters
+        ----------
+        tickers : list[str]
+            tickers of the companies to be scrapped, compared case-insensitively
+        parameters_to_be_scrapped : list[str]
+            user inputted list of parameters to be scrapped. If None, the
+            parameters are selected on the GUI.
+        csv_file : str
+            name of the file of data to be recorded.
+        ticker_column_str: str
+            name of the Ticker column
+        data_recorder : DataRecorder
+            recorder to which the scrapped companies are saved, see
+            scrap_the_table. Rows of the other companies are kept as they are.
+        parse_values : bool
+            if True, values of the numeric parameters are parsed into numbers
+            before they are saved, see scrap_the_table
+        ticker_positions_file : str
+            if provided, file of the pages of the tickers recorded by
+            scrap_the_table, which is updated with the visited pages. If None,
+            every ticker is searched by filtering the grid.
+
+        Returns
+        -------
+        missing_tickers : list[str]
+            tickers which are not found in the table
+        """
+        scrap_params = self._get_scrap_params(parameters_to_be_scrapped)
+        # Requested tickers by their case-folded forms, removed as they are found
+        remaining_tickers = {ticker.casefold(): ticker for ticker in tickers}
+
+        if data_recorder is None:
+            data_recorder = DataRecorder(csv_file_name=csv_file)
+        if parse_values:
+            data_recorder = ValueParsingRecorder(data_recorder)
+
+        def save_requested_companies(company_attr_page: dict):
+            requested_companies = {
+                ticker: company_attr for ticker, company_attr in company_attr_page.items()
+                if remaining_tickers.pop(ticker.casefold(), None) is not None
+            }
+            if requested_companies:
+                data_recorder.save_to_csv(
+                    scrapped_data=requested_companies,
+                    ticker_column_str=ticker_column_str
+                )
+
+        ticker_positions = None
+        if ticker_positions_file is not None:
+            ticker_positions = TickerPositionCache(ticker_positions_file)
+        try:
+            if ticker_positions is not None and self.extraction_mode != "datasource":
+                ticker_positions.load(self._get_rows_per_page())
+                tickers_per_page, _ = ticker_positions.group_by_page(
+                    list(remaining_tickers.values())
+                )
+                self.logger.info(f"Recorded pages of the tickers = {list(tickers_per_page)}")
+                for page_index in tickers_per_page:
+                    self._go_to_page(page_index)
+                    company_attr_page = self._scrap_the_page(scrap_params)
+                    ticker_positions.record_page(page_index, list(company_attr_page))
+                    save_requested_companies(company_attr_page)
+
+            if remaining_tickers:
+                # Only the rows of the remaining tickers are paged through
+                self.logger.info(f"Searching for the tickers = {list(remaining_tickers.values())}")
+                ticker_filter = {
+                    "datafield": TICKER_DATAFIELD, "values": list(remaining_tickers.values())
+                }
+                try:
+                    if self._apply_grid_filters([ticker_filter]) > 0:
+                        for company_attr_page in self._iter_pages(scrap_params, 1, 0):
+                            save_requested_companies(company_attr_page)
+                finally:
+                    self._apply_grid_filters([])
+        finally:
+            data_recorder.flush()
+            if ticker_positions is not None:
+                ticker_positions.save()
+
+        missing_tickers = list(remaining_tickers.values())
+        if missing_tickers:
+            self.logger.warning(f"Tickers are not found in the table: {missing_tickers}")
+        return missing_tickers
+
+    def iter_pages(
+        self, parameters_to_be_scrapped=None,
+        workers: int = 1,
+        first_page: int = 0,
+        filters: dict = None
+    ):
+        """Scrap the table and yield the data of each page as soon as it is scrapped.
+
+        Caller decides what to do with the data, e.g., scrap_the_table saves
+        each page to a data recorder. Stopping the iteration stops the
+        scrapping. Only a single page is kept in memory by the scrapper with
+        the "page-major" traversal strategy. With the "tab-major" strategy
+        (also when "auto" resolves to it), every page of the range is kept in
+        memory and the pages are yielded only while the last tab is visited.
+
+        Parameters
+        ----------
+        parameters_to_be_scrapped : list[str]
+            user inputted list of parameters to be scrapped. If None, the
+            parameters are selected on the GUI.
+        workers : int
+            number of browser sessions scrapping disjoint page ranges in
+            parallel, pages are yielded in the order they are scrapped. It has
+            no effect in "datasource" extraction mode.
+        first_page : int
+            0-based index of the first page to be scrapped, when the pages are
+            scrapped one by one by a single worker
+        filters : dict
+            if provided, only the companies satisfying the filters (see
+            screener_filters) are scrapped
+
+        Yields
+        ------
+        company_attr_page : dict(dict)
+            dictionary of the companies of a page associated with their
+            scrapped parameters, e.g., {"AAPL": {"name": "Apple Inc",
+            "Market Cap": "$2.91T"}}. The whole table is yielded as a single
+            page in "datasource" extraction mode.
+        """
+        yield from self._iter_pages(
+            self._get_scrap_params(parameters_to_be_scrapped), workers, first_page, filters
+        )
+
+    def iter_rows(
+        self, parameters_to_be_scrapped=None,
+        ticker_column_str: str = "Ticker",
+        workers: int = 1,
+        filters: dict = None
+    ):
+        """Scrap the table and yield the data of each company as soon as it is scrapped.
+
+        Parameters
+        ----------
+        parameters_to_be_scrapped : list[str]
+            user inputted list of parameters to be scrapped. If None, the
+            parameters are selected on the GUI.
+        ticker_column_str: str
+            key of the ticker in the yielded rows
+        workers : int
+            number of browser sessions scrapping the table in parallel, see
+            iter_pages
+        filters : dict
+            if provided, only the companies satisfying the filters (see
+            screener_filters) are scrapped
+
+        Yields
+        ------
+        row : dict
+            ticker and the scrapped parameters of a company, e.g.,
+            {"Ticker": "AAPL", "name": "Apple Inc", "Market Cap": "$2.91T"}
+        """
+        for company_attr_page in self.iter_pages(
+            parameters_to_be_scrapped, workers, filters=filters
+        ):
+            for ticker, company_attr in company_attr_page.items():
+                yield {ticker_column_str: ticker, **company_attr}
+
+    def _get_scrap_params(self, parameters_to_be_scrapped=None) -> "list[str]":
+        """Get the parameters from the GUI if not provided, and sort them."""
+        if parameters_to_be_scrapped is None:
+            # Call GUI to interact with the user
+            gui = TableScrapperGUI()
+            parameters_to_be_scrapped = gui.run_gui()  # Get desired params from user
+
+        # Sort search parameters for efficient interaction with the website
+        return self._sort_search_parameters(parameters_to_be_scrapped)
+
+    def _iter_pages(
+        self, scrap_params: list[str], workers: int, first_page: int, filters: dict = None
+    ):
+        """Yield the pages by the extraction mode and the number of workers, see iter_pages."""
+        if filters and self._apply_filters(filters) == 0:
+            return  # no company satisfies the filters
+
+        if self.extraction_mode == "datasource":
+            # Whole table is read from the data source of the grid, no paging is needed
+            yield self._scrap_the_data_source(scrap_params)
+        elif workers > 1:
+            yield from self._iter_pages_in_parallel(scrap_params, workers, filters)
+        else:
+            yield from self._iter_pages_one_by_one(scrap_params, first_page)
+
+    def _iter_pages_one_by_one(self, scrap_params: list[str], first_page: int = 0):
+        """Scrap the table by walking through its pages and yield each page.
+
+        Parameters
+        ----------
+        scrap_params : list[str]
+            list of the parameters that are desired to be scrapped
+        first_page : int
+            0-based index of the page scrapping starts from
+        """
+        # Get number of rows per page and total
+        (init_num, final_num, max_num) = self._get_page_state().pager
+        rows_per_page = final_num - init_num + 1
+        num_of_pages = math.ceil(max_num / rows_per_page)
+
+        if first_page > 0:
+            self.logger.info(f"Scrapping is resumed from page {first_page + 1}/{num_of_pages}")
+
+        with tqdm(total=max_num, initial=min(first_page * rows_per_page, max_num)) as pbar:
+            for company_attr_current_page in self._scrap_pages_by_strategy(
+                scrap_params, first_page, num_of_pages
+            ):
+                # Update the progress bar
+                pbar.update(len(company_attr_current_page))
+                yield company_attr_current_page
+
+    def _scrap_pages_by_strategy(self, scrap_params: list[str], first_page: int, last_page: int):
+        """Scrap the pages in [first_page, last_page) by the traversal strategy in order.
+
+        Parameters
+        ----------
+        scrap_params : list[str]
+            list of the parameters that are desired to be scrapped
+        first_page : int
+            0-based index of the first page to be scrapped
+        last_page : int
+            0-based index of the page after the last page to be scrapped
+        """
+        num_of_tabs = len(self._compile_plan(scrap_params).tab_names)
+        strategy = self.traversal_strategy
+        if num_of_tabs <= 1 or last_page - first_page <= 1:
+            strategy = PAGE_MAJOR  # strategies are the same
+
+        if strategy == AUTO:
+            # First page and the jump to the next one measure the wait times
+            yield from self._scrap_page_range(scrap_params, first_page, first_page + 1)
+            first_page += 1
+            self._go_to_page(first_page)
+            strategy = choose_traversal_strategy(
+                last_page - first_page, num_of_tabs,
+                self.wait_times["page_turn"], self.wait_times["tab_switch"]
+            )
+            self.logger.info(f"Traversal strategy of the remaining pages = {strategy}")
+
+        if strategy == TAB_MAJOR:
+            yield from self._scrap_page_range_tab_major(scrap_params, first_page, last_page)
+        else:
+            yield from self._scrap_page_range(scrap_params, first_page, last_page)
+
+    def _scrap_page_range_tab_major(
+        self, scrap_params: list[str], first_page: int, last_page: int
+    ):
+        """Scrap the pages in [first_page, last_page) tab by tab, yield them in order.
+
+        Pages are traversed once per tab, jumping back to the first page
+        between the tabs. Pages are kept in memory and yielded while the last
+        tab is traversed, i.e., as soon as they are completed.
+
+        Parameters
+        ----------
+        scrap_params : list[str]
+            list of the parameters that are desired to be scrapped
+        first_page : int
+            0-based index of the first page to be scrapped
+        last_page : int
+            0-based index of the page after the last page to be scrapped
+        """
+        scrape_plan = self._compile_plan(scrap_params)
+        tab_names = order_tabs(scrape_plan.tab_names, self._get_active_tab())
+        company_attr_pages = [{} for _ in range(first_page, last_page)]
+        for tab_index, tab_name in enumerate(tab_names):
+            self._go_to_page(first_page)
+            self._change_tab(tab_name)
+            for page_index in range(first_page, last_page):
+                company_attr_page = company_attr_pages[page_index - first_page]
+                self._scrap_tab_of_page(scrape_plan, tab_name, company_attr_page)
+                if tab_index == len(tab_names) - 1:
+                    yield company_attr_page
+                    company_attr_pages[page_index - first_page] = None  # release the memory
+                if page_index + 1 < last_page:
+                    self._progress_one_page()
+
+    def _iter_pages_in_parallel(
+        self, scrap_params: list[str], workers: int, filters: dict = None
+    ):
+        """Scrap disjoint page ranges with a pool of browser sessions and yield each page.
+
+        This scrapper takes the first page range, every other range is
+        scrapped by a separate TableScrapper (i.e., with its own driver) that
+        jumps directly to the start of its range. Pages are yielded in the
+        calling thread as they arrive.
+
+        Parameters
+        ----------
+        scrap_params : list[str]
+            list of the parameters that are desired to be scrapped
+        workers : int
+            number of browser sessions
+        filters : dict
+            filters applied by every other worker as well, they are already
+            applied by this scrapper
+        """
+        (init_num, final_num, max_num) = self._get_page_state().pager
+        num_of_pages = math.ceil(max_num / (final_num - init_num + 1))
+        page_ranges = self._partition_pages(num_of_pages, workers)
+        self.logger.info(f"Page ranges of the workers = {page_ranges}")
+
+        page_queue = queue.Queue()
+        stop_event = threading.Event()
+        with ThreadPoolExecutor(max_workers=len(page_ranges)) as executor:
+            futures = [
+                executor.submit(
+                    self._run_worker, worker_index, first_page, last_page, scrap_params,
+                    page_queue, stop_event, filters
+                )
+                for worker_index, (first_page, last_page) in enumerate(page_ranges)
+            ]
+
+            try:
+                # Each worker puts None to the queue when it stops
+                num_of_running_workers = len(futures)
+                with tqdm(total=max_num) as pbar:
+                    while num_of_running_workers > 0:
+                        company_attr_page = page_queue.get()
+                        if company_attr_page is None:
+                            num_of_running_workers -= 1
+                            continue
+                        pbar.update(len(company_attr_page))
+                        yield company_attr_page
+            finally:
+                # Workers stop after their current page if the iteration is stopped
+                stop_event.set()
+
+        for future in futures:
+            future.result()  # re-raise the exception of a failed worker, if any
+
+    def _run_worker(
+        self,
+        worker_index: int,
+        first_page: int,
+        last_page: int,
+        scrap_params: list[str],
+        page_queue: queue.Queue,
+        stop_event: threading.Event,
+        filters: dict = None
+    ):
+        """Scrap a page range with this scrapper or a new one, put the pages to the queue."""
+        try:
+            if worker_index == 0:
+                scrapper = self
+            else:
+                scrapper = TableScrapper(
+                    str_logger=self.str_logger,
+                    extraction_mode=self.extraction_mode,
+                    traversal_strategy=self.traversal_strategy,
+                    url=self.url,
+                    driver_factory=self.driver_factory
+                )
+                scrapper._snapshot_recorder = self._snapshot_recorder
+                if filters:
+                    scrapper._apply_filters(filters)
+            for company_attr_page in scrapper._scrap_page_range(
+                scrap_params, first_page, last_page
+            ):
+                if stop_event.is_set():
+                    break
+                page_queue.put(company_attr_page)
+        finally:
+            page_queue.put(None)
+
+    def _scrap_page_range(self, scrap_params: list[str], first_page: int, last_page: int):
+        """Scrap the pages in [first_page, last_page) and yield them one by one.
+
+        Parameters
+        ----------
+        scrap_params : list[str]
+            list of the parameters that are desired to be scrapped
+        first_page : int
+            0-based index of the first page to be scrapped
+        last_page : int
+            0-based index of the page after the last page to be scrapped
+        """
+        self._go_to_page(first_page)
+        for page_index in range(first_page, last_page):
+            yield self._scrap_the_page(scrap_params)
+            if page_index + 1 < last_page:
+                self._progress_one_page()
+
+    @staticmethod
+    def _partition_pages(num_of_pages: int, workers: int) -> "list[tuple[int, int]]":
+        """Split the pages into contiguous ranges of almost equal sizes.
+
+        Parameters
+        ----------
+        num_of_pages : int
+            total number of pages
+        workers : int
+            number of ranges desired. Less ranges are returned if there are
+            less pages than workers.
+
+        Returns
+        -------
+        page_ranges : list[tuple[int, int]]
+            (first_page, last_page) pairs of 0-based page indices where
+            last_page is excluded
+        """
+        workers = max(1, min(workers, num_of_pages))
+        range_size, remainder = divmod(num_of_pages, workers)
+        page_ranges = []
+        first_page = 0
+        for worker_index in range(workers):
+            last_page = first_page + range_size + (1 if worker_index < remainder else 0)
+            page_ranges.append((first_page, last_page))
+            first_page = last_page
+        return page_ranges
+
+    def _scrap_the_data_source(self, scrap_params: list[str]):
+        """Scrap all rows of the table from the client-side data source of the grid.
+
+        Instead of walking through the pages, each tab is visited once and all
+        of its rows are materialized by a single browser-side call.
+
+        Parameters
+        ----------
+        scrap_params : list[str]
+            list of the parameters that are desired to be scrapped, grouped by
+            their tab names (see _sort_search_parameters)
+
+        Returns
+        -------
+        company_attr_dict : dict(dict)
+            dictionary of all companies associated with their scrapped parameters
+        """
+        return self._scrap_tabs(scrap_params, self._scrap_data_source_matrix)
+
     def _scrap_the_page(self, scrap_params: list[str]):
         """Scrap the current page where table scrapper is operating.
 
@@ -119,94 +834,210 @@ class TableScrapper:
         scrap_params : list[str]
             list of the parameters that are desired to be scrapped
         """
+        if self.extraction_mode in ("bulk", "html"):
+            return self._scrap_the_page_in_bulk(scrap_params)
+
         # Scrap the tickers
         ticker_list, name_list = self._scrap_ticker_and_company_names()
         company_attr_dict_page = {
             ticker: {"name": name} for ticker, name in zip(ticker_list, name_list)
         }
 
-        # For each parameter to be scrapped, fill the dictionary
-        previous_tab_name = None
-        for param in scrap_params:
-            # Click the corresponding header
-            tab_name, column_index = list(MAP_OF_HEADERS[param].items())[0]
-            column_index -= 1
-
+        # For each tab, starting from the active one, fill the dictionary
+        scrape_plan = self._compile_plan(scrap_params)
+        for tab_name in order_tabs(scrape_plan.tab_names, self._get_active_tab()):
             # Check if clicking onto a tab name is required
-            previous_tab_name = self._change_tab(previous_tab_name, tab_name)
+            self._change_tab(tab_name)
+            self._record_snapshot(tab_name)
+            self._fill_params_of_tab(scrape_plan, ticker_list, tab_name, company_attr_dict_page)
 
-            # Fill dictionary ticker by ticker
-            one_parameter_dict_per_page = self._fill_attribute_dict(
-                ticker_list,
-                param,
-                column_index
-            )
+        return company_attr_dict_page
 
-            for key in list(one_parameter_dict_per_page.keys()):
-                company_attr_dict_page[key].update(one_parameter_dict_per_page[key])
+    def _scrap_tab_of_page(
+        self, scrape_plan: ScrapePlan, tab_name: str, company_attr_dict_page: dict
+    ):
+        """Scrap the parameters of the active tab on the current page into the dictionary.
 
-        return company_attr_dict_page
+        Parameters
+        ----------
+        scrape_plan : ScrapePlan
+            plan of the parameters that are desired to be scrapped
+        tab_name : str
+            name of the active tab
+        company_attr_dict_page : dict(dict)
+            dictionary of the companies on the page, updated in place
+        """
+        self._record_snapshot(tab_name)
+        if self.extraction_mode in ("bulk", "html"):
+            self._convert_row_matrix(
+                self._scrap_row_matrix(self._get_page_state().num_of_rows_on_page),
+                scrape_plan.columns_by_tab[tab_name],
+                company_attr_dict_page,
+            )
+            return
 
-    def _scrap_ticker_and_company_names(self):
-        """Scrap the tickers and the names of the companies on the page."""
-        (init_num, final_num, _) = self._get_num_of_rows(
-            self.driver_manager.driver
-        )
-        num_of_companies_on_page = final_num - init_num + 1
-
-        ticker_list = []
-        name_list = []
-        for row_index in range(num_of_companies_on_page):
-            # Get company tickers
-            company_ticker = (
-                self.driver_manager.driver.find_elements(
-                    By.XPATH, f"// *[ @ id = 'row{row_index}jqxGrid'] / div[2] / div")[
-                    0].text)
-            ticker_list.append(company_ticker)
-
-            # Get company names
-            company_name = self.driver_manager.driver.find_elements(
-                By.XPATH, f"//*[@id='row{row_index}jqxGrid']/"
-                          f"div[1]/div/div/a")[0].text
-            name_list.append(company_name)
-
-        # ticker_list, name_list = company_dict_temp.items()
-        return ticker_list, name_list
+        ticker_list, name_list = self._scrap_ticker_and_company_names()
+        for ticker, name in zip(ticker_list, name_list):
+            company_attr_dict_page.setdefault(ticker, {"name": name})
+        self._fill_params_of_tab(scrape_plan, ticker_list, tab_name, company_attr_dict_page)
 
-    def _fill_attribute_dict(
-            self,
-            ticker_list: list[str],
-            param: str,
-            column_index: int
+    def _fill_params_of_tab(
+        self,
+        scrape_plan: ScrapePlan,
+        ticker_list: list[str],
+        tab_name: str,
+        company_attr_dict_page: dict
     ):
-        """Fill the company attribute dict with the corresponding parameters.
+        """Scrap the parameters of the active tab element by element into the dictionary.
 
         Parameters
         ----------
+        scrape_plan : ScrapePlan
+            plan of the parameters that are desired to be scrapped
         ticker_list : list[str]
-        param : str
-        column_index : int
+            tickers on the page, row by row
+        tab_name : str
+            name of the active tab
+        company_attr_dict_page : dict(dict)
+            dictionary of the companies on the page, updated in place
+        """
+        driver = self.driver_manager.driver
+        for (param, _), cell_xpaths in zip(
+            scrape_plan.columns_by_tab[tab_name],
+            scrape_plan.cell_xpaths(tab_name, len(ticker_list))
+        ):
+            # Fill dictionary ticker by ticker
+            for ticker, cell_xpath in zip(ticker_list, cell_xpaths):
+                company_attr_dict_page[ticker][param] = \
+                    driver.find_elements(By.XPATH, cell_xpath)[0].text
+
+    def _scrap_the_page_in_bulk(self, scrap_params: list[str]):
+        """Scrap the current page by reading each tab with a single browser-side call.
+
+        Parameters
+        ----------
+        scrap_params : list[str]
+            list of the parameters that are desired to be scrapped, grouped by
+            their tab names (see _sort_search_parameters)
 
         Returns
         -------
-        one_parameter_dict_per_page : dict(dict)
-            dictionary of dictionaries that holds the scrapped parameter value
-            per company ticker per page
+        company_attr_dict_page : dict(dict)
+            dictionary of the companies on the page associated with their
+            scrapped parameters
         """
-        (init_num, final_num, _) = self._get_num_of_rows(
-            self.driver_manager.driver
+        num_of_companies_on_page = self._get_page_state().num_of_rows_on_page
+
+        return self._scrap_tabs(
+            scrap_params,
+            lambda: self._scrap_row_matrix(num_of_companies_on_page)
         )
-        one_parameter_dict_per_page = {ticker: dict() for ticker in ticker_list}
-        num_of_companies_on_page = final_num - init_num + 1
-        for ticker, row_index in zip(ticker_list, range(num_of_companies_on_page)):
-            # Get parameter values
-            parameter_value = self.driver_manager.driver.find_elements(
-                By.XPATH,
-                f"//*[@id='row{row_index}jqxGrid']/"
-                f"div[{int(3 + column_index)}]/div"
-            )[0].text
-            one_parameter_dict_per_page[ticker][param] = parameter_value
-        return one_parameter_dict_per_page
+
+    def _scrap_tabs(self, scrap_params: list[str], read_row_matrix):
+        """Visit the tabs of the parameters and read a row matrix from each one.
+
+        Parameters
+        ----------
+        scrap_params : list[str]
+            list of the parameters that are desired to be scrapped, grouped by
+            their tab names (see _sort_search_parameters)
+        read_row_matrix : callable
+            function without arguments that returns the row matrix of the
+            active tab in the form of [[ticker, name, column1, ...], ...]
+
+        Returns
+        -------
+        company_attr_dict : dict(dict)
+            dictionary of the companies associated with their scrapped parameters
+        """
+        company_attr_dict = {}
+        scrape_plan = self._compile_plan(scrap_params)
+        for tab_name in order_tabs(scrape_plan.tab_names, self._get_active_tab()):
+            self._change_tab(tab_name)
+            self._record_snapshot(tab_name)
+            self._convert_row_matrix(
+                read_row_matrix(), scrape_plan.columns_by_tab[tab_name], company_attr_dict
+            )
+
+        if not company_attr_dict:
+            # No parameter is requested, still record the tickers and the names
+            self._convert_row_matrix(read_row_matrix(), [], company_attr_dict)
+        return company_attr_dict
+
+    def _scrap_row_matrix(self, num_of_companies_on_page: int) -> "list[list[str]]":
+        """Read all visible rows of the active tab at once.
+
+        In "html" extraction mode, the html of the grid is read and its rows
+        are parsed locally, otherwise they are read by a browser-side script.
+
+        Parameters
+        ----------
+        num_of_companies_on_page : int
+            number of rows shown on the current page
+
+        Returns
+        -------
+        row_matrix : list[list[str]]
+            one list per row in the form of [ticker, name, column1, column2, ...]
+        """
+        driver = self.driver_manager.driver
+        if self.extraction_mode != "html":
+            return driver.execute_script(SCRAP_VISIBLE_ROWS_SCRIPT, num_of_companies_on_page)
+
+        grid_html = driver.execute_script(GRID_HTML_SCRIPT)
+        if self._snapshot_recorder is not None and self._active_tab is not None:
+            # Html read to scrap the tab is recorded, see _record_snapshot
+            (first_row, _, _) = self._get_page_state().pager
+            self._snapshot_recorder.save(first_row, self._active_tab, grid_html)
+        return parse_row_matrix(grid_html, num_of_companies_on_page)
+
+    def _scrap_data_source_matrix(self) -> "list[list[str]]":
+        """Read all rows of the active tab from the data source of the grid.
+
+        Returns
+        -------
+        row_matrix : list[list[str]]
+            one list per row in the form of [ticker, name, column1, column2, ...]
+        """
+        return self.driver_manager.driver.execute_script(SCRAP_DATA_SOURCE_SCRIPT)
+
+    # Merge the values of a row matrix into the company attribute dictionary
+    _convert_row_matrix = staticmethod(convert_row_matrix)
+
+    def _record_snapshot(self, tab_name: str):
+        """Record the html of the grid showing a tab of the current page, if recording."""
+        if self._snapshot_recorder is None or self.extraction_mode == "html":
+            return  # html is recorded as it is read in "html" mode, see _scrap_row_matrix
+        (first_row, _, _) = self._get_page_state().pager
+        self._snapshot_recorder.save(
+            first_row, tab_name, self.driver_manager.driver.execute_script(GRID_HTML_SCRIPT)
+        )
+
+    def _scrap_ticker_and_company_names(self):
+        """Scrap the tickers and the names of the companies on the page."""
+        driver = self.driver_manager.driver
+        ticker_xpaths, name_xpaths = row_xpaths(self._get_page_state().num_of_rows_on_page)
+
+        # Get company tickers and names
+        ticker_list = [
+            driver.find_elements(By.XPATH, ticker_xpath)[0].text for ticker_xpath in ticker_xpaths
+        ]
+        name_list = [
+            driver.find_elements(By.XPATH, name_xpath)[0].text for name_xpath in name_xpaths
+        ]
+        return ticker_list, name_list
+
+    def _get_page_state(self) -> PageState:
+        """Get the row counts of the current page, the pager is read only if they are changed."""
+        if not self._page_state.is_valid:
+            self._page_state.pager = self._get_num_of_rows(self.driver_manager.driver)
+        return self._page_state
+
+    def _compile_plan(self, scrap_params: list[str]) -> ScrapePlan:
+        """Get the plan of the parameters, compiled only when the parameters change."""
+        if self._scrape_plan is None or self._scrape_plan.scrap_params != scrap_params:
+            self._scrape_plan = ScrapePlan(scrap_params)
+        return self._scrape_plan
 
     @staticmethod
     def _sort_search_parameters(params_to_be_searched):
@@ -230,6 +1061,10 @@ class TableScrapper:
         # sorted(zip(param1,param2)) sorts according to param1
         return [p for _, p in sorted(zip(tab_name_list, params_to_be_searched))]
 
+    def _get_rows_per_page(self) -> int:
+        """Get the number of rows per page, assuming that a page other than the last is shown."""
+        return self._get_page_state().num_of_rows_on_page
+
     @staticmethod
     def _get_num_of_rows(driver) -> "tuple[int,int,int]":
         """Check current row number, max row number in current page, total row number.
@@ -249,35 +1084,91 @@ class TableScrapper:
         number_of_rows_in_the_list = int(temp[0].text.split("-")[1].split(" ")[2])
         return current_initial_number, current_final_number, number_of_rows_in_the_list
 
-    def _change_tab(self, current_tab_name: str, tab_name: str):
-        """Change the tab.
+    def _change_tab(self, tab_name: str):
+        """Change the tab, unless the grid is already showing it.
+
+        Grid keeps its tab when the page is turned, so the active tab is
+        tracked across the pages. Until it is tracked (e.g., on the first
+        click), the active tab is read from the page, see _get_active_tab. If
+        the page does not mark the active tab, the grid may already be showing
+        the tab, in which case clicking it does not change what the grid
+        shows. Hence the grid is waited for at most unknown_tab_wait_time
+        seconds in that case.
 
         Parameters
         ----------
-        current_tab_name : str
-            name of the current tab tablescrapper is operating
         tab_name : str
             name of the tab tablescrapper needs to acces for next parameter
-
-        Returns
-        -------
-        tab_name : str
-            name of the current tab where table scrapper is operating
-
         """
         wait_time = 100
-        if current_tab_name != tab_name:
-            WebDriverWait(self.driver_manager.driver, wait_time).until(
+        active_tab = self._get_active_tab()
+        if active_tab != tab_name:
+            is_active_tab_known = active_tab is not None
+            self._active_tab = None  # unknown until the tab is rendered
+            grid_signature = self._get_grid_signature()
+            WebDriverWait(self.driver_manager.driver, wait_time, poll_frequency=0.05).until(
                 ec.element_to_be_clickable(
-                    (By.XPATH, f"//*[@id='columns_{tab_name}']/a")
+                    (By.XPATH, tab_xpath(tab_name))
                 )
             ).click()
+            if is_active_tab_known:
+                self._wait_for_grid_change(grid_signature, wait_time, "tab_switch")
+            else:
+                try:
+                    self._wait_for_grid_change(
+                        grid_signature, self.unknown_tab_wait_time, "tab_switch"
+                    )
+                except TimeoutException:
+                    self.logger.debug(f"Grid was already showing the tab: {tab_name}")
+            self._active_tab = tab_name
+
+    def _apply_filters(self, filters: dict) -> int:
+        """Apply the filters on the grid and return the number of matching rows.
+
+        Parameters
+        ----------
+        filters : dict
+            filters as described in screener_filters
+        """
+        return self._apply_grid_filters(to_grid_filters(filters))
+
+    def _apply_grid_filters(self, grid_filters: "list[dict]") -> int:
+        """Replace the filters of the grid and return the number of matching rows.
+
+        Parameters
+        ----------
+        grid_filters : list[dict]
+            filters keyed by the datafields of the grid, see APPLY_FILTERS_SCRIPT.
+            Filters are cleared if it is empty.
+        """
+        grid_signature = self._get_grid_signature()
+        num_of_rows_before, num_of_rows, first_row_before, first_row = \
+            self.driver_manager.driver.execute_script(APPLY_FILTERS_SCRIPT, grid_filters)
+        # Filtered rows may be changed while their number is kept, hence the first shown
+        # row, which is a part of the signature of the grid, is compared as well
+        if num_of_rows != num_of_rows_before or first_row != first_row_before:
+            self._page_state.invalidate()
+            self._wait_for_grid_change(grid_signature, 100, "filter")
+        self.logger.info(f"{num_of_rows}/{num_of_rows_before} rows satisfy the filters")
+        return num_of_rows
+
+    def _go_to_page(self, page_index: int):
+        """Jump directly to a page of the table.
 
-        return tab_name
+        Parameters
+        ----------
+        page_index : int
+            0-based index of the page
+        """
+        grid_signature = self._get_grid_signature()
+        if self.driver_manager.driver.execute_script(GO_TO_PAGE_SCRIPT, page_index):
+            self._page_state.invalidate()
+            self._wait_for_grid_change(grid_signature, 100, "page_turn")
 
     def _progress_one_page(self):
         """Move one page forward."""
-        WebDriverWait(self.driver_manager.driver, 2).until(
+        grid_signature = self._get_grid_signature()
+        WebDriverWait(self.driver_manager.driver, 2, poll_frequency=0.05).until(
             ec.element_to_be_clickable(
                 (
                     By.XPATH,
@@ -285,6 +1176,53 @@ class TableScrapper:
                 )
             )
         ).click()
+        self._page_state.invalidate()
+        self._wait_for_grid_change(grid_signature, 100, "page_turn")
+
+    def _get_active_tab(self) -> str:
+        """Get the tab the grid is showing, None if unknown.
+
+        Tab is read from the page (see ACTIVE_TAB_SCRIPT) only until it is
+        tracked by _change_tab.
+        """
+        if self._active_tab is None:
+            self._active_tab = self.driver_manager.driver.execute_script(ACTIVE_TAB_SCRIPT)
+        return self._active_tab
+
+    def _get_grid_signature(self) -> str:
+        """Get a string identifying what the grid currently shows (page and tab)."""
+        return self.driver_manager.driver.execute_script(GRID_SIGNATURE_SCRIPT)
+
+    def _wait_for_grid_change(self, grid_signature: str, timeout: float, wait_time_key: str):
+        """Wait until the grid is re-rendered, i.e., its signature is changed.
+
+        Grid is observed in the browser, hence waiting ends as soon as the new
+        page or tab is rendered. Measured waiting time is appended to
+        self.wait_times[wait_time_key].
+
+        Parameters
+        ----------
+        grid_signature : str
+            signature of the grid before the page or the tab is changed
+        timeout : float
+            maximum waiting time in seconds
+        wait_time_key : str
+            key of self.wait_times, i.e., "page_turn", "tab_switch" or "filter"
+        """
+        driver = self.driver_manager.driver
+        if self._script_timeout is None or self._script_timeout < timeout:
+            # Let the browser-side timeout expire before the one of the driver
+            driver.set_script_timeout(timeout + 5)
+            self._script_timeout = timeout
+
+        wait_time_ms = driver.execute_async_script(
+            WAIT_FOR_GRID_CHANGE_SCRIPT, grid_signature, int(timeout * 1000)
+        )
+        if wait_time_ms < 0:
+            raise TimeoutException(f"Table is not re-rendered in {timeout} seconds")
+
+        self.wait_times[wait_time_key].append(wait_time_ms / 1000)
+        self.logger.debug(f"Table is re-rendered in {wait_time_ms:.0f} ms ({wait_time_key})")
 
 
 def main():
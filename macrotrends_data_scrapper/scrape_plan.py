@@ -0,0 +1,148 @@
+from functools import lru_cache
+
+from macrotrends_data_scrapper.map_of_headers import MAP_OF_HEADERS
+from macrotrends_data_scrapper.traversal_planner import group_params_by_tab
+
+
+class ScrapePlan:
+    """Everything derived from the parameters to be scrapped, compiled once per scrapping.
+
+    Attributes
+    ----------
+    scrap_params : list[str]
+        parameters to be scrapped
+    params_by_tab : dict[str, list[str]]
+        parameters of each tab, see group_params_by_tab
+    tab_names : list[str]
+        tabs to be visited
+    columns_by_tab : dict[str, list[tuple[str, int]]]
+        parameters of each tab paired with their (1-based) column index in the
+        tab, as listed in MAP_OF_HEADERS
+    column_indices_by_tab : dict[str, tuple[int, ...]]
+        (1-based) column indices of the parameters of each tab
+    """
+
+    def __init__(self, scrap_params: list[str]):
+        self.scrap_params = list(scrap_params)
+        self.params_by_tab = group_params_by_tab(self.scrap_params)
+        self.tab_names = list(self.params_by_tab)
+        self.columns_by_tab = {
+            tab_name: [(param, MAP_OF_HEADERS[param][tab_name]) for param in params_of_tab]
+            for tab_name, params_of_tab in self.params_by_tab.items()
+        }
+        self.column_indices_by_tab = {
+            tab_name: tuple(column_index for _, column_index in columns)
+            for tab_name, columns in self.columns_by_tab.items()
+        }
+
+    def cell_xpaths(self, tab_name: str, num_of_rows: int) -> "tuple[tuple[str, ...], ...]":
+        """Get the XPaths of the cells of the parameters of a tab, one tuple per parameter.
+
+        Parameters
+        ----------
+        tab_name : str
+            name of the tab
+        num_of_rows : int
+            number of rows shown on the page
+
+        Returns
+        -------
+        cell_xpaths : tuple[tuple[str, ...], ...]
+            XPaths of the cells of each parameter (in the order of
+            columns_by_tab) row by row
+        """
+        return _cell_xpaths(self.column_indices_by_tab[tab_name], num_of_rows)
+
+
+class PageState:
+    """Row counts shown by the pager for the current page, so the pager is read once per page.
+
+    Row counts should be invalidated whenever the rows of the grid change
+    (e.g., the page is turned or the grid is filtered), but not on a tab
+    switch.
+
+    Attributes
+    ----------
+    pager : tuple[int, int, int]
+        first row number, last row number and the total number of rows, None
+        if they are not read since the rows are changed
+    """
+
+    def __init__(self):
+        self.pager = None
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether the row counts are read since the rows are changed."""
+        return self.pager is not None
+
+    @property
+    def num_of_rows_on_page(self) -> int:
+        """Number of rows shown on the page."""
+        (init_num, final_num, _) = self.pager
+        return final_num - init_num + 1
+
+    def invalidate(self):
+        """Forget the row counts, they should be read again."""
+        self.pager = None
+
+
+def convert_row_matrix(
+    row_matrix: "list[list[str]]",
+    params_and_column_indices: "list[tuple[str, int]]",
+    company_attr_dict: dict,
+) -> dict:
+    """Merge the values in the row matrix into the company attribute dictionary.
+
+    Parameters
+    ----------
+    row_matrix : list[list[str]]
+        one list per row in the form of [ticker, name, column1, column2, ...]
+    params_and_column_indices : list[tuple[str, int]]
+        parameter names paired with their (1-based) column index in the tab,
+        as listed in MAP_OF_HEADERS (see ScrapePlan.columns_by_tab)
+    company_attr_dict : dict(dict)
+        dictionary to be updated in place, keys are the tickers
+
+    Returns
+    -------
+    company_attr_dict : dict(dict)
+        the updated dictionary
+    """
+    for row in row_matrix:
+        ticker, name = row[0], row[1]
+        company_attr = company_attr_dict.setdefault(ticker, {"name": name})
+        for param, column_index in params_and_column_indices:
+            # First two entries of the row are the ticker and the name
+            company_attr[param] = row[1 + column_index]
+    return company_attr_dict
+
+
+def tab_xpath(tab_name: str) -> str:
+    """Get the XPath of the link of a tab."""
+    return f"//*[@id='columns_{tab_name}']/a"
+
+
+@lru_cache(maxsize=None)
+def row_xpaths(num_of_rows: int) -> "tuple[tuple[str, ...], tuple[str, ...]]":
+    """Get the XPaths of the tickers and of the company names, row by row."""
+    ticker_xpaths = tuple(
+        f"// *[ @ id = 'row{row_index}jqxGrid'] / div[2] / div" for row_index in range(num_of_rows)
+    )
+    name_xpaths = tuple(
+        f"//*[@id='row{row_index}jqxGrid']/div[1]/div/div/a" for row_index in range(num_of_rows)
+    )
+    return ticker_xpaths, name_xpaths
+
+
+@lru_cache(maxsize=None)
+def _cell_xpaths(column_indices: "tuple[int, ...]", num_of_rows: int):
+    """Get the XPaths of the cells of the columns, see ScrapePlan.cell_xpaths."""
+    # Company name and ticker are the first two cells of a row
+    return tuple(
+        tuple(
+            f"//*[@id='row{row_index}jqxGrid']/div[{2 + column_index}]/div"
+            for row_index in range(num_of_rows)
+        )
+        for column_index in column_indices
+    )
@@ -0,0 +1,136 @@
+from typing import Any
+
+from macrotrends_data_scrapper.map_of_datafields import MAP_OF_DATAFIELDS
+from macrotrends_data_scrapper.map_of_value_types import MAP_OF_VALUE_TYPES
+
+# Filters restrict the companies scrapped by the values of their parameters.
+# Keys are the parameter names used in MAP_OF_HEADERS, values are either:
+#   the accepted values of a "text" parameter, e.g., "Sector": ["Medical", "Retail-Wholesale"]
+#   (a single value can be given as a string), or
+#   the inclusive bounds of a numeric parameter, e.g., "Market Cap": {"min": 10000}
+#   (either bound can be omitted, the bounds are numbers and min is not greater than max).
+# Bounds are compared with the values of the data source of the grid, which
+# are not necessarily in the units shown in the table (see MAP_OF_DATAFIELDS).
+# A company is scrapped if it satisfies every filter.
+
+
+def normalize_filters(filters: dict[str:Any]) -> dict:
+    """Validate filters and convert them into a single form.
+
+    Parameters
+    ----------
+    filters : dict
+        filters as described at the top of this module, e.g.,
+        {"Country": "USA", "Market Cap": {"min": 10000}}
+
+    Returns
+    -------
+    normalized_filters : dict
+        filters sorted by the parameter names where text filters are
+        {"values": [...]} and numeric filters are {"min": ..., "max": ...},
+        e.g., {"Country": {"values": ["USA"]}, "Market Cap": {"min": 10000, "max": None}}
+    """
+    normalized_filters = {}
+    for param in sorted(filters):
+        condition = filters[param]
+        if param not in MAP_OF_DATAFIELDS:
+            raise ValueError(f"No datafield is known to filter the parameter: {param}")
+
+        if MAP_OF_VALUE_TYPES.get(param, "text") == "text":
+            values = [condition] if isinstance(condition, str) else condition
+            if not isinstance(values, list) or not values \
+                    or not all(isinstance(value, str) for value in values):
+                raise ValueError(
+                    f"Filter of {param} should be a string or a non-empty list of strings, "
+                    f"got: {condition}"
+                )
+            normalized_filters[param] = {"values": values}
+        else:
+            if not isinstance(condition, dict) or not condition \
+                    or not set(condition).issubset({"min", "max"}):
+                raise ValueError(
+                    f"Filter of {param} should be a dictionary with the keys \"min\" "
+                    f"and/or \"max\", got: {condition}"
+                )
+            bounds = {"min": condition.get("min"), "max": condition.get("max")}
+            # bool is a subclass of int, but it is not a meaningful bound
+            if not all(
+                bound is None or (isinstance(bound, (int, float)) and not isinstance(bound, bool))
+                for bound in bounds.values()
+            ):
+                raise ValueError(
+                    f"Bounds of the filter of {param} should be numbers, got: {condition}"
+                )
+            if bounds["min"] is not None and bounds["max"] is not None \
+                    and bounds["min"] > bounds["max"]:
+                raise ValueError(
+                    f"Minimum of the filter of {param} should not be greater than its "
+                    f"maximum, got: {condition}"
+                )
+            normalized_filters[param] = bounds
+    return normalized_filters
+
+
+def to_grid_filters(filters: dict[str:Any]) -> "list[dict]":
+    """Convert filters into the argument of APPLY_FILTERS_SCRIPT.
+
+    Parameters
+    ----------
+    filters : dict
+        filters as described at the top of this module
+
+    Returns
+    -------
+    grid_filters : list[dict]
+        filters keyed by the datafields of the grid, e.g.,
+        [{"datafield": "country_code", "values": ["USA"]}]
+    """
+    return [
+        {"datafield": MAP_OF_DATAFIELDS[param], **condition}
+        for param, condition in normalize_filters(filters).items()
+    ]
+
+
+def filter_records(records: "list[dict]", filters: dict[str:Any]) -> "list[dict]":
+    """Select the records of the data source of the grid satisfying the filters.
+
+    Text values are compared case-insensitively, as the grid does.
+
+    Parameters
+    ----------
+    records : list[dict]
+        records of the client-side data source of the grid
+    filters : dict
+        filters as described at the top of this module
+
+    Returns
+    -------
+    matching_records : list[dict]
+        records satisfying every filter, in their order
+    """
+    conditions = []
+    for param, condition in normalize_filters(filters).items():
+        if "values" in condition:
+            condition = {"values": {value.casefold() for value in condition["values"]}}
+        conditions.append((MAP_OF_DATAFIELDS[param], condition))
+    return [record for record in records if _matches(record, conditions)]
+
+
+def _matches(record: dict, conditions: "list[tuple[str, dict]]") -> bool:
+    """Check whether a record satisfies every (datafield, condition) pair."""
+    for datafield, condition in conditions:
+        value = record.get(datafield)
+        if "values" in condition:
+            if value is None or str(value).casefold() not in condition["values"]:
+                return False
+            continue
+
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            return False  # missing values do not satisfy any bound
+        if condition["min"] is not None and number < condition["min"]:
+            return False
+        if condition["max"] is not None and number > condition["max"]:
+            return False
+    return True
@@ -0,0 +1,189 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from macrotrends_data_scrapper.data_recorder import DataRecorder
+from macrotrends_data_scrapper.grid_html import parse_row_matrix
+from macrotrends_data_scrapper.grid_snapshots import (
+    list_snapshot_files,
+    read_manifest,
+    read_snapshot,
+)
+from macrotrends_data_scrapper.map_of_headers import MAP_OF_HEADERS
+from macrotrends_data_scrapper.scrape_plan import ScrapePlan, convert_row_matrix
+from macrotrends_data_scrapper.utils.Logger import Logger
+from macrotrends_data_scrapper.value_parser import ValueParsingRecorder
+
+
+class SnapshotReplayer:
+    """
+    Class to be used to scrap the grid snapshots recorded by TableScrapper, without a browser.
+
+    Snapshots (see grid_snapshots) are parsed with lxml into the same pages
+    TableScrapper scraps from the website, hence a recorded table can be
+    scrapped again for other parameters shown on the recorded tabs. Pages are
+    parsed in parallel by a pool of processes.
+
+    Attributes
+    ----------
+    snapshot_dir : str
+        directory of the snapshots
+    processes : int
+        number of processes parsing the snapshots, pages are parsed in the
+        calling process if it is 1
+
+    Methods
+    -------
+    iter_pages():
+        yield the data of each recorded page
+    scrap_the_table():
+        scrap every recorded page and save it to a data recorder
+    """
+
+    def __init__(self, snapshot_dir: str, str_logger="info", processes: int = None):
+        """
+        Construct instant variables.
+
+        Parameters
+        ----------
+        snapshot_dir : str
+            directory of the snapshots
+        str_logger : str
+            the functionality string of the logger object
+        processes : int
+            number of processes parsing the snapshots, the number of CPUs if
+            it is None
+        """
+        self.snapshot_dir = snapshot_dir
+        self.processes = processes or os.cpu_count() or 1
+        self.logger = Logger(self.__class__.__name__, str_logger)
+
+    def iter_pages(self, parameters_to_be_scrapped: list[str] = None):
+        """Parse the snapshots and yield the data of each page in the order of the pages.
+
+        Parameters
+        ----------
+        parameters_to_be_scrapped : list[str]
+            parameters to be scrapped, their tabs should be recorded. If None,
+            the parameters scrapped while the snapshots were recorded.
+
+        Yields
+        ------
+        company_attr_page : dict(dict)
+            dictionary of the companies of a page associated with their
+            scrapped parameters, e.g., {"AAPL": {"name": "Apple Inc",
+            "Market Cap": "$2.91T"}}
+
+        Raises
+        ------
+        ValueError
+            if a tab of the parameters is not recorded for every page
+        """
+        scrape_plan = ScrapePlan(self._get_scrap_params(parameters_to_be_scrapped))
+        snapshot_files = list_snapshot_files(self.snapshot_dir)
+        self.logger.info(f"Replaying {len(snapshot_files)} recorded pages...")
+
+        page_tasks = []
+        for first_row, snapshot_file_of_tab in snapshot_files.items():
+            missing_tabs = [
+                tab_name for tab_name in scrape_plan.tab_names
+                if tab_name not in snapshot_file_of_tab
+            ]
+            if missing_tabs:
+                raise ValueError(
+                    f"Tabs {missing_tabs} are not recorded for the page starting at row "
+                    f"{first_row}, the parameters on them cannot be replayed"
+                )
+            # Tickers and names are read from any tab if no parameter is requested
+            tab_names = scrape_plan.tab_names or list(snapshot_file_of_tab)[:1]
+            page_tasks.append([
+                (snapshot_file_of_tab[tab_name], scrape_plan.columns_by_tab.get(tab_name, []))
+                for tab_name in tab_names
+            ])
+
+        if self.processes <= 1 or len(page_tasks) <= 1:
+            yield from map(_replay_page, page_tasks)
+            return
+        with ProcessPoolExecutor(max_workers=self.processes) as executor:
+            # Pages are sent to the processes in chunks to amortize the round trips
+            chunksize = max(1, len(page_tasks) // (self.processes * 4))
+            yield from executor.map(_replay_page, page_tasks, chunksize=chunksize)
+
+    def scrap_the_table(
+        self, parameters_to_be_scrapped: list[str] = None,
+        csv_file: str = "result.csv",
+        ticker_column_str: str = "Ticker",
+        data_recorder: DataRecorder = None,
+        parse_values: bool = False
+    ):
+        """Scrap every recorded page and save it to a data recorder.
+
+        Parameters
+        ----------
+        parameters_to_be_scrapped : list[str]
+            parameters to be scrapped, see iter_pages
+        csv_file : str
+            name of the file of data to be recorded
+        ticker_column_str: str
+            name of the Ticker column
+        data_recorder : DataRecorder
+            recorder to which the scrapped data is saved. If None, a
+            DataRecorder saving to csv_file is used. It is flushed when the
+            replay ends.
+        parse_values : bool
+            if True, values of the numeric parameters are parsed into numbers
+            before they are saved, see TableScrapper.scrap_the_table
+        """
+        if data_recorder is None:
+            data_recorder = DataRecorder(csv_file_name=csv_file)
+        if parse_values:
+            data_recorder = ValueParsingRecorder(data_recorder)
+
+        try:
+            for company_attr_page in self.iter_pages(parameters_to_be_scrapped):
+                data_recorder.save_to_csv(
+                    scrapped_data=company_attr_page,
+                    ticker_column_str=ticker_column_str
+                )
+        finally:
+            data_recorder.flush()
+        self.logger.info("REPLAY IS DONE!!!")
+
+    def _get_scrap_params(self, parameters_to_be_scrapped: list[str] = None) -> "list[str]":
+        """Get the parameters of the manifest if not provided, and validate them."""
+        if parameters_to_be_scrapped is None:
+            manifest = read_manifest(self.snapshot_dir)
+            if manifest is None:
+                raise ValueError(
+                    f"No manifest is found in {self.snapshot_dir}, "
+                    "parameters to be scrapped should be provided"
+                )
+            parameters_to_be_scrapped = manifest["scrap_params"]
+        unknown_params = [
+            param for param in parameters_to_be_scrapped if param not in MAP_OF_HEADERS
+        ]
+        if unknown_params:
+            raise ValueError(f"Unknown parameters: {unknown_params}")
+        return list(parameters_to_be_scrapped)
+
+
+def _replay_page(snapshot_files_and_columns: "list[tuple[str, list[tuple[str, int]]]]") -> dict:
+    """Parse the snapshots of the tabs of a page into the data of the page.
+
+    Parameters
+    ----------
+    snapshot_files_and_columns : list[tuple[str, list[tuple[str, int]]]]
+        path to the snapshot of each tab paired with the parameters of the
+        tab and their column indices, see ScrapePlan.columns_by_tab
+
+    Returns
+    -------
+    company_attr_page : dict(dict)
+        dictionary of the companies of the page associated with their
+        scrapped parameters
+    """
+    company_attr_page = {}
+    for snapshot_file_name, columns in snapshot_files_and_columns:
+        convert_row_matrix(
+            parse_row_matrix(read_snapshot(snapshot_file_name)), columns, company_attr_page
+        )
+    return company_attr_page
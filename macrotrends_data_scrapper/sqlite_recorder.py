@@ -0,0 +1,192 @@
+import csv
+import os
+import sqlite3
+from typing import Any
+
+from macrotrends_data_scrapper.data_recorder import DataRecorder
+
+
+class SQLiteDataRecorder(DataRecorder):
+    """Records the scrapped data to an SQLite database and exports it to a CSV file.
+
+    Rows are stored in a table whose primary key (hence indexed column) is the
+    ticker column, so each page is written by a single batch of upserts without
+    reading or rewriting the rest of the data. Columns are added to the table
+    as new parameters are scrapped. The table is exported to the CSV file on
+    flush. If the database does not exist yet but the CSV file does, the CSV
+    file is imported first, so partial scrapping into the same CSV file works
+    as with DataRecorder.
+
+    Attributes
+    ----------
+    csv_file_name : str
+        path to the csv file to which the data is exported.
+    database_file_name : str
+        path to the SQLite database, defaults to the csv file name with the
+        ".sqlite" extension.
+    table_name : str
+        name of the table storing the companies.
+    """
+
+    table_name = "companies"
+
+    def __init__(self, csv_file_name: str, database_file_name: str = None):
+        super().__init__(csv_file_name)
+        if database_file_name is None:
+            database_file_name = os.path.splitext(self.csv_file_name)[0] + ".sqlite"
+        self.database_file_name = database_file_name
+        self._is_new_database = not os.path.exists(self.database_file_name)
+        # Recorder may be used by the writer thread of a PipelinedDataRecorder,
+        # which never uses it at the same time as the thread creating it
+        self.connection = sqlite3.connect(self.database_file_name, check_same_thread=False)
+        self._ticker_column_str = None
+
+    def __del__(self):
+        """Close the connection to the database."""
+        if hasattr(self, "connection"):
+            self.connection.close()
+
+    def save_to_csv(self, scrapped_data: dict[str:dict[str:Any]], ticker_column_str: str = None):
+        """Upsert scrapped data into the database.
+
+        Parameters
+        ----------
+        scrapped_data : dict
+            dictionary where keys are tickers, values are another dictionary
+            with key contain the name of the scrapped parameter and the value
+            containing the value of the scrapped parameter. Example is
+            scrapped_data = {"AAPL": {"MarketCap":100}}
+
+        ticker_column_str : str
+            String of the column where the ticker values are stored. It must be
+            the primary key of the table, if the database exists.
+        """
+        if ticker_column_str is None:
+            ticker_column_str = "Ticker"
+
+        if self._ticker_column_str is None:
+            self._create_table(ticker_column_str)
+
+        self._add_missing_columns(
+            self._extract_parameter_names_from_scrap_data(scrapped_data, ticker_column_str)
+        )
+
+        # Companies having the same scrapped parameters are upserted together
+        rows_per_columns = {}
+        for ticker, company_data_scrapped in scrapped_data.items():
+            columns = tuple(company_data_scrapped.keys())
+            rows_per_columns.setdefault(columns, []).append(
+                (ticker, *company_data_scrapped.values())
+            )
+
+        with self.connection:  # single transaction per page
+            for columns, rows in rows_per_columns.items():
+                self.connection.executemany(
+                    self._build_upsert_statement(ticker_column_str, columns),
+                    rows
+                )
+
+    def flush(self):
+        """Export the table to the csv file."""
+        if self._ticker_column_str is None:
+            return  # nothing is recorded yet
+        self.export_to_csv(self.csv_file_name)
+
+    def export_to_csv(self, csv_file_name: str):
+        """Write the whole table to a csv file.
+
+        Parameters
+        ----------
+        csv_file_name : str
+            path to the csv file, it is overwritten if exists.
+        """
+        cursor = self.connection.execute(
+            f"SELECT * FROM {_quote(self.table_name)} ORDER BY rowid"
+        )
+        headers = [description[0] for description in cursor.description]
+
+        temp_file = csv_file_name + ".temp"
+        with open(temp_file, "w", newline="") as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(headers)
+            for row in cursor:
+                writer.writerow(["" if value is None else value for value in row])
+        os.replace(temp_file, csv_file_name)
+
+    def _create_table(self, ticker_column_str: str):
+        """Create the table keyed by the ticker column, import the csv file for a new database."""
+        with self.connection:
+            self.connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {_quote(self.table_name)} "
+                f"({_quote(ticker_column_str)} TEXT PRIMARY KEY)"
+            )
+        self._ticker_column_str = ticker_column_str
+        self.headers_in_file = self._get_table_columns()
+        assert self.headers_in_file[0] == ticker_column_str, \
+            f"Ticker column provided (={ticker_column_str}) " \
+            "is not the key of the existing table. " \
+            f"Columns in the table are: ({self.headers_in_file})"
+
+        if self._is_new_database and self._is_file_exist:
+            self._import_csv(ticker_column_str)
+
+    def _import_csv(self, ticker_column_str: str):
+        """Copy the rows of the existing csv file into the table."""
+        with open(self.csv_file_name, "r", newline="") as csvfile:
+            reader = csv.reader(csvfile)
+            headers = next(reader)
+            assert ticker_column_str in headers, \
+                f"Ticker column provided (={ticker_column_str}) " \
+                "does not exist in the first row of the existing CSV file. " \
+                f"Headers in the file are: ({headers})"
+            # Ticker column is already in the table, other columns are added in order
+            self._add_missing_columns(headers)
+            ticker_column_index = headers.index(ticker_column_str)
+            other_columns = tuple(
+                header for index, header in enumerate(headers) if index != ticker_column_index
+            )
+            with self.connection:
+                self.connection.executemany(
+                    self._build_upsert_statement(ticker_column_str, other_columns),
+                    (
+                        (row[ticker_column_index],
+                         *(value for index, value in enumerate(row)
+                           if index != ticker_column_index))
+                        for row in reader
+                    )
+                )
+
+    def _add_missing_columns(self, columns: list):
+        """Add the columns not yet in the table, in the given order."""
+        missing_columns = [column for column in columns if column not in self.headers_in_file]
+        if not missing_columns:
+            return
+        with self.connection:
+            for column in missing_columns:
+                self.connection.execute(
+                    f"ALTER TABLE {_quote(self.table_name)} ADD COLUMN {_quote(column)}"
+                )
+        self.headers_in_file = self.headers_in_file + missing_columns
+
+    def _get_table_columns(self) -> list[str]:
+        """Get the column names of the table in their order."""
+        cursor = self.connection.execute(f"PRAGMA table_info({_quote(self.table_name)})")
+        return [column_info[1] for column_info in cursor]
+
+    def _build_upsert_statement(self, ticker_column_str: str, columns: tuple) -> str:
+        """Build the statement inserting a row or updating the given columns of an existing row."""
+        all_columns = ", ".join(_quote(column) for column in (ticker_column_str, *columns))
+        placeholders = ", ".join("?" * (len(columns) + 1))
+        statement = (
+            f"INSERT INTO {_quote(self.table_name)} ({all_columns}) VALUES ({placeholders}) "
+            f"ON CONFLICT({_quote(ticker_column_str)}) "
+        )
+        if not columns:
+            return statement + "DO NOTHING"
+        updates = ", ".join(f"{_quote(column)} = excluded.{_quote(column)}" for column in columns)
+        return statement + f"DO UPDATE SET {updates}"
+
+
+def _quote(identifier: str) -> str:
+    """Quote an SQL identifier (i.e., table or column name)."""
+    return '"' + identifier.replace('"', '""') + '"'
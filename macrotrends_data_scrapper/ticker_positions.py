@@ -0,0 +1,107 @@
+import json
+import os
+
+
+class TickerPositionCache:
+    """Persists the page of each ticker seen in the unfiltered table.
+
+    Positions are recorded while the pages are scrapped one by one, so that a
+    later refresh of a few tickers jumps directly to their pages instead of
+    traversing the whole table. Positions are only valid for the same number
+    of rows per page; they may be outdated (e.g., a company is listed or
+    delisted), hence the tickers should be looked for on their pages and
+    searched otherwise.
+
+    Attributes
+    ----------
+    cache_file_name : str
+        path to the cache file
+    rows_per_page : int
+        number of rows per page of the recorded positions, None if nothing is
+        recorded
+    positions : dict[str, int]
+        0-based page index of each ticker
+    """
+
+    def __init__(self, cache_file_name: str):
+        self.cache_file_name = cache_file_name
+        self.rows_per_page = None
+        self.positions = {}
+
+    def load(self, rows_per_page: int) -> bool:
+        """Load the positions recorded for the given number of rows per page.
+
+        Parameters
+        ----------
+        rows_per_page : int
+            number of rows per page of the table at present
+
+        Returns
+        -------
+        is_loaded : bool
+            True if the cache file exists and it was recorded with the same
+            number of rows per page, False otherwise.
+        """
+        self.rows_per_page = rows_per_page
+        self.positions = {}
+        if not os.path.exists(self.cache_file_name):
+            return False
+
+        with open(self.cache_file_name, "r") as cache_file:
+            cache = json.load(cache_file)
+        if cache["rows_per_page"] != rows_per_page:
+            return False
+
+        self.positions = cache["positions"]
+        return True
+
+    def record_page(self, page_index: int, tickers: list[str]):
+        """Record the tickers seen on a page, it is persisted on the next save.
+
+        Parameters
+        ----------
+        page_index : int
+            0-based index of the page
+        tickers : list[str]
+            tickers on the page
+        """
+        for ticker in tickers:
+            self.positions[ticker] = page_index
+
+    def group_by_page(self, tickers: list[str]) -> "tuple[dict[int, list[str]], list[str]]":
+        """Group the tickers by their recorded pages.
+
+        Parameters
+        ----------
+        tickers : list[str]
+            tickers to be looked for, compared case-insensitively
+
+        Returns
+        -------
+        tickers_per_page : dict[int, list[str]]
+            tickers of each page, in the order of the pages
+        unknown_tickers : list[str]
+            tickers whose position is not recorded
+        """
+        positions = {ticker.casefold(): page_index for ticker, page_index in self.positions.items()}
+        tickers_per_page = {}
+        unknown_tickers = []
+        for ticker in tickers:
+            if ticker.casefold() in positions:
+                tickers_per_page.setdefault(positions[ticker.casefold()], []).append(ticker)
+            else:
+                unknown_tickers.append(ticker)
+        return dict(sorted(tickers_per_page.items())), unknown_tickers
+
+    def save(self):
+        """Write the cache file, if any position is recorded."""
+        if not self.positions:
+            return
+
+        temp_file = self.cache_file_name + ".temp"
+        with open(temp_file, "w") as cache_file:
+            json.dump(
+                {"rows_per_page": self.rows_per_page, "positions": self.positions},
+                cache_file,
+            )
+        os.replace(temp_file, self.cache_file_name)
@@ -0,0 +1,133 @@
+from statistics import mean
+
+from macrotrends_data_scrapper.map_of_headers import MAP_OF_HEADERS
+
+# Orders in which the pages and the tabs of the table are traversed:
+#   "page-major" : every tab of a page is visited before moving to the next page
+#   "tab-major"  : every page is visited on a tab before switching to the next tab
+#   "auto"       : the first page is traversed page-major, then the strategy
+#                  estimated to be faster by the measured wait times is used
+PAGE_MAJOR = "page-major"
+TAB_MAJOR = "tab-major"
+AUTO = "auto"
+TRAVERSAL_STRATEGIES = (PAGE_MAJOR, TAB_MAJOR, AUTO)
+
+
+def group_params_by_tab(scrap_params: list[str]) -> "dict[str, list[str]]":
+    """Group the parameters by their tabs.
+
+    Parameters
+    ----------
+    scrap_params : list[str]
+        list of the parameters that are desired to be scrapped
+
+    Returns
+    -------
+    params_by_tab : dict[str, list[str]]
+        parameters of each tab, tabs are in the order of their first parameters
+    """
+    params_by_tab = {}
+    for param in scrap_params:
+        tab_name = list(MAP_OF_HEADERS[param].keys())[0]
+        params_by_tab.setdefault(tab_name, []).append(param)
+    return params_by_tab
+
+
+def order_tabs(tab_names: list[str], active_tab: str = None) -> "list[str]":
+    """Order the tabs to be visited such that the active tab is visited first.
+
+    Grid stays on its tab when the page is turned, so a page visiting the
+    active tab first needs one click less. Since the last tab visited on a
+    page is the active tab of the next page, every page but the first one
+    needs one click less than the number of tabs (e.g., two tabs are visited
+    in alternating order page by page).
+
+    Parameters
+    ----------
+    tab_names : list[str]
+        tabs to be visited
+    active_tab : str
+        tab the grid is showing, None if unknown
+
+    Returns
+    -------
+    ordered_tab_names : list[str]
+        tabs to be visited in order
+    """
+    if active_tab not in tab_names:
+        return list(tab_names)
+    return [active_tab] + [tab_name for tab_name in tab_names if tab_name != active_tab]
+
+
+def estimate_traversal_seconds(
+    num_of_pages: int,
+    num_of_tabs: int,
+    page_turn_seconds: float,
+    tab_switch_seconds: float
+) -> "dict[str, float]":
+    """Estimate the seconds spent for turning pages and switching tabs by each strategy.
+
+    Reading the cells takes the same time in both strategies, hence it is not
+    included. The grid is assumed to show none of the tabs at the beginning.
+
+    Parameters
+    ----------
+    num_of_pages : int
+        number of pages to be traversed
+    num_of_tabs : int
+        number of tabs to be visited on each page
+    page_turn_seconds : float
+        seconds waited for a page turn (or a jump to a page)
+    tab_switch_seconds : float
+        seconds waited for a tab switch
+
+    Returns
+    -------
+    seconds : dict[str, float]
+        estimated seconds for PAGE_MAJOR and TAB_MAJOR
+    """
+    if num_of_pages < 1 or num_of_tabs < 1:
+        return {PAGE_MAJOR: 0.0, TAB_MAJOR: 0.0}
+    # Each page but the first starts on the last tab of the previous page
+    page_major_seconds = sum((
+        (num_of_pages - 1) * page_turn_seconds,
+        (num_of_tabs + (num_of_pages - 1) * (num_of_tabs - 1)) * tab_switch_seconds,
+    ))
+    # Pages are traversed once per tab, jumping back to the first page in between
+    tab_major_seconds = sum((
+        (num_of_tabs * (num_of_pages - 1) + num_of_tabs - 1) * page_turn_seconds,
+        num_of_tabs * tab_switch_seconds,
+    ))
+    return {PAGE_MAJOR: page_major_seconds, TAB_MAJOR: tab_major_seconds}
+
+
+def choose_traversal_strategy(
+    num_of_pages: int,
+    num_of_tabs: int,
+    page_turn_wait_times: list[float],
+    tab_switch_wait_times: list[float]
+) -> str:
+    """Choose the strategy estimated to be faster by the measured wait times.
+
+    Parameters
+    ----------
+    num_of_pages : int
+        number of pages to be traversed
+    num_of_tabs : int
+        number of tabs to be visited on each page
+    page_turn_wait_times : list[float]
+        seconds waited for the previous page turns
+    tab_switch_wait_times : list[float]
+        seconds waited for the previous tab switches
+
+    Returns
+    -------
+    strategy : str
+        PAGE_MAJOR or TAB_MAJOR, PAGE_MAJOR if nothing is measured
+    """
+    if not page_turn_wait_times or not tab_switch_wait_times:
+        return PAGE_MAJOR
+    seconds = estimate_traversal_seconds(
+        num_of_pages, num_of_tabs, mean(page_turn_wait_times), mean(tab_switch_wait_times)
+    )
+    return TAB_MAJOR if seconds[TAB_MAJOR] < seconds[PAGE_MAJOR] else PAGE_MAJOR
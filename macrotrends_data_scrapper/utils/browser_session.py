@@ -0,0 +1,222 @@
+import json
+import os
+import shutil
+import signal
+import subprocess
+import time
+import urllib.error
+import urllib.request
+
+import trio  # dependency of selenium
+from trio_websocket import ConnectionClosed, HandshakeError, open_websocket_url
+
+from macrotrends_data_scrapper.utils.create_driver import (
+    get_browser_arguments,
+    load_webdriver_options,
+)
+from macrotrends_data_scrapper.utils.Logger import Logger
+
+# Executables tried in order when the browser binary is not provided
+CHROME_BINARY_CANDIDATES = [
+    "google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome",
+]
+
+
+class BrowserSession:
+    """Long-lived browser process which is reused by the drivers of successive runs.
+
+    Browser is launched with a remote debugging port and a persistent profile
+    (hence a persistent HTTP cache), and it keeps running after the driver
+    attached to it quits. The next run attaches to the same browser if it is
+    healthy and younger than max_age, otherwise a new browser is launched.
+    Process id, port and start time of the browser are kept in a session file.
+
+    Note that a browser session should be used by a single driver at a time.
+
+    Attributes
+    ----------
+    session_dir : str
+        directory of the session file and the browser profile
+    port : int
+        remote debugging port of the browser
+    max_age : float
+        seconds after which the browser is relaunched
+    chrome_binary : str
+        path to the browser executable, searched in PATH if not provided
+
+    Methods
+    -------
+    ensure_running():
+        Attach to the running browser or launch a new one, return its address
+    """
+
+    def __init__(
+        self,
+        session_dir: str = None,
+        port: int = 9222,
+        max_age: float = 4 * 60 * 60,
+        chrome_binary: str = None,
+        logger_str: str = "none",
+    ):
+        if session_dir is None:
+            session_dir = os.path.join(
+                os.path.expanduser("~"), ".macrotrends_data_scrapper", "browser_session"
+            )
+        self.session_dir = session_dir
+        self.port = port
+        self.max_age = max_age
+        self.chrome_binary = chrome_binary
+        self.logger = Logger(self.__class__.__name__, logger_str)
+
+    @property
+    def session_file_name(self) -> str:
+        """Path to the file storing the process id, port and start time of the browser."""
+        return os.path.join(self.session_dir, "session.json")
+
+    @property
+    def profile_dir(self) -> str:
+        """Path to the persistent profile of the browser."""
+        return os.path.join(self.session_dir, "profile")
+
+    def ensure_running(self) -> str:
+        """Make sure that a healthy browser is running and return its debugger address.
+
+        Returns
+        -------
+        debugger_address : str
+            "host:port" of the remote debugging interface of the browser
+        """
+        session = self._read_session_file()
+        if session is not None:
+            if self._is_healthy(session["port"]) and not self._is_expired(session):
+                self.logger.info(f"Attaching to the running browser (pid={session['pid']})")
+                return f"127.0.0.1:{session['port']}"
+            self.logger.info("Browser session is expired or not responding, relaunching")
+            self._terminate(session)
+
+        return self._launch()
+
+    def _launch(self, startup_timeout: float = 20) -> str:
+        """Launch the browser in the background and wait until it is responding."""
+        chrome_binary = self.chrome_binary or _find_chrome_binary()
+        options_dict = load_webdriver_options()
+        arguments = get_browser_arguments(options_dict) + [
+            f"--remote-debugging-port={self.port}",
+            f"--user-data-dir={self.profile_dir}",
+        ]
+        if "image" in options_dict.get("blocked_resource_types", []):
+            arguments.append("--blink-settings=imagesEnabled=false")
+
+        os.makedirs(self.profile_dir, exist_ok=True)
+        process = subprocess.Popen(
+            [chrome_binary, *arguments],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,  # browser outlives the current process
+        )
+
+        deadline = time.monotonic() + startup_timeout
+        while not self._is_healthy(self.port):
+            if time.monotonic() > deadline or process.poll() is not None:
+                process.kill()
+                raise RuntimeError(f"Browser could not be launched by: {chrome_binary}")
+            time.sleep(0.1)
+
+        self._write_session_file({"pid": process.pid, "port": self.port, "started_at": time.time()})
+        self.logger.info(f"Browser is launched (pid={process.pid})")
+        return f"127.0.0.1:{self.port}"
+
+    def _is_expired(self, session: dict) -> bool:
+        """Check whether the browser is running longer than max_age."""
+        return time.time() - session["started_at"] > self.max_age
+
+    @staticmethod
+    def _is_healthy(port: int) -> bool:
+        """Check whether the browser responds on its remote debugging port."""
+        try:
+            with urllib.request.urlopen(
+                f"http://127.0.0.1:{port}/json/version", timeout=1
+            ) as response:
+                return response.status == 200
+        except (urllib.error.URLError, OSError):
+            return False
+
+    def _terminate(self, session: dict):
+        """Terminate the browser of the session and remove the session file.
+
+        Process id of the session file may be reused by another process once
+        the browser exits, hence the process is only killed if it is a browser
+        of the profile of this session (see _is_browser_of_profile). Otherwise,
+        the browser is asked to close over its remote debugging interface.
+        """
+        if _is_browser_of_profile(session["pid"], self.profile_dir):
+            try:
+                os.kill(session["pid"], signal.SIGTERM)
+            except ProcessLookupError:
+                pass  # browser has exited meanwhile
+        else:
+            self._close_over_devtools(session["port"])
+        if os.path.exists(self.session_file_name):
+            os.remove(self.session_file_name)
+
+    def _close_over_devtools(self, port: int, timeout: float = 5):
+        """Close the browser responding on a remote debugging port, if any, by Browser.close."""
+        try:
+            with urllib.request.urlopen(
+                f"http://127.0.0.1:{port}/json/version", timeout=1
+            ) as response:
+                web_socket_url = json.load(response).get("webSocketDebuggerUrl")
+        except (urllib.error.URLError, OSError, ValueError):
+            return  # browser is not running anymore
+        if web_socket_url is None:
+            self.logger.warning(f"Browser on port {port} could not be closed, it is left running")
+            return
+
+        async def close_browser():
+            with trio.fail_after(timeout):
+                async with open_websocket_url(web_socket_url) as web_socket:
+                    await web_socket.send_message(json.dumps({"id": 1, "method": "Browser.close"}))
+                    await web_socket.get_message()
+
+        try:
+            trio.run(close_browser)
+        except (HandshakeError, ConnectionClosed, trio.TooSlowError, OSError):
+            pass  # connection is closed by the exiting browser, or it is not responding
+
+    def _read_session_file(self):
+        """Read the session file, None if it does not exist."""
+        if not os.path.exists(self.session_file_name):
+            return None
+        with open(self.session_file_name, "r") as session_file:
+            return json.load(session_file)
+
+    def _write_session_file(self, session: dict):
+        """Write the session file."""
+        os.makedirs(self.session_dir, exist_ok=True)
+        with open(self.session_file_name, "w") as session_file:
+            json.dump(session, session_file)
+
+
+def _is_browser_of_profile(pid: int, profile_dir: str) -> bool:
+    """Check whether a process is a browser launched with the given profile directory.
+
+    Command line of the process is read from /proc, hence it is False where
+    /proc is not available.
+    """
+    try:
+        with open(f"/proc/{pid}/cmdline", "rb") as cmdline_file:
+            arguments = cmdline_file.read().decode(errors="replace").split("\0")
+    except OSError:
+        return False  # process is not running, or its command line cannot be read
+    return f"--user-data-dir={profile_dir}" in arguments
+
+
+def _find_chrome_binary() -> str:
+    """Find the browser executable in PATH."""
+    for candidate in CHROME_BINARY_CANDIDATES:
+        chrome_binary = shutil.which(candidate)
+        if chrome_binary is not None:
+            return chrome_binary
+    raise FileNotFoundError(
+        f"Browser executable could not be found in PATH, tried: {CHROME_BINARY_CANDIDATES}"
+    )
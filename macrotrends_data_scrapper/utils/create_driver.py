@@ -5,7 +5,16 @@ import json
 import os
 
 
-def create_driver(logger_str="info") -> "webdriver.chrome":
+# Url patterns of the resource types that can be blocked in webdriverOptions.json
+RESOURCE_TYPE_URL_PATTERNS = {
+    "image": ["*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.svg*", "*.webp*", "*.ico*"],
+    "font": ["*.woff*", "*.woff2*", "*.ttf*", "*.otf*", "*.eot*"],
+    "media": ["*.mp4*", "*.webm*", "*.mp3*", "*.ogg*"],
+    "stylesheet": ["*.css*"],
+}
+
+
+def create_driver(logger_str="info", debugger_address: str = None) -> "webdriver.chrome":
     """Create driver object.
 
     Driver is an WebDriver object that interacts with the website. Clicking,
@@ -19,6 +28,11 @@ def create_driver(logger_str="info") -> "webdriver.chrome":
     logger_str : string
         logger objects level indicator
 
+    debugger_address : string
+        "host:port" of the remote debugging interface of a running browser.
+        If provided, the driver attaches to that browser (whose options are
+        set when it is launched, see BrowserSession) instead of launching one.
+
     Returns
     -------
     driver : WebDriver object
@@ -27,29 +41,90 @@ def create_driver(logger_str="info") -> "webdriver.chrome":
     logger = Logger("create_driver", logger_str)
     logger.info("WebDriver is being created...")
 
+    options_dict = load_webdriver_options()
+
+    options = Options()
+    if debugger_address is None:
+        # Get desired webdriver options
+        logger.info(f"Webdriver Options = {options_dict['options']}...")
+
+        # Add driver options to the driver
+        for opt in get_browser_arguments(options_dict):
+            options.add_argument(opt)
+
+        # Images are not even decoded when they are blocked by the content settings
+        if "image" in options_dict.get("blocked_resource_types", []):
+            options.add_experimental_option(
+                "prefs", {"profile.managed_default_content_settings.images": 2}
+            )
+    else:
+        logger.info(f"Attaching to the browser at {debugger_address}...")
+        options.add_experimental_option("debuggerAddress", debugger_address)
+
+    driver = webdriver.Chrome(options=options)
+
+    # Block the resources which are not needed to read the table (e.g., fonts, ads)
+    blocked_url_patterns = _get_blocked_url_patterns(options_dict)
+    if blocked_url_patterns:
+        logger.info(f"Blocked URL patterns = {blocked_url_patterns}...")
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_url_patterns})
+
+    # Finalize webdriver creation by calling the url
+    logger.info("WebDriver is created!!!")
+    return driver
+
+
+def load_webdriver_options() -> dict:
+    """Read the webdriver options from webdriverOptions.json."""
     path = os.path.dirname(os.path.abspath(__file__))
 
     with open(f"{path}/webdriverOptions.json") as webdriver_options:
-        options_dict = json.load(webdriver_options)
+        return json.load(webdriver_options)
 
-    # Get desired webdriver options
-    logger.info(f"Webdriver Options = {options_dict['options']}...")
 
-    # Add driver options to the driver
-    options = Options()
-    for opt in options_dict["options"]:
-        options.add_argument(opt)
+def get_browser_arguments(options_dict: dict) -> list[str]:
+    """Get the command line arguments of the browser from the webdriver options.
+
+    Parameters
+    ----------
+    options_dict : dict
+        content of webdriverOptions.json
 
+    Returns
+    -------
+    arguments : list[str]
+        options listed in the file followed by the user agent
+    """
     # Below option enables web driver to be able to scrap when in headless mode
     user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36' \
                  ' (KHTML, like Gecko) Chrome/83.0.4103.116 Safari/537.36'
-    options.add_argument(f'user-agent={user_agent}')
+    return list(options_dict["options"]) + [f'user-agent={user_agent}']
 
-    driver = webdriver.Chrome(options=options)
 
-    # Finalize webdriver creation by calling the url
-    logger.info("WebDriver is created!!!")
-    return driver
+def _get_blocked_url_patterns(options_dict: dict) -> list[str]:
+    """Collect the url patterns to be blocked from the webdriver options.
+
+    Parameters
+    ----------
+    options_dict : dict
+        content of webdriverOptions.json
+
+    Returns
+    -------
+    blocked_url_patterns : list[str]
+        patterns of the blocked resource types followed by the blocked url patterns
+    """
+    blocked_url_patterns = []
+    for resource_type in options_dict.get("blocked_resource_types", []):
+        if resource_type not in RESOURCE_TYPE_URL_PATTERNS:
+            raise KeyError(
+                f"Unknown resource type (={resource_type}) to be blocked. "
+                f"Valid types are: {list(RESOURCE_TYPE_URL_PATTERNS.keys())}"
+            )
+        blocked_url_patterns += RESOURCE_TYPE_URL_PATTERNS[resource_type]
+    blocked_url_patterns += options_dict.get("blocked_url_patterns", [])
+    return blocked_url_patterns
 
 
 def main():
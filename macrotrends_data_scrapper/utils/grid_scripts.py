@@ -0,0 +1,202 @@
+# JavaScript snippets executed inside the browser by the table scrapper. They
+# are kept in a single place so that the row/column structure they rely on
+# (i.e., "row{i}jqxGrid" rows whose first cell holds the company name, second
+# cell holds the ticker and the remaining cells hold the columns of the active
+# tab) can be maintained together with the XPaths in scrap_the_table.py.
+
+# Read every visible row of the grid in a single call.
+#
+# arguments[0] : number of rows shown on the current page
+#
+# Returns a row matrix where each row is [ticker, name, column1, column2, ...]
+SCRAP_VISIBLE_ROWS_SCRIPT = """
+var numOfRows = arguments[0];
+var rowMatrix = [];
+for (var rowIndex = 0; rowIndex < numOfRows; rowIndex++) {
+    var row = document.getElementById('row' + rowIndex + 'jqxGrid');
+    if (row === null) {
+        break;
+    }
+    var cells = row.children;
+    var nameLink = cells[0].querySelector('div > div > a');
+    var rowValues = [
+        cells[1].children[0].innerText.trim(),
+        nameLink === null ? '' : nameLink.innerText.trim()
+    ];
+    for (var cellIndex = 2; cellIndex < cells.length; cellIndex++) {
+        var cell = cells[cellIndex].children[0];
+        rowValues.push(cell === undefined ? '' : cell.innerText.trim());
+    }
+    rowMatrix.push(rowValues);
+}
+return rowMatrix;
+"""
+
+# Read every row of the grid from its client-side data source, without paging.
+# The visible columns of the active tab are resolved in their display order,
+# hence the returned row matrix has the same form as the one returned by
+# SCRAP_VISIBLE_ROWS_SCRIPT, i.e., [ticker, name, column1, column2, ...]
+SCRAP_DATA_SOURCE_SCRIPT = """
+var grid = $('#jqxGrid');
+var dataFields = grid.jqxGrid('columns').records.filter(function (column) {
+    return !column.hidden;
+}).map(function (column) {
+    return column.datafield;
+});
+// First two visible columns are the company name and the ticker
+var nameField = dataFields[0];
+var tickerField = dataFields[1];
+dataFields = [tickerField, nameField].concat(dataFields.slice(2));
+
+return grid.jqxGrid('getrows').map(function (row, rowIndex) {
+    var boundIndex = row.boundindex === undefined ? rowIndex : row.boundindex;
+    return dataFields.map(function (dataField) {
+        var text = grid.jqxGrid('getcelltext', boundIndex, dataField);
+        if (text === undefined || text === null) {
+            text = row[dataField] === undefined || row[dataField] === null ? '' : row[dataField];
+        }
+        return String(text).trim();
+    });
+});
+"""
+
+# Jump directly to a page of the grid.
+#
+# arguments[0] : 0-based index of the page
+#
+# Returns whether the grid shows another page than before the jump, e.g., False
+# if the page, or the last page in place of a page after it, is already shown
+GO_TO_PAGE_SCRIPT = """
+var grid = $('#jqxGrid');
+var previousPage = grid.jqxGrid('getpaginginformation').pagenum;
+grid.jqxGrid('gotopage', arguments[0]);
+return previousPage !== grid.jqxGrid('getpaginginformation').pagenum;
+"""
+
+# Name of the tab the grid is showing, i.e., the one whose element (see
+# scrape_plan.tab_xpath) is marked as selected. Tabs are elements whose ids are
+# "columns_{tab name}" holding a link.
+#
+# Returns the name of the tab, null if no tab is marked as selected
+ACTIVE_TAB_SCRIPT = """
+var tabs = document.querySelectorAll("[id^='columns_']");
+for (var index = 0; index < tabs.length; index++) {
+    var link = tabs[index].querySelector('a');
+    var isSelected = ['active', 'selected'].some(function (className) {
+        return tabs[index].classList.contains(className)
+            || (link !== null && link.classList.contains(className));
+    }) || (link !== null && link.getAttribute('aria-selected') === 'true');
+    if (isSelected) {
+        return tabs[index].id.substring('columns_'.length);
+    }
+}
+return null;
+"""
+
+# Signature of what the grid shows: the pager text, the column headers (which
+# change with the tab) and the first row (which changes with the page).
+_GRID_SIGNATURE_FUNCTION = """
+function gridSignature() {
+    var parts = ['pagerjqxGrid', 'columntablejqxGrid', 'row0jqxGrid'].map(function (id) {
+        var element = document.getElementById(id);
+        return element === null ? '' : element.innerText;
+    });
+    return parts.join('|');
+}
+"""
+
+# Return the current signature of the grid, see _GRID_SIGNATURE_FUNCTION
+GRID_SIGNATURE_SCRIPT = _GRID_SIGNATURE_FUNCTION + """
+return gridSignature();
+"""
+
+# Wait (asynchronously) until the grid shows something else than the given
+# signature. Mutations of the grid are observed, hence the script returns as
+# soon as the grid is re-rendered instead of polling it. Since the observer is
+# notified after the rendering task is completed, all rows are rendered when
+# the script returns.
+#
+# arguments[0] : signature of the grid before the page or the tab is changed
+# arguments[1] : timeout in milliseconds
+#
+# Returns the milliseconds passed until the grid is re-rendered, -1 on timeout
+WAIT_FOR_GRID_CHANGE_SCRIPT = _GRID_SIGNATURE_FUNCTION + """
+var previousSignature = arguments[0];
+var timeout = arguments[1];
+var done = arguments[arguments.length - 1];
+var start = performance.now();
+
+if (gridSignature() !== previousSignature) {
+    done(0);
+    return;
+}
+
+var timer = null;
+var observer = new MutationObserver(function () {
+    if (gridSignature() !== previousSignature) {
+        observer.disconnect();
+        clearTimeout(timer);
+        done(performance.now() - start);
+    }
+});
+observer.observe(
+    document.getElementById('jqxGrid'),
+    {childList: true, subtree: true, characterData: true}
+);
+timer = setTimeout(function () {
+    observer.disconnect();
+    done(-1);
+}, timeout);
+"""
+
+# Replace the filters of the grid, so that only the matching rows are paged
+# through. Values of a text filter are ORed, bounds of a numeric filter and the
+# filters of different datafields are ANDed.
+#
+# arguments[0] : list of filters, see screener_filters.to_grid_filters
+#
+# Returns [number of rows before filtering, number of rows after filtering,
+# bound index of the first shown row before filtering, bound index of the first
+# shown row after filtering], a bound index is null if no row is shown
+APPLY_FILTERS_SCRIPT = """
+var grid = $('#jqxGrid');
+function firstShownRow() {
+    var paging = grid.jqxGrid('getpaginginformation');
+    var row = grid.jqxGrid('getrows')[paging.pagenum * paging.pagesize];
+    return row === undefined ? null : row.boundindex;
+}
+var numOfRowsBefore = grid.jqxGrid('getdatainformation').rowscount;
+var firstRowBefore = firstShownRow();
+grid.jqxGrid('clearfilters', false);
+arguments[0].forEach(function (gridFilter) {
+    var filterGroup = new $.jqx.filter();
+    var or = 1, and = 0;
+    if (gridFilter.values !== undefined) {
+        gridFilter.values.forEach(function (value) {
+            filterGroup.addfilter(or, filterGroup.createfilter('stringfilter', value, 'EQUAL'));
+        });
+    } else {
+        if (gridFilter.min !== null) {
+            filterGroup.addfilter(and, filterGroup.createfilter(
+                'numericfilter', gridFilter.min, 'GREATER_THAN_OR_EQUAL'
+            ));
+        }
+        if (gridFilter.max !== null) {
+            filterGroup.addfilter(and, filterGroup.createfilter(
+                'numericfilter', gridFilter.max, 'LESS_THAN_OR_EQUAL'
+            ));
+        }
+    }
+    grid.jqxGrid('addfilter', gridFilter.datafield, filterGroup);
+});
+grid.jqxGrid('applyfilters');
+return [
+    numOfRowsBefore, grid.jqxGrid('getdatainformation').rowscount, firstRowBefore, firstShownRow()
+];
+"""
+
+# Read the html of the grid (i.e., the column headers, the visible rows and the
+# pager) in a single call, it is parsed outside of the browser by grid_html.
+GRID_HTML_SCRIPT = """
+return document.getElementById('jqxGrid').outerHTML;
+"""
@@ -1,3 +1,4 @@
+from macrotrends_data_scrapper.utils.browser_session import BrowserSession
 from macrotrends_data_scrapper.utils.create_driver import create_driver
 
 
@@ -13,8 +14,26 @@ class DriverManager:
         Kill driver object
     """
 
-    def __init__(self):
-        self.driver = create_driver(logger_str="none")
+    def __init__(self, browser_session: BrowserSession = None, driver=None):
+        """Create the driver.
+
+        Parameters
+        ----------
+        browser_session : BrowserSession
+            if provided, the driver attaches to the long-lived browser of the
+            session (which is launched if it is not running) instead of
+            launching a new browser, and the browser keeps running after the
+            driver is killed.
+        driver : WebDriver
+            if provided, it is managed instead of creating a driver, e.g., an
+            in-process FakeDriver (see benchmark.fake_driver)
+        """
+        self.browser_session = browser_session
+        if driver is not None:
+            self.driver = driver
+            return
+        debugger_address = None if browser_session is None else browser_session.ensure_running()
+        self.driver = create_driver(logger_str="none", debugger_address=debugger_address)
 
     def set_up_driver(self, url):
         """Set up driver object for the url given.
@@ -29,6 +48,10 @@ class DriverManager:
 
     def kill_driver(self):
         """Kill driver object."""
+        if self.browser_session is not None:
+            # Only detach from the browser, it is reused by the next run
+            self.driver.quit()
+            return
         self.driver.close()
         self.driver.quit()
 
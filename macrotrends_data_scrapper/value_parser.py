@@ -0,0 +1,188 @@
+import argparse
+import csv
+import math
+import os
+from typing import Any
+
+import numpy as np
+
+from macrotrends_data_scrapper.map_of_value_types import MAP_OF_VALUE_TYPES
+
+# Strings shown in the table when a value is not available
+MISSING_VALUE_MARKERS = ["", "-", "--", "N/A", "NA", "n/a", "nan", "None"]
+
+# Magnitude suffixes of the "money" values, e.g., "$2.91T"
+MAGNITUDE_SUFFIXES = {"K": 1e3, "M": 1e6, "B": 1e9, "T": 1e12}
+
+NUMERIC_VALUE_TYPES = ("money", "percent", "number")
+
+
+def parse_column(values: list, value_type: str) -> np.ndarray:
+    """Parse the values of a column at once.
+
+    Parameters
+    ----------
+    values : list
+        values of the column as scrapped, e.g., ["$2.91T", "$512.3B", "-"]
+    value_type : str
+        type of the values, see MAP_OF_VALUE_TYPES
+
+    Returns
+    -------
+    parsed_values : np.ndarray
+        float array for the numeric types, where the missing or unparseable
+        values are NaN, e.g., [2.91e12, 5.123e11, nan]. Object array of the
+        values as they are for the "text" type.
+    """
+    if value_type == "text":
+        return np.asarray(values, dtype=object)
+    if value_type not in NUMERIC_VALUE_TYPES:
+        raise ValueError(
+            f"Unknown value type (={value_type}). Valid types are: "
+            f"{('text',) + NUMERIC_VALUE_TYPES}"
+        )
+
+    strings = np.char.strip(np.asarray(values, dtype=str))
+    is_missing = np.isin(strings, MISSING_VALUE_MARKERS)
+    for character in ("$", ",", "%", "+"):
+        strings = np.char.replace(strings, character, "")
+
+    multipliers = np.ones(strings.shape)
+    if value_type == "money":
+        for suffix, multiplier in MAGNITUDE_SUFFIXES.items():
+            multipliers[np.char.endswith(strings, suffix)] = multiplier
+        strings = np.char.rstrip(strings, "".join(MAGNITUDE_SUFFIXES))
+
+    strings = np.where(is_missing, "nan", strings)
+    try:
+        numbers = strings.astype(float)
+    except ValueError:
+        # Some values are not numbers at all, parse them one by one
+        numbers = np.array([_to_float(string) for string in strings], dtype=float)
+    return numbers * multipliers
+
+
+def parse_scrapped_data(scrapped_data: dict[str:dict[str:Any]]) -> dict:
+    """Parse the values of the scrapped data parameter by parameter.
+
+    Parameters
+    ----------
+    scrapped_data : dict
+        dictionary where keys are tickers, values are another dictionary
+        with key contain the name of the scrapped parameter and the value
+        containing the value of the scrapped parameter, as consumed by
+        DataRecorder.save_to_csv
+
+    Returns
+    -------
+    parsed_data : dict
+        scrapped data with the values of the numeric parameters converted to
+        floats, missing values are converted to None
+    """
+    parsed_data = {ticker: dict(company_data) for ticker, company_data in scrapped_data.items()}
+    numeric_params = {
+        param for company_data in scrapped_data.values() for param in company_data
+        if MAP_OF_VALUE_TYPES.get(param, "text") != "text"
+    }
+    for param in numeric_params:
+        tickers = [
+            ticker for ticker, company_data in scrapped_data.items() if param in company_data
+        ]
+        numbers = parse_column(
+            [scrapped_data[ticker][param] for ticker in tickers],
+            MAP_OF_VALUE_TYPES[param]
+        )
+        for ticker, number in zip(tickers, numbers.tolist()):
+            parsed_data[ticker][param] = None if math.isnan(number) else number
+    return parsed_data
+
+
+def parse_csv(input_csv_file: str, output_csv_file: str = None):
+    """Parse the numeric columns of a csv file written by the DataRecorder.
+
+    Parameters
+    ----------
+    input_csv_file : str
+        path to the csv file to be parsed
+    output_csv_file : str
+        path to the csv file where the parsed data is written. If None, the
+        input file is overwritten.
+    """
+    if output_csv_file is None:
+        output_csv_file = input_csv_file
+
+    with open(input_csv_file, "r", newline="") as csvfile:
+        reader = csv.reader(csvfile)
+        headers = next(reader)
+        rows = list(reader)
+    columns = [list(column) for column in zip(*rows)] if rows else [[] for _ in headers]
+
+    for column_index, header in enumerate(headers):
+        value_type = MAP_OF_VALUE_TYPES.get(header, "text")
+        if value_type == "text":
+            continue
+        numbers = parse_column(columns[column_index], value_type)
+        columns[column_index] = [
+            "" if math.isnan(number) else number for number in numbers.tolist()
+        ]
+
+    temp_file = output_csv_file + ".temp"
+    with open(temp_file, "w", newline="") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(headers)
+        writer.writerows(zip(*columns))
+    os.replace(temp_file, output_csv_file)
+
+
+class ValueParsingRecorder:
+    """Wraps a data recorder such that the values are parsed before they are saved.
+
+    Attributes
+    ----------
+    data_recorder : DataRecorder
+        recorder to which the parsed data is saved
+    """
+
+    def __init__(self, data_recorder):
+        self.data_recorder = data_recorder
+
+    @property
+    def saves_are_durable(self) -> bool:
+        """Whether the wrapped recorder writes the saved data to the disk immediately."""
+        return self.data_recorder.saves_are_durable
+
+    def save_to_csv(self, scrapped_data: dict[str:dict[str:Any]], ticker_column_str: str = None):
+        """Parse scrapped data and save it with the wrapped recorder."""
+        self.data_recorder.save_to_csv(parse_scrapped_data(scrapped_data), ticker_column_str)
+
+    def flush(self):
+        """Flush the wrapped recorder."""
+        self.data_recorder.flush()
+
+
+def _to_float(string: str) -> float:
+    """Convert a string to float, NaN if it is not a number."""
+    try:
+        return float(string)
+    except ValueError:
+        return math.nan
+
+
+def main():
+    """Parse the numeric columns of a csv file."""
+    parser = argparse.ArgumentParser(
+        description="Parse the numeric columns of a csv file of scrapped data"
+    )
+    parser.add_argument("input_csv", type=str, help="Path to the csv file to be parsed")
+    parser.add_argument(
+        "--output-csv",
+        type=str,
+        default=None,
+        help="Path to the parsed csv file, input file is overwritten if not provided"
+    )
+    args = parser.parse_args()
+    parse_csv(args.input_csv, args.output_csv)
+
+
+if __name__ == "__main__":
+    main()
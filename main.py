@@ -2,7 +2,17 @@ import argparse
 import json
 import os
 
+from macrotrends_data_scrapper.data_recorder import (
+    DataRecorder,
+    IndexedDataRecorder,
+    JournalDataRecorder,
+)
+from macrotrends_data_scrapper.http_scrapper import HttpTableScrapper
+from macrotrends_data_scrapper.parquet_recorder import ParquetDataRecorder
 from macrotrends_data_scrapper.scrap_the_table import TableScrapper
+from macrotrends_data_scrapper.snapshot_replay import SnapshotReplayer
+from macrotrends_data_scrapper.sqlite_recorder import SQLiteDataRecorder
+from macrotrends_data_scrapper.traversal_planner import TRAVERSAL_STRATEGIES
 
 
 def main():
@@ -14,6 +24,20 @@ def main():
         type=str,
         help="Path to the JSON file where the parameters to be scrapped is listed."
     )
+    parser.add_argument(
+        "--filters-path",
+        dest="filters_path",
+        type=str,
+        help="Path to the JSON file where the filters of the companies to be scrapped are "
+             "listed, e.g., {\"Country\": \"USA\", \"Market Cap\": {\"min\": 10000}}"
+    )
+    parser.add_argument(
+        "--tickers-path",
+        dest="tickers_path",
+        type=str,
+        help="Path to the JSON file where the tickers to be refreshed are listed. Only "
+             "these companies are scrapped and their rows in the output CSV file are updated"
+    )
     parser.add_argument(
         "--output-csv",
         type=str,
@@ -29,18 +53,208 @@ def main():
         choices=["none", "info", "debug"],
     )
 
+    parser.add_argument(
+        "--backend",
+        dest="backend",
+        help="Backend used to scrap the table, one of [\"selenium\", \"http\", \"replay\"]. "
+             "\"http\" fetches the table data without launching a browser, \"replay\" "
+             "scraps the grid snapshots in --snapshot-dir recorded by the selenium backend",
+        default="selenium",
+        choices=["selenium", "http", "replay"],
+    )
+    parser.add_argument(
+        "--extraction-mode",
+        dest="extraction_mode",
+        help="How the table cells are read from the website, one of "
+             f"{list(TableScrapper.EXTRACTION_MODES)}",
+        default="element",
+        choices=TableScrapper.EXTRACTION_MODES,
+    )
+    parser.add_argument(
+        "--traversal",
+        dest="traversal_strategy",
+        help="Order in which the pages and the tabs of the table are traversed, one of "
+             f"{list(TRAVERSAL_STRATEGIES)}. \"page-major\" visits every tab of a page before "
+             "the next page, \"tab-major\" visits every page on a tab before the next tab, "
+             "\"auto\" picks the faster one by the wait times measured on the first page",
+        default="page-major",
+        choices=TRAVERSAL_STRATEGIES,
+    )
+    parser.add_argument(
+        "--output-format",
+        dest="output_format",
+        help="Format of the output file, one of [\"csv\", \"parquet\"]. \"parquet\" writes "
+             "the output CSV file name with the .parquet extension as a compressed columnar "
+             "file, one row group per page, and ignores --recorder",
+        default="csv",
+        choices=["csv", "parquet"],
+    )
+    parser.add_argument(
+        "--recorder",
+        dest="recorder",
+        help="How the scrapped data is recorded, one of "
+             "[\"csv\", \"indexed\", \"journal\", \"sqlite\"]. "
+             "\"csv\" updates the output file after every page, \"indexed\" keeps the "
+             "data in memory and writes the output file every --checkpoint-every pages "
+             "and at the end, \"journal\" additionally appends every page to a journal "
+             "file which is replayed if the scrapping is terminated unexpectedly, "
+             "\"sqlite\" upserts every page into an SQLite database next to the output "
+             "file and exports the database to the output file at the end",
+        default="csv",
+        choices=["csv", "indexed", "journal", "sqlite"],
+    )
+    parser.add_argument(
+        "--checkpoint-every",
+        dest="checkpoint_every",
+        type=int,
+        default=None,
+        help="Number of pages after which the \"indexed\" and \"journal\" recorders "
+             "write the output file"
+    )
+    parser.add_argument(
+        "--parse-values",
+        dest="parse_values",
+        action="store_true",
+        help="Parse the values of the numeric parameters into numbers before saving them, "
+             "e.g., \"$2.91T\" is saved as 2910000000000.0"
+    )
+    parser.add_argument(
+        "--pipelined",
+        action="store_true",
+        help="Write the scrapped pages to the output file in a background thread while "
+             "the next pages are scrapped"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue a terminated scrapping of the same parameters from the page after "
+             "the last page saved to the output file"
+    )
+    parser.add_argument(
+        "--persistent-session",
+        dest="persistent_session",
+        action="store_true",
+        help="Reuse a long-lived browser with a persistent profile across runs instead of "
+             "launching a new browser at every run"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of browser sessions scrapping the pages in parallel, or the number of "
+             "processes parsing the snapshots with the replay backend"
+    )
+    parser.add_argument(
+        "--snapshot-dir",
+        dest="snapshot_dir",
+        type=str,
+        help="Directory of the grid snapshots. The selenium backend records the html of the "
+             "grid for every page and tab to it, the replay backend scraps the recorded "
+             "snapshots again without a browser"
+    )
+
     args = parser.parse_args()
+    if args.tickers_path and args.backend == "http":
+        parser.error("--tickers-path is only supported by the selenium backend, "
+                     "the http backend fetches the whole table by a single request anyway")
+    if args.backend == "http":
+        # http backend always writes the whole table to the output CSV file at once
+        ignored_options = [
+            option for option, is_set in [
+                ("--output-format parquet", args.output_format == "parquet"),
+                ("--recorder", args.recorder != "csv"),
+                ("--pipelined", args.pipelined),
+                ("--parse-values", args.parse_values),
+                ("--resume", args.resume),
+            ] if is_set
+        ]
+        if ignored_options:
+            parser.error(f"the http backend does not support {', '.join(ignored_options)}, "
+                         "it writes the raw values of the whole table to the output CSV file "
+                         "at once")
+    if args.tickers_path and args.output_format == "parquet":
+        parser.error("--tickers-path is not supported by the parquet output format, which "
+                     "overwrites the whole file with the refreshed tickers only")
+    if args.resume and args.output_format == "parquet":
+        parser.error("--resume is not supported by the parquet output format, which "
+                     "overwrites the pages saved before the scrapping was terminated")
+    if args.backend == "replay":
+        if not args.snapshot_dir:
+            parser.error("--snapshot-dir is required by the replay backend")
+        if args.tickers_path or args.filters_path:
+            parser.error("--tickers-path and --filters-path are not supported by the replay "
+                         "backend, every recorded page is scrapped")
+
+    if args.backend == "selenium":
+        # Browser boots in the background while the parameters are read or selected on the GUI
+        scrapper = TableScrapper(
+            str_logger=args.logger_level,
+            extraction_mode=args.extraction_mode,
+            persistent_session=args.persistent_session,
+            traversal_strategy=args.traversal_strategy,
+        )
 
     if args.params_path:
         parameters_to_be_scrapped = _read_strings_from_json(args.params_path)
     else:
         parameters_to_be_scrapped = None
+    filters = _read_filters_from_json(args.filters_path) if args.filters_path else None
 
-    scrapper = TableScrapper(str_logger=args.logger_level)
-    scrapper.scrap_the_table(
-        parameters_to_be_scrapped=parameters_to_be_scrapped,
-        csv_file=args.output_csv,
-    )
+    if args.backend == "http":
+        scrapper = HttpTableScrapper(str_logger=args.logger_level)
+        scrapper.scrap_the_table(
+            parameters_to_be_scrapped=parameters_to_be_scrapped,
+            csv_file=args.output_csv,
+            filters=filters,
+        )
+    elif args.backend == "replay":
+        # Parameters of the recording are replayed if none is provided
+        scrapper = SnapshotReplayer(
+            args.snapshot_dir, str_logger=args.logger_level, processes=args.workers
+        )
+        scrapper.scrap_the_table(
+            parameters_to_be_scrapped=parameters_to_be_scrapped,
+            csv_file=args.output_csv,
+            data_recorder=_create_data_recorder(args),
+            parse_values=args.parse_values,
+        )
+    elif args.tickers_path:
+        scrapper.refresh_tickers(
+            tickers=_read_strings_from_json(args.tickers_path),
+            parameters_to_be_scrapped=parameters_to_be_scrapped,
+            csv_file=args.output_csv,
+            data_recorder=_create_data_recorder(args),
+            parse_values=args.parse_values,
+            ticker_positions_file=args.output_csv + ".positions",
+        )
+    else:
+        scrapper.scrap_the_table(
+            parameters_to_be_scrapped=parameters_to_be_scrapped,
+            csv_file=args.output_csv,
+            workers=args.workers,
+            data_recorder=_create_data_recorder(args),
+            parse_values=args.parse_values,
+            resume=args.resume,
+            pipelined=args.pipelined,
+            filters=filters,
+            snapshot_dir=args.snapshot_dir,
+            ticker_positions_file=args.output_csv + ".positions",
+        )
+
+
+def _create_data_recorder(args) -> DataRecorder:
+    """Create the data recorder selected by the arguments."""
+    if args.output_format == "parquet":
+        return ParquetDataRecorder(args.output_csv, typed_values=args.parse_values)
+    if args.recorder == "indexed":
+        return IndexedDataRecorder(args.output_csv, checkpoint_every=args.checkpoint_every)
+    if args.recorder == "journal":
+        if args.checkpoint_every is None:
+            return JournalDataRecorder(args.output_csv)
+        return JournalDataRecorder(args.output_csv, checkpoint_every=args.checkpoint_every)
+    if args.recorder == "sqlite":
+        return SQLiteDataRecorder(args.output_csv)
+    return DataRecorder(args.output_csv)
 
 
 def _read_strings_from_json(json_file):
@@ -50,6 +264,13 @@ def _read_strings_from_json(json_file):
     return strings_list
 
 
+def _read_filters_from_json(json_file):
+    """Read the filters of the companies from a JSON file."""
+    with open(_create_absolute_file_path(json_file), 'r') as file:
+        filters = json.load(file)
+    return filters
+
+
 def _create_absolute_file_path(path_relative):
     """Given a path relative to the main.py, construct the absolute path."""
     directory_path = os.path.dirname(os.path.abspath(__file__))
@@ -0,0 +1,104 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from macrotrends_data_scrapper.utils.browser_session import BrowserSession
+
+
+class _DebuggerRequestHandler(BaseHTTPRequestHandler):
+    """Respond as the remote debugging interface of a browser."""
+
+    def do_GET(self):  # noqa: N802 (name is required by BaseHTTPRequestHandler)
+        """Respond to /json/version only."""
+        self.send_response(200 if self.path == "/json/version" else 404)
+        self.end_headers()
+        self.wfile.write(b'{"Browser": "Chrome/120.0"}')
+
+    def log_message(self, format, *args):
+        """Do not log the requests."""
+
+
+class TestBrowserSession(unittest.TestCase):
+    """Class to be used to test BrowserSession class without launching a browser.
+
+    Methods
+    -------
+    test_attach_to_healthy_session():
+        check if a healthy and young browser is reused
+
+    test_expired_session_is_relaunched():
+        check if an expired browser is terminated and a new one is launched
+
+    test_process_of_other_profile_is_not_killed():
+        check if a process reusing the process id of the browser is left running
+    """
+
+    def setUp(self):
+        """Set up a stand-in debugging interface and a temporary session directory."""
+        self.server = HTTPServer(("127.0.0.1", 0), _DebuggerRequestHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.session_dir = tempfile.TemporaryDirectory()
+        self.browser_session = BrowserSession(
+            session_dir=self.session_dir.name,
+            port=self.server.server_port,
+            max_age=60,
+            chrome_binary="non-existent-browser-binary",
+        )
+
+    def tearDown(self):
+        """Shut down the stand-in server and remove the session directory."""
+        self.server.shutdown()
+        self.server.server_close()
+        self.session_dir.cleanup()
+
+    def _write_session_file(self, pid, started_at):
+        with open(self.browser_session.session_file_name, "w") as session_file:
+            json.dump(
+                {"pid": pid, "port": self.server.server_port, "started_at": started_at},
+                session_file
+            )
+
+    def test_attach_to_healthy_session(self):
+        """Check if a healthy and young browser is reused."""
+        self._write_session_file(pid=os.getpid(), started_at=time.time())
+        self.assertEqual(
+            self.browser_session.ensure_running(), f"127.0.0.1:{self.server.server_port}"
+        )
+
+    def test_expired_session_is_relaunched(self):
+        """Check if an expired browser is terminated and a new one is launched."""
+        stand_in_browser = subprocess.Popen([
+            sys.executable, "-c", "import time; time.sleep(60)",
+            f"--user-data-dir={self.browser_session.profile_dir}",
+        ])
+        self._write_session_file(pid=stand_in_browser.pid, started_at=time.time() - 120)
+
+        # Launching fails since the browser binary does not exist
+        with self.assertRaises(FileNotFoundError):
+            self.browser_session.ensure_running()
+
+        self.assertIsNotNone(stand_in_browser.wait(timeout=10))
+        self.assertFalse(os.path.exists(self.browser_session.session_file_name))
+
+    def test_process_of_other_profile_is_not_killed(self):
+        """Check if a process reusing the process id of the browser is left running."""
+        other_process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+        self.addCleanup(other_process.wait)
+        self.addCleanup(other_process.kill)
+        self._write_session_file(pid=other_process.pid, started_at=time.time() - 120)
+
+        with self.assertRaises(FileNotFoundError):
+            self.browser_session.ensure_running()
+
+        self.assertIsNone(other_process.poll())
+        self.assertFalse(os.path.exists(self.browser_session.session_file_name))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,9 @@
 import unittest
-from macrotrends_data_scrapper.utils.create_driver import create_driver
+from macrotrends_data_scrapper.utils.create_driver import (
+    RESOURCE_TYPE_URL_PATTERNS,
+    _get_blocked_url_patterns,
+    create_driver,
+)
 from macrotrends_data_scrapper.utils.Logger import Logger
 import selenium
 
@@ -11,6 +15,9 @@ class TestCreateDriver(unittest.TestCase):
     -------
     test_create_drivers():
         check if the created driver object is WebDriver object
+
+    test_get_blocked_url_patterns():
+        check if the blocked resource types are converted to url patterns
     """
 
     def setUp(self) -> None:
@@ -25,6 +32,21 @@ class TestCreateDriver(unittest.TestCase):
         driver.close()
         driver.quit()
 
+    def test_get_blocked_url_patterns(self):
+        """Check if the blocked resource types are converted to url patterns."""
+        options_dict = {
+            "blocked_resource_types": ["font"],
+            "blocked_url_patterns": ["*doubleclick.net*"],
+        }
+        self.assertEqual(
+            _get_blocked_url_patterns(options_dict),
+            RESOURCE_TYPE_URL_PATTERNS["font"] + ["*doubleclick.net*"]
+        )
+
+        # Unknown resource types are not silently ignored
+        with self.assertRaises(KeyError):
+            _get_blocked_url_patterns({"blocked_resource_types": ["video"]})
+
 
 if __name__ == "__main__":
     unittest.main(warnings='ignore')
@@ -2,7 +2,11 @@ import csv
 import os
 import unittest
 
-from macrotrends_data_scrapper.data_recorder import DataRecorder
+from macrotrends_data_scrapper.data_recorder import (
+    DataRecorder,
+    IndexedDataRecorder,
+    JournalDataRecorder,
+)
 
 
 class TestDataRecorder(unittest.TestCase):
@@ -42,3 +46,147 @@ class TestDataRecorder(unittest.TestCase):
             rows = list(reader)
             self.assertEqual(len(rows), 2)
             self.assertEqual(rows[0]['Ticker'], 'AAPL')
+
+
+class TestIndexedDataRecorder(unittest.TestCase):
+    """Unit tests for the IndexedDataRecorder class."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.csv_file_name = "test_indexed_data.csv"
+        self.reference_csv_file_name = "test_reference_data.csv"
+
+    def tearDown(self):
+        """Tear down the test environment."""
+        for file_name in (self.csv_file_name, self.reference_csv_file_name):
+            if os.path.exists(file_name):
+                os.remove(file_name)
+
+    def test_save_to_csv_writes_on_flush(self):
+        """Check that the data is written to the file only when flushed."""
+        data_recorder = IndexedDataRecorder(self.csv_file_name)
+        data_recorder.save_to_csv({"AAPL": {"name": "Apple", "MarketCap": 100}})
+        self.assertFalse(os.path.exists(self.csv_file_name))
+
+        data_recorder.flush()
+        with open(self.csv_file_name, "r", newline="") as file:
+            rows = list(csv.DictReader(file))
+        self.assertEqual(rows, [{"Ticker": "AAPL", "name": "Apple", "MarketCap": "100"}])
+
+    def test_save_to_csv_with_checkpoints(self):
+        """Check that the data is flushed after every checkpoint_every saves."""
+        data_recorder = IndexedDataRecorder(self.csv_file_name, checkpoint_every=2)
+        data_recorder.save_to_csv({"AAPL": {"MarketCap": 100}})
+        self.assertFalse(os.path.exists(self.csv_file_name))
+        data_recorder.save_to_csv({"GOOGL": {"MarketCap": 200}})
+        self.assertTrue(os.path.exists(self.csv_file_name))
+
+    def test_same_output_as_data_recorder(self):
+        """Check that the output matches the one of DataRecorder, including an existing file."""
+        with open(self.csv_file_name, "w", newline="") as file:
+            file.write("Ticker,name,MarketCap\nAAPL,Apple,100\nMSFT,Microsoft,150\n")
+        with open(self.reference_csv_file_name, "w", newline="") as file:
+            file.write("Ticker,name,MarketCap\nAAPL,Apple,100\nMSFT,Microsoft,150\n")
+
+        pages = [
+            {"AAPL": {"name": "Apple", "MarketCap": 110}, "GOOGL": {"name": "Alphabet"}},
+            {"MSFT": {"Dividend": 0.8}, "AMZN": {"name": "Amazon", "Dividend": 0}},
+        ]
+        data_recorder = IndexedDataRecorder(self.csv_file_name)
+        reference_data_recorder = DataRecorder(self.reference_csv_file_name)
+        for page in pages:
+            data_recorder.save_to_csv(page)
+            reference_data_recorder.save_to_csv(page)
+        data_recorder.flush()
+
+        with open(self.csv_file_name, "r", newline="") as file:
+            rows = list(csv.DictReader(file))
+        with open(self.reference_csv_file_name, "r", newline="") as file:
+            reference_rows = list(csv.DictReader(file))
+        self.assertEqual(rows, reference_rows)
+
+
+class TestJournalDataRecorder(unittest.TestCase):
+    """Unit tests for the JournalDataRecorder class."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.csv_file_name = "test_journal_data.csv"
+        self.journal_file_name = self.csv_file_name + ".journal"
+
+    def tearDown(self):
+        """Tear down the test environment."""
+        for file_name in (self.csv_file_name, self.journal_file_name):
+            if os.path.exists(file_name):
+                os.remove(file_name)
+
+    def test_save_to_csv_appends_to_journal(self):
+        """Check that every save appends a record to the journal, not to the csv file."""
+        data_recorder = JournalDataRecorder(self.csv_file_name)
+        data_recorder.save_to_csv({"AAPL": {"MarketCap": 100}})
+        data_recorder.save_to_csv({"GOOGL": {"MarketCap": 200}})
+
+        self.assertFalse(os.path.exists(self.csv_file_name))
+        with open(self.journal_file_name, "r") as file:
+            self.assertEqual(len(file.readlines()), 2)
+
+    def test_flush_compacts_journal(self):
+        """Check that flushing writes the csv file and removes the journal."""
+        data_recorder = JournalDataRecorder(self.csv_file_name)
+        data_recorder.save_to_csv({"AAPL": {"MarketCap": 100}})
+        data_recorder.flush()
+
+        self.assertFalse(os.path.exists(self.journal_file_name))
+        with open(self.csv_file_name, "r", newline="") as file:
+            rows = list(csv.DictReader(file))
+        self.assertEqual(rows, [{"Ticker": "AAPL", "MarketCap": "100"}])
+
+    def test_journal_is_replayed_after_termination(self):
+        """Check that the data of a terminated run is recovered from the journal."""
+        data_recorder = JournalDataRecorder(self.csv_file_name)
+        data_recorder.save_to_csv({"AAPL": {"MarketCap": 100}})
+        data_recorder.save_to_csv({"GOOGL": {"MarketCap": 200}})
+        del data_recorder  # terminated before the journal is compacted
+
+        # A partially written record at the end of the journal is dropped
+        with open(self.journal_file_name, "a") as file:
+            file.write('{"ticker_column": "Ticker", "da')
+
+        data_recorder = JournalDataRecorder(self.csv_file_name)
+        data_recorder.save_to_csv({"AAPL": {"Dividend": 0.5}})
+        del data_recorder  # terminated again, journal is appended after the partial record
+
+        data_recorder = JournalDataRecorder(self.csv_file_name)
+        data_recorder.flush()
+
+        with open(self.csv_file_name, "r", newline="") as file:
+            rows = list(csv.DictReader(file))
+        self.assertEqual(
+            rows,
+            [
+                {"Ticker": "AAPL", "MarketCap": "100", "Dividend": "0.5"},
+                {"Ticker": "GOOGL", "MarketCap": "200", "Dividend": ""},
+            ]
+        )
+
+    def test_journal_ending_with_partial_character(self):
+        """Check that a record cut in the middle of a multi-byte character is dropped."""
+        with open(self.journal_file_name, "wb") as file:
+            file.write('{"ticker_column": "Ticker", "data": {"AAPL": {"name": "A"}}}\n'.encode())
+            partial_record = '{"ticker_column": "Ticker", "data": {"NESN": {"name": "Nestlé'
+            file.write(partial_record.encode()[:-1])
+
+        data_recorder = JournalDataRecorder(self.csv_file_name)
+        data_recorder.save_to_csv({"MSFT": {"name": "Microsoft"}})
+        data_recorder.flush()
+
+        with open(self.csv_file_name, "r", newline="") as file:
+            rows = list(csv.DictReader(file))
+        self.assertEqual(
+            rows, [{"Ticker": "AAPL", "name": "A"}, {"Ticker": "MSFT", "name": "Microsoft"}]
+        )
+
+    def test_del_after_failed_init(self):
+        """Check that deleting a recorder whose __init__ has failed does not raise."""
+        data_recorder = JournalDataRecorder.__new__(JournalDataRecorder)
+        data_recorder.__del__()
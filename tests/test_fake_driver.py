@@ -0,0 +1,206 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from macrotrends_data_scrapper.benchmark.fake_driver import FakeDriver
+from macrotrends_data_scrapper.benchmark.run_benchmark import run_benchmark
+from macrotrends_data_scrapper.benchmark.standin_data import generate_records
+from macrotrends_data_scrapper.scrap_checkpoint import ScrapCheckpoint
+from macrotrends_data_scrapper.scrap_the_table import TableScrapper
+from macrotrends_data_scrapper.utils.grid_scripts import GO_TO_PAGE_SCRIPT
+from macrotrends_data_scrapper.utils.manage_driver import DriverManager
+
+PARAMETERS = ["Market Cap", "P/E Ratio", "Exchange", "Return on Assets"]
+
+
+class TestFakeDriver(unittest.TestCase):
+    """Class to be used to test the elements and the scripts of the fake driver.
+
+    Methods
+    -------
+    test_find_elements():
+        check if the cells of the grid are found by the XPaths of the scrapper
+
+    test_unknown_locators():
+        check if the locators which are not emulated are rejected
+
+    test_go_to_page():
+        check if jumping to a page reports whether another page is shown
+
+    test_driver_manager():
+        check if the fake driver is managed instead of creating a driver
+    """
+
+    def setUp(self):
+        """Create a fake driver showing a few records."""
+        self.records = generate_records(45, params=PARAMETERS)
+        self.driver = FakeDriver(self.records)
+
+    def test_find_elements(self):
+        """Check if the cells of the grid are found by the XPaths of the scrapper."""
+        ticker = self.driver.find_elements(By.XPATH, "// *[ @ id = 'row1jqxGrid'] / div[2] / div")
+        self.assertEqual(ticker[0].text, "B")
+        pager = self.driver.find_elements(By.XPATH, "//*[@id='pagerjqxGrid']/div/div[6]")
+        self.assertEqual(pager[0].text, "1-20 of 45")
+
+        self.driver.find_element(
+            By.XPATH, "/html/body/div[1]/div[4]/div[2]/div/div/div/div/div[10]/div/div[4]/div"
+        ).click()
+        self.assertEqual(pager[0].text, "1-20 of 45")  # elements are not live
+        self.assertEqual(
+            self.driver.find_elements(By.XPATH, "//*[@id='pagerjqxGrid']/div/div[6]")[0].text,
+            "21-40 of 45"
+        )
+        # Rows after the last one of the page are not shown
+        self.assertEqual(
+            self.driver.find_elements(By.XPATH, "//*[@id='row20jqxGrid']/div[2]/div"), []
+        )
+        self.assertEqual(self.driver.commands["find_elements"], 4)
+
+    def test_unknown_locators(self):
+        """Check if the locators which are not emulated are rejected."""
+        with self.assertRaises(ValueError):
+            self.driver.find_elements(By.XPATH, "//*[@id='other']")
+        with self.assertRaises(ValueError):
+            self.driver.find_elements(By.ID, "jqxGrid")
+        with self.assertRaises(ValueError):
+            self.driver.execute_script("return 1;")
+        with self.assertRaises(NoSuchElementException):
+            self.driver.find_element(By.XPATH, "//*[@id='columns_other']/a")
+
+    def test_go_to_page(self):
+        """Check if jumping to a page reports whether another page is shown."""
+        self.assertTrue(self.driver.execute_script(GO_TO_PAGE_SCRIPT, 2))
+        self.assertFalse(self.driver.execute_script(GO_TO_PAGE_SCRIPT, 2))
+        # Pages after the last one are clamped to the last page, which is already shown
+        self.assertFalse(self.driver.execute_script(GO_TO_PAGE_SCRIPT, 5))
+        self.assertEqual(
+            self.driver.find_elements(By.XPATH, "//*[@id='pagerjqxGrid']/div/div[6]")[0].text,
+            "41-45 of 45"
+        )
+        self.assertTrue(self.driver.execute_script(GO_TO_PAGE_SCRIPT, -1))
+
+    def test_driver_manager(self):
+        """Check if the fake driver is managed instead of creating a driver."""
+        driver_manager = DriverManager(driver=self.driver)
+        driver_manager.set_up_driver("about:blank")
+        self.assertEqual(self.driver.current_url, "about:blank")
+        driver_manager.kill_driver()
+        self.assertEqual(self.driver.commands["quit"], 1)
+
+
+class TestScrapThroughFakeDriver(unittest.TestCase):
+    """Class to be used to test scrapping the fake grid without a browser.
+
+    Methods
+    -------
+    test_extraction_modes():
+        check if every extraction mode and traversal strategy scraps the same pages
+
+    test_workers_and_filters():
+        check if the workers and the filters are served by the fake driver
+
+    test_resume():
+        check if a checkpoint is resumed only if the rows are paged the same
+
+    test_run_benchmark():
+        check if the engines are benchmarked through the fake driver
+    """
+
+    def setUp(self):
+        """Generate the records of the fake grid."""
+        self.records = generate_records(45, params=PARAMETERS)
+
+    def _scrap(self, workers: int = 1, filters: dict = None, **kwargs) -> dict:
+        """Scrap the fake grid and merge its pages."""
+        scrapper = TableScrapper(
+            str_logger="none",
+            boot_in_background=False,
+            driver_factory=lambda: FakeDriver(self.records),
+            **kwargs
+        )
+        return {
+            ticker: company_attr
+            for company_attr_page in scrapper.iter_pages(PARAMETERS, workers, filters=filters)
+            for ticker, company_attr in company_attr_page.items()
+        }
+
+    def test_extraction_modes(self):
+        """Check if every extraction mode and traversal strategy scraps the same pages."""
+        expected_company_attr_dict = self._scrap()
+        self.assertEqual(len(expected_company_attr_dict), 45)
+        self.assertEqual(
+            expected_company_attr_dict["A"]["Exchange"], self.records[0]["exchange"]
+        )
+        self.assertTrue(expected_company_attr_dict["A"]["Market Cap"].startswith("$"))
+
+        for extraction_mode in TableScrapper.EXTRACTION_MODES:
+            for traversal_strategy in ("page-major", "tab-major"):
+                with self.subTest(
+                    extraction_mode=extraction_mode, traversal_strategy=traversal_strategy
+                ):
+                    self.assertEqual(
+                        self._scrap(
+                            extraction_mode=extraction_mode,
+                            traversal_strategy=traversal_strategy,
+                        ),
+                        expected_company_attr_dict
+                    )
+
+    def test_workers_and_filters(self):
+        """Check if the workers and the filters are served by the fake driver."""
+        self.assertEqual(len(self._scrap(workers=2)), 45)
+
+        company_attr_dict = self._scrap(filters={"Exchange": "NYSE"})
+        self.assertEqual(
+            list(company_attr_dict),
+            [record["ticker"] for record in self.records if record["exchange"] == "NYSE"]
+        )
+
+    def test_resume(self):
+        """Check if a checkpoint is resumed only if the rows are paged the same."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_file = os.path.join(temp_dir, "Output.csv")
+            for num_of_rows, expected_num_of_pages in [(45, 2), (46, 3)]:
+                with self.subTest(num_of_rows=num_of_rows):
+                    # First page is committed when the table had num_of_rows rows
+                    checkpoint = ScrapCheckpoint(csv_file + ".checkpoint", PARAMETERS)
+                    checkpoint.load(20, num_of_rows)
+                    checkpoint.commit(0)
+                    checkpoint.save()
+
+                    scrapper = TableScrapper(
+                        str_logger="none",
+                        boot_in_background=False,
+                        driver_factory=lambda: FakeDriver(self.records),
+                    )
+                    data_recorder = mock.Mock(saves_are_durable=True)
+                    scrapper.scrap_the_table(
+                        PARAMETERS, csv_file=csv_file, data_recorder=data_recorder, resume=True
+                    )
+                    self.assertEqual(
+                        data_recorder.save_to_csv.call_count, expected_num_of_pages
+                    )
+                    self.assertFalse(os.path.exists(csv_file + ".checkpoint"))
+
+    def test_run_benchmark(self):
+        """Check if the engines are benchmarked through the fake driver."""
+        results = list(run_benchmark(
+            [45], engines=["element", "bulk", "html"], parameters=PARAMETERS, fake_driver=True
+        ))
+        self.assertEqual([result["rows"] for result in results], [45, 45, 45])
+        # Every cell is read by a separate command in "element" extraction mode
+        self.assertGreater(results[0]["driver_commands"], 45 * len(PARAMETERS))
+        self.assertLess(results[1]["driver_commands"], 45)
+        self.assertEqual(results[2]["driver_commands"], results[1]["driver_commands"])
+
+        with self.assertRaises(ValueError):
+            list(run_benchmark([45], engines=["http"], fake_driver=True))
+
+
+if __name__ == "__main__":
+    unittest.main()
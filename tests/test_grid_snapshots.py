@@ -0,0 +1,244 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from macrotrends_data_scrapper.benchmark.fake_driver import FakeDriver
+from macrotrends_data_scrapper.benchmark.standin_data import generate_records
+from macrotrends_data_scrapper.grid_html import etree, parse_pager, parse_row_matrix
+from macrotrends_data_scrapper.grid_snapshots import (
+    MANIFEST_FILE_NAME,
+    GridSnapshotRecorder,
+    list_snapshot_files,
+    read_manifest,
+    read_snapshot,
+)
+from macrotrends_data_scrapper.scrap_the_table import TableScrapper
+from macrotrends_data_scrapper.snapshot_replay import SnapshotReplayer
+from macrotrends_data_scrapper.utils.grid_scripts import (
+    GO_TO_PAGE_SCRIPT,
+    GRID_HTML_SCRIPT,
+    SCRAP_VISIBLE_ROWS_SCRIPT,
+)
+
+RECORDED_PARAMETERS = ["Market Cap", "Exchange"]
+# Parameters on the recorded tabs which are not scrapped while recording
+REPLAYED_PARAMETERS = ["Market Cap", "P/E Ratio", "Exchange", "Country"]
+
+
+@unittest.skipIf(etree is None, "lxml is not installed")
+class TestGridHtml(unittest.TestCase):
+    """Class to be used to test parsing the html of the grid.
+
+    Methods
+    -------
+    test_parse_row_matrix():
+        check if the rows are parsed as the browser-side script reads them
+
+    test_parse_nested_markup():
+        check if the text of the cells is read with its whitespace collapsed
+    """
+
+    def test_parse_row_matrix(self):
+        """Check if the rows are parsed as the browser-side script reads them."""
+        driver = FakeDriver(generate_records(45))
+        for page_num in range(3):
+            driver.execute_script(GO_TO_PAGE_SCRIPT, page_num)
+            grid_html = driver.execute_script(GRID_HTML_SCRIPT)
+            with self.subTest(page_num=page_num):
+                self.assertEqual(
+                    parse_row_matrix(grid_html),
+                    driver.execute_script(SCRAP_VISIBLE_ROWS_SCRIPT, 20)
+                )
+        self.assertEqual(parse_pager(grid_html), (41, 45, 45))
+
+    def test_parse_nested_markup(self):
+        """Check if the text of the cells is read with its whitespace collapsed."""
+        grid_html = (
+            '<div id="jqxGrid"><div id="row0jqxGrid"><!-- comment -->'
+            '<div><div><div><a> Apple\n  Inc </a></div></div></div>'
+            '<div><div><b>AAPL</b></div></div>'
+            '<div><div>$2.91T</div></div>'
+            '<div></div>'
+            '</div></div>'
+        )
+        self.assertEqual(
+            parse_row_matrix(grid_html, num_of_rows=1), [["AAPL", "Apple Inc", "$2.91T", ""]]
+        )
+
+
+class TestGridSnapshotRecorder(unittest.TestCase):
+    """Class to be used to test writing the snapshots of the grid.
+
+    Methods
+    -------
+    test_save():
+        check if the snapshots are listed by their pages and tabs
+
+    test_clear():
+        check if the snapshots of a previous recording are removed
+    """
+
+    def setUp(self):
+        """Create a temporary snapshot directory."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.snapshot_dir = os.path.join(temp_dir.name, "snapshots")
+
+    def test_save(self):
+        """Check if the snapshots are listed by their pages and tabs."""
+        recorder = GridSnapshotRecorder(self.snapshot_dir, RECORDED_PARAMETERS)
+        recorder.save(21, "performance_st", "<div>second page</div>")
+        recorder.save(1, "overview", "<div>first page</div>")
+        recorder.save_manifest("http://127.0.0.1/stocks/stock-screener")
+
+        snapshot_files = list_snapshot_files(self.snapshot_dir)
+        self.assertEqual(list(snapshot_files), [1, 21])
+        self.assertEqual(
+            read_snapshot(snapshot_files[21]["performance_st"]), "<div>second page</div>"
+        )
+        self.assertEqual(read_manifest(self.snapshot_dir)["scrap_params"], RECORDED_PARAMETERS)
+
+    def test_clear(self):
+        """Check if the snapshots of a previous recording are removed."""
+        GridSnapshotRecorder(self.snapshot_dir, []).save(101, "overview", "<div></div>")
+        GridSnapshotRecorder(self.snapshot_dir, [], clear=False).save(1, "overview", "")
+        self.assertEqual(list(list_snapshot_files(self.snapshot_dir)), [1, 101])
+
+        GridSnapshotRecorder(self.snapshot_dir, [])
+        self.assertEqual(list_snapshot_files(self.snapshot_dir), {})
+
+
+@unittest.skipIf(etree is None, "lxml is not installed")
+class TestSnapshotReplay(unittest.TestCase):
+    """Class to be used to test recording the grid while scrapping and replaying it.
+
+    Methods
+    -------
+    test_replay_other_parameters():
+        check if the parameters of the recorded tabs are replayed as they are scrapped
+
+    test_replay_in_processes():
+        check if the pages are replayed in order by a pool of processes
+
+    test_replay_errors():
+        check if the parameters which cannot be replayed are rejected
+
+    test_scrap_the_table():
+        check if the replayed pages are saved to the data recorder
+
+    test_record_in_html_mode():
+        check if the html read to scrap the tabs is recorded in html extraction mode
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """Scrap a fake grid while recording its snapshots."""
+        cls.records = generate_records(45)
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.snapshot_dir = os.path.join(cls.temp_dir.name, "snapshots")
+        scrapper = TableScrapper(
+            str_logger="none",
+            extraction_mode="bulk",
+            boot_in_background=False,
+            driver_factory=lambda: FakeDriver(cls.records),
+        )
+        scrapper.scrap_the_table(
+            RECORDED_PARAMETERS,
+            data_recorder=mock.Mock(),
+            snapshot_dir=cls.snapshot_dir,
+        )
+
+        # Pages scrapped from the grid, with the parameters which are not recorded
+        scrapper = TableScrapper(
+            str_logger="none",
+            boot_in_background=False,
+            driver_factory=lambda: FakeDriver(cls.records),
+        )
+        cls.scrapped_pages = list(scrapper.iter_pages(REPLAYED_PARAMETERS))
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the snapshots."""
+        cls.temp_dir.cleanup()
+
+    def test_replay_other_parameters(self):
+        """Check if the parameters of the recorded tabs are replayed as they are scrapped."""
+        self.assertEqual(
+            sorted(os.listdir(self.snapshot_dir)),
+            ["row1_descriptive.html.gz", "row1_overview.html.gz",
+             "row21_descriptive.html.gz", "row21_overview.html.gz",
+             "row41_descriptive.html.gz", "row41_overview.html.gz", "snapshots.json"]
+        )
+        replayer = SnapshotReplayer(self.snapshot_dir, str_logger="none", processes=1)
+        self.assertEqual(list(replayer.iter_pages(REPLAYED_PARAMETERS)), self.scrapped_pages)
+        # Recorded parameters are replayed by default
+        first_page = next(replayer.iter_pages())
+        self.assertCountEqual(
+            next(iter(first_page.values())), ["name", "Market Cap", "Exchange"]
+        )
+
+    def test_replay_in_processes(self):
+        """Check if the pages are replayed in order by a pool of processes."""
+        replayer = SnapshotReplayer(self.snapshot_dir, str_logger="none", processes=2)
+        self.assertEqual(list(replayer.iter_pages(REPLAYED_PARAMETERS)), self.scrapped_pages)
+
+    def test_replay_errors(self):
+        """Check if the parameters which cannot be replayed are rejected."""
+        replayer = SnapshotReplayer(self.snapshot_dir, str_logger="none", processes=1)
+        with self.assertRaises(ValueError):
+            list(replayer.iter_pages(["Market Cap", "12 Month EPS"]))  # tab is not recorded
+        with self.assertRaises(ValueError):
+            list(replayer.iter_pages(["Unknown Parameter"]))
+
+        with tempfile.TemporaryDirectory() as empty_dir:
+            with self.assertRaises(ValueError):
+                list(SnapshotReplayer(empty_dir, str_logger="none").iter_pages())
+
+    def test_scrap_the_table(self):
+        """Check if the replayed pages are saved to the data recorder."""
+        data_recorder = mock.Mock()
+        SnapshotReplayer(self.snapshot_dir, str_logger="none", processes=1).scrap_the_table(
+            REPLAYED_PARAMETERS, data_recorder=data_recorder
+        )
+        self.assertEqual(
+            [call.kwargs["scrapped_data"] for call in data_recorder.save_to_csv.call_args_list],
+            self.scrapped_pages
+        )
+        data_recorder.flush.assert_called_once()
+
+    def test_record_in_html_mode(self):
+        """Check if the html read to scrap the tabs is recorded in html extraction mode."""
+        for traversal_strategy in ("page-major", "tab-major"):
+            with self.subTest(traversal_strategy=traversal_strategy), \
+                    tempfile.TemporaryDirectory() as temp_dir:
+                snapshot_dir = os.path.join(temp_dir, "snapshots")
+                scrapper = TableScrapper(
+                    str_logger="none",
+                    extraction_mode="html",
+                    traversal_strategy=traversal_strategy,
+                    boot_in_background=False,
+                    driver_factory=lambda: FakeDriver(self.records),
+                )
+                scrapper.scrap_the_table(
+                    RECORDED_PARAMETERS, data_recorder=mock.Mock(), snapshot_dir=snapshot_dir
+                )
+                self.assertEqual(
+                    sorted(os.listdir(snapshot_dir)), sorted(os.listdir(self.snapshot_dir))
+                )
+                for file_name in os.listdir(snapshot_dir):
+                    if file_name != MANIFEST_FILE_NAME:
+                        self.assertEqual(
+                            read_snapshot(os.path.join(snapshot_dir, file_name)),
+                            read_snapshot(os.path.join(self.snapshot_dir, file_name))
+                        )
+                self.assertEqual(
+                    list(SnapshotReplayer(snapshot_dir, "none", 1).iter_pages(
+                        REPLAYED_PARAMETERS
+                    )),
+                    self.scrapped_pages
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
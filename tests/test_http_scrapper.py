@@ -0,0 +1,93 @@
+import csv
+import os
+import threading
+import unittest
+from functools import partial
+from http.server import HTTPServer, SimpleHTTPRequestHandler
+
+from macrotrends_data_scrapper.http_scrapper import HttpTableScrapper
+
+
+class _QuietRequestHandler(SimpleHTTPRequestHandler):
+    """Serve the fixtures without logging each request to the console."""
+
+    def log_message(self, format, *args):
+        """Do not log the requests."""
+
+
+class TestHttpTableScrapper(unittest.TestCase):
+    """Test the HttpTableScrapper against a local stand-in server serving fixtures."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Start the stand-in server in a background thread."""
+        fixtures_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+        handler = partial(_QuietRequestHandler, directory=fixtures_path)
+        cls.server = HTTPServer(("127.0.0.1", 0), handler)
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.server_thread.start()
+        cls.url = f"http://127.0.0.1:{cls.server.server_port}/screener_page.html"
+
+    @classmethod
+    def tearDownClass(cls):
+        """Shut down the stand-in server."""
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        """Set up the scrapper and the output file."""
+        self.scrapper = HttpTableScrapper(str_logger="none", url=self.url)
+        self.csv_file_name = "test_http_scrapper.csv"
+
+    def tearDown(self):
+        """Close the scrapper and remove the output file."""
+        self.scrapper.close()
+        if os.path.exists(self.csv_file_name):
+            os.remove(self.csv_file_name)
+
+    def test_scrap_records(self):
+        """Check that the records are converted into per-ticker dictionaries."""
+        company_attr_dict = self.scrapper.scrap_records(["Market Cap", "Dividend Yield"])
+        self.assertEqual(list(company_attr_dict.keys()), ["AAPL", "MSFT", "JPM"])
+        self.assertEqual(
+            company_attr_dict["AAPL"],
+            {"name": "Apple Inc", "Market Cap": 2910000.0, "Dividend Yield": 0.51}
+        )
+        # Missing values are recorded as empty strings
+        self.assertEqual(company_attr_dict["MSFT"]["Dividend Yield"], "")
+
+    def test_scrap_records_with_filters(self):
+        """Check that only the records satisfying the filters are returned."""
+        company_attr_dict = self.scrapper.scrap_records(
+            ["Market Cap"], filters={"Exchange": "NASDAQ", "Market Cap": {"max": 2800000}}
+        )
+        self.assertEqual(list(company_attr_dict.keys()), ["MSFT"])
+
+    def test_scrap_records_with_unknown_parameter(self):
+        """Check that an unknown parameter is rejected before any request."""
+        with self.assertRaises(KeyError):
+            self.scrapper.scrap_records(["Not A Parameter"])
+
+    def test_scrap_the_table(self):
+        """Check that the scrapped table is saved to the csv file."""
+        self.scrapper.scrap_the_table(
+            parameters_to_be_scrapped=["Industry", "Exchange"],
+            csv_file=self.csv_file_name,
+        )
+        with open(self.csv_file_name, "r", newline="") as file:
+            rows = list(csv.DictReader(file))
+
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[2]["Ticker"], "JPM")
+        self.assertEqual(rows[2]["name"], "JPMorgan Chase & Co")
+        self.assertEqual(rows[2]["Industry"], "Banks-Major Regional")
+        self.assertEqual(rows[2]["Exchange"], "NYSE")
+
+    def test_parse_payload_without_data(self):
+        """Check that a page without the table data raises an error."""
+        with self.assertRaises(ValueError):
+            HttpTableScrapper._parse_payload("<html></html>")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import os
+import unittest
+
+from macrotrends_data_scrapper.parquet_recorder import ParquetDataRecorder, pq
+from macrotrends_data_scrapper.value_parser import ValueParsingRecorder
+
+
+@unittest.skipIf(pq is None, "pyarrow is not installed")
+class TestParquetDataRecorder(unittest.TestCase):
+    """Unit tests for the ParquetDataRecorder class."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.parquet_file_name = "test_parquet_data.parquet"
+        self.data_recorder = ParquetDataRecorder(self.parquet_file_name, typed_values=True)
+
+    def tearDown(self):
+        """Tear down the test environment."""
+        if os.path.exists(self.parquet_file_name):
+            os.remove(self.parquet_file_name)
+
+    def test_save_to_csv_writes_row_group_per_page(self):
+        """Check that each saved page is a row group with typed columns."""
+        self.data_recorder.save_to_csv({
+            "AAPL": {"name": "Apple", "Market Cap": 2910.0, "Exchange": ""},
+            "MSFT": {"name": "Microsoft", "Market Cap": 2780.0, "Exchange": ""},
+        })
+        self.data_recorder.save_to_csv({"JPM": {"name": "JPMorgan", "Exchange": "NYSE"}})
+        self.data_recorder.flush()
+
+        parquet_file = pq.ParquetFile(self.parquet_file_name)
+        self.assertEqual(parquet_file.num_row_groups, 2)
+        self.assertEqual(
+            parquet_file.schema_arrow.names, ["Ticker", "name", "Market Cap", "Exchange"]
+        )
+        self.assertEqual(str(parquet_file.schema_arrow.field("Market Cap").type), "double")
+
+        table = pq.read_table(self.parquet_file_name, columns=["Ticker", "Exchange"])
+        self.assertEqual(
+            table.to_pydict(),
+            {"Ticker": ["AAPL", "MSFT", "JPM"], "Exchange": [None, None, "NYSE"]}
+        )
+
+    def test_save_to_csv_with_unknown_column(self):
+        """Check that a column which is not in the schema is rejected."""
+        self.data_recorder.save_to_csv({"AAPL": {"Market Cap": 2910.0}})
+        with self.assertRaises(ValueError):
+            self.data_recorder.save_to_csv({"MSFT": {"Dividend Yield": 0.8}})
+        self.data_recorder.flush()
+
+    def test_save_to_csv_with_missing_column_on_first_page(self):
+        """Check that the column types do not depend on the values of the first page."""
+        data_recorder = ValueParsingRecorder(self.data_recorder)
+        data_recorder.save_to_csv({
+            "AAPL": {"name": "Apple", "P/E Ratio": "-", "Sector": ""},
+            "MSFT": {"name": "Microsoft", "P/E Ratio": "", "Sector": ""},
+        })
+        data_recorder.save_to_csv({
+            "JPM": {"name": "JPMorgan", "P/E Ratio": "11.2", "Sector": "Finance"},
+        })
+        data_recorder.flush()
+
+        table = pq.read_table(self.parquet_file_name)
+        self.assertEqual(str(table.schema.field("P/E Ratio").type), "double")
+        self.assertEqual(str(table.schema.field("Sector").type), "string")
+        self.assertEqual(table.column("P/E Ratio").to_pylist(), [None, None, 11.2])
+        self.assertEqual(table.column("Sector").to_pylist(), [None, None, "Finance"])
+
+    def test_save_to_csv_with_text_values(self):
+        """Check that every column is stored as text if the values are not parsed."""
+        data_recorder = ParquetDataRecorder(self.parquet_file_name)
+        data_recorder.save_to_csv({"AAPL": {"name": "Apple", "Market Cap": "$2.91T"}})
+        data_recorder.flush()
+
+        self.assertEqual(
+            pq.read_table(self.parquet_file_name).to_pydict(),
+            {"Ticker": ["AAPL"], "name": ["Apple"], "Market Cap": ["$2.91T"]}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
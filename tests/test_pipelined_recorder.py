@@ -0,0 +1,139 @@
+import csv
+import os
+import tempfile
+import threading
+import unittest
+
+from macrotrends_data_scrapper.pipelined_recorder import PipelinedDataRecorder
+from macrotrends_data_scrapper.sqlite_recorder import SQLiteDataRecorder
+
+
+class _ListRecorder:
+    """Recorder keeping the saved pages in a list, optionally blocking until released."""
+
+    saves_are_durable = True
+
+    def __init__(self):
+        self.pages = []
+        self.is_flushed = False
+        self.flush_error = None
+        self.release = threading.Event()
+        self.release.set()
+
+    def save_to_csv(self, scrapped_data, ticker_column_str=None):
+        self.release.wait(timeout=10)
+        if "FAIL" in scrapped_data:
+            raise OSError("disk is full")
+        self.pages.append((scrapped_data, ticker_column_str))
+
+    def flush(self):
+        self.is_flushed = True
+        if self.flush_error is not None:
+            raise self.flush_error
+
+
+class TestPipelinedDataRecorder(unittest.TestCase):
+    """Class to be used to test PipelinedDataRecorder class.
+
+    Methods
+    -------
+    test_pages_are_saved_in_order():
+        check if all pages are saved in order by the end of flush
+
+    test_backpressure():
+        check if saving blocks when max_pending_pages pages are waiting
+
+    test_writer_error_is_raised():
+        check if an error of the wrapped recorder is raised on flush
+
+    test_flush_error_does_not_hide_writer_error():
+        check if the error of a failed save is raised rather than the one of the flush
+
+    test_sqlite_recorder():
+        check if an SQLite recorder created in another thread is written by the writer
+    """
+
+    def setUp(self):
+        """Set up a pipelined recorder wrapping a list recorder."""
+        self.list_recorder = _ListRecorder()
+        self.data_recorder = PipelinedDataRecorder(self.list_recorder, max_pending_pages=2)
+
+    def test_pages_are_saved_in_order(self):
+        """Check if all pages are saved in order by the end of flush."""
+        pages = [{f"T{index}": {"name": f"Company {index}"}} for index in range(10)]
+        for page in pages:
+            self.data_recorder.save_to_csv(page, "Ticker")
+        self.data_recorder.flush()
+
+        self.assertEqual(self.list_recorder.pages, [(page, "Ticker") for page in pages])
+        self.assertTrue(self.list_recorder.is_flushed)
+
+    def test_backpressure(self):
+        """Check if saving blocks when max_pending_pages pages are waiting."""
+        self.list_recorder.release.clear()  # writer blocks on the first page
+        saved_pages = []
+
+        def save_pages():
+            for index in range(4):
+                self.data_recorder.save_to_csv({f"T{index}": {}})
+                saved_pages.append(index)
+
+        producer = threading.Thread(target=save_pages, daemon=True)
+        producer.start()
+        producer.join(timeout=0.5)
+        # One page is being written and two pages are queued
+        self.assertTrue(producer.is_alive())
+        self.assertEqual(saved_pages, [0, 1, 2])
+
+        self.list_recorder.release.set()
+        producer.join(timeout=10)
+        self.data_recorder.flush()
+        self.assertEqual(len(self.list_recorder.pages), 4)
+
+    def test_writer_error_is_raised(self):
+        """Check if an error of the wrapped recorder is raised on flush."""
+        self.data_recorder.save_to_csv({"AAPL": {}})
+        self.data_recorder.save_to_csv({"FAIL": {}})
+        self.data_recorder.save_to_csv({"MSFT": {}})
+
+        with self.assertRaises(OSError):
+            self.data_recorder.flush()
+        # Pages saved before the error are flushed
+        self.assertEqual(self.list_recorder.pages, [({"AAPL": {}}, None)])
+        self.assertTrue(self.list_recorder.is_flushed)
+
+    def test_flush_error_does_not_hide_writer_error(self):
+        """Check if the error of a failed save is raised rather than the one of the flush."""
+        self.list_recorder.flush_error = RuntimeError("recorder is in an inconsistent state")
+        self.data_recorder.save_to_csv({"FAIL": {}})
+
+        with self.assertRaises(OSError):
+            self.data_recorder.flush()
+
+    def test_sqlite_recorder(self):
+        """Check if an SQLite recorder created in another thread is written by the writer."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_file_name = os.path.join(temp_dir, "Output.csv")
+            data_recorder = PipelinedDataRecorder(SQLiteDataRecorder(csv_file_name))
+            data_recorder.save_to_csv({"AAPL": {"name": "Apple", "Market Cap": "$2.91T"}})
+            data_recorder.save_to_csv({"MSFT": {"name": "Microsoft", "Market Cap": "$2.75T"}})
+            data_recorder.flush()
+            # Writer thread is started again after a flush
+            data_recorder.save_to_csv({"AAPL": {"Exchange": "NASDAQ"}})
+            data_recorder.flush()
+
+            with open(csv_file_name, "r", newline="") as csv_file:
+                self.assertEqual(
+                    list(csv.DictReader(csv_file)),
+                    [
+                        {"Ticker": "AAPL", "name": "Apple", "Market Cap": "$2.91T",
+                         "Exchange": "NASDAQ"},
+                        {"Ticker": "MSFT", "name": "Microsoft", "Market Cap": "$2.75T",
+                         "Exchange": ""},
+                    ]
+                )
+            del data_recorder  # connection to the database is closed
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import os
+import unittest
+
+from macrotrends_data_scrapper.scrap_checkpoint import ScrapCheckpoint
+
+
+class TestScrapCheckpoint(unittest.TestCase):
+    """Unit tests for the ScrapCheckpoint class."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.checkpoint_file_name = "test_output.csv.checkpoint"
+        self.scrap_params = ["Market Cap", "Exchange"]
+
+    def tearDown(self):
+        """Tear down the test environment."""
+        if os.path.exists(self.checkpoint_file_name):
+            os.remove(self.checkpoint_file_name)
+
+    def test_save_and_load(self):
+        """Check that the committed page is resumed for the same parameters."""
+        checkpoint = ScrapCheckpoint(self.checkpoint_file_name, self.scrap_params)
+        self.assertFalse(checkpoint.load(20, 45))  # no checkpoint file
+        self.assertEqual(checkpoint.next_page, 0)
+        checkpoint.commit(4)
+        checkpoint.save()
+
+        # Order of the parameters does not matter
+        resumed_checkpoint = ScrapCheckpoint(self.checkpoint_file_name, ["Exchange", "Market Cap"])
+        self.assertTrue(resumed_checkpoint.load(20, 45))
+        self.assertEqual(resumed_checkpoint.next_page, 5)
+
+    def test_load_with_other_parameters(self):
+        """Check that a checkpoint of other parameters is not resumed."""
+        checkpoint = ScrapCheckpoint(self.checkpoint_file_name, self.scrap_params)
+        checkpoint.load(20, 45)
+        checkpoint.commit(4)
+        checkpoint.save()
+
+        other_checkpoint = ScrapCheckpoint(self.checkpoint_file_name, ["Market Cap"])
+        self.assertFalse(other_checkpoint.load(20, 45))
+        self.assertEqual(other_checkpoint.next_page, 0)
+
+    def test_load_with_other_paging(self):
+        """Check that a checkpoint is not resumed if the rows are paged otherwise."""
+        checkpoint = ScrapCheckpoint(self.checkpoint_file_name, self.scrap_params)
+        self.assertFalse(checkpoint.load(20, 45))
+        checkpoint.commit(1)
+        checkpoint.save()
+
+        # Rows per page or the number of companies are changed
+        paging_cases = [(50, 45, False), (20, 46, False), (20, 45, True)]
+        for rows_per_page, num_of_rows, is_loaded in paging_cases:
+            resumed_checkpoint = ScrapCheckpoint(self.checkpoint_file_name, self.scrap_params)
+            self.assertEqual(resumed_checkpoint.load(rows_per_page, num_of_rows), is_loaded)
+
+    def test_load_with_other_filters(self):
+        """Check that a checkpoint of other filters is not resumed."""
+        checkpoint = ScrapCheckpoint(
+            self.checkpoint_file_name, self.scrap_params, filters={"Country": "USA"}
+        )
+        checkpoint.load(20, 45)
+        checkpoint.commit(4)
+        checkpoint.save()
+
+        self.assertFalse(ScrapCheckpoint(self.checkpoint_file_name, self.scrap_params).load(20, 45))
+        self.assertTrue(ScrapCheckpoint(
+            self.checkpoint_file_name, self.scrap_params, filters={"Country": ["USA"]}
+        ).load(20, 45))
+
+    def test_clear(self):
+        """Check that clearing removes the checkpoint file."""
+        checkpoint = ScrapCheckpoint(self.checkpoint_file_name, self.scrap_params)
+        checkpoint.save()  # nothing is committed, nothing is written
+        self.assertFalse(os.path.exists(self.checkpoint_file_name))
+
+        checkpoint.commit(0)
+        checkpoint.save()
+        checkpoint.clear()
+        self.assertFalse(os.path.exists(self.checkpoint_file_name))
+
+
+if __name__ == "__main__":
+    unittest.main()
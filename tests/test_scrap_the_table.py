@@ -1,5 +1,11 @@
+import os
+import tempfile
+import threading
 import unittest
+from unittest import mock
+
 from macrotrends_data_scrapper.scrap_the_table import TableScrapper
+from macrotrends_data_scrapper.ticker_positions import TickerPositionCache
 from macrotrends_data_scrapper.map_of_headers import MAP_OF_HEADERS
 
 
@@ -78,5 +84,391 @@ class TestTableScrapper(unittest.TestCase):
         self.assertTrue(total > last)
 
 
+class TestRowMatrixConversion(unittest.TestCase):
+    """Test the conversion of the row matrices read in the bulk extraction mode."""
+
+    def test_convert_row_matrix(self):
+        """Check that the values are placed according to their column indices."""
+        row_matrix = [
+            ["AAPL", "Apple Inc", "Computer Hardware", "$2.91T", "$189.00"],
+            ["MSFT", "Microsoft Corp", "Computer Software", "$2.78T", "$374.00"],
+        ]
+        company_attr_dict = TableScrapper._convert_row_matrix(
+            row_matrix,
+            [("Industry", 1), ("Closing Price", 3)],
+            {},
+        )
+        self.assertEqual(
+            company_attr_dict,
+            {
+                "AAPL": {
+                    "name": "Apple Inc",
+                    "Industry": "Computer Hardware",
+                    "Closing Price": "$189.00",
+                },
+                "MSFT": {
+                    "name": "Microsoft Corp",
+                    "Industry": "Computer Software",
+                    "Closing Price": "$374.00",
+                },
+            }
+        )
+
+    def test_convert_row_matrix_updates_existing_companies(self):
+        """Check that the values of another tab are merged into the existing companies."""
+        company_attr_dict = {"AAPL": {"name": "Apple Inc", "Industry": "Computer Hardware"}}
+        TableScrapper._convert_row_matrix(
+            [["AAPL", "Apple Inc", "$2.91T", "NASDAQ"]],
+            [("Exchange", 2)],
+            company_attr_dict,
+        )
+        self.assertEqual(
+            company_attr_dict["AAPL"],
+            {"name": "Apple Inc", "Industry": "Computer Hardware", "Exchange": "NASDAQ"}
+        )
+
+
+class TestPartitionPages(unittest.TestCase):
+    """Test the partitioning of the pages among the parallel workers."""
+
+    def test_partition_pages(self):
+        """Check that the ranges are contiguous, disjoint and cover all pages."""
+        page_ranges = TableScrapper._partition_pages(num_of_pages=10, workers=3)
+        self.assertEqual(page_ranges, [(0, 4), (4, 7), (7, 10)])
+
+    def test_partition_pages_with_more_workers_than_pages(self):
+        """Check that a worker is not assigned an empty range."""
+        page_ranges = TableScrapper._partition_pages(num_of_pages=2, workers=4)
+        self.assertEqual(page_ranges, [(0, 1), (1, 2)])
+
+
+class TestBackgroundBoot(unittest.TestCase):
+    """Class to be used to test booting the driver in the background.
+
+    Driver manager is replaced by a stand-in whose boot is released by the test.
+
+    Methods
+    -------
+    test_constructor_does_not_wait_for_boot():
+        check if the constructor returns before the driver is booted
+
+    test_boot_error_is_raised_on_use():
+        check if an error raised while booting is raised on first use
+    """
+
+    def setUp(self):
+        """Replace the driver manager by a stand-in blocking until released."""
+        self.boot_released = threading.Event()
+        self.driver_manager = mock.Mock()
+        self.driver_manager.set_up_driver.side_effect = \
+            lambda url: self.boot_released.wait(timeout=10)
+        patcher = mock.patch(
+            "macrotrends_data_scrapper.scrap_the_table.DriverManager",
+            return_value=self.driver_manager
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_constructor_does_not_wait_for_boot(self):
+        """Check if the constructor returns before the driver is booted."""
+        scrapper = TableScrapper(str_logger="none")
+        self.assertFalse(scrapper._driver_manager_future.done())
+
+        self.boot_released.set()
+        self.assertIs(scrapper.driver_manager, self.driver_manager)
+        del scrapper
+        self.driver_manager.kill_driver.assert_called_once()
+
+    def test_boot_error_is_raised_on_use(self):
+        """Check if an error raised while booting is raised on first use."""
+        self.driver_manager.set_up_driver.side_effect = RuntimeError("website is not reachable")
+        scrapper = TableScrapper(str_logger="none")
+
+        with self.assertRaises(RuntimeError):
+            scrapper.driver_manager
+        # Driver is shut down as soon as the boot fails
+        self.driver_manager.kill_driver.assert_called_once()
+
+
+class TestStreaming(unittest.TestCase):
+    """Class to be used to test the generator API and scrap_the_table as its consumer.
+
+    Pages are provided by a stand-in of the page iteration, no browser is used.
+
+    Methods
+    -------
+    test_iter_rows():
+        check if the companies of all pages are yielded with their tickers
+
+    test_scrap_the_table_saves_each_page():
+        check if scrap_the_table saves each yielded page to the recorder
+
+    test_scrap_the_table_records_ticker_positions():
+        check if the pages of the tickers are recorded to the requested file
+    """
+
+    pages = [
+        {"AAPL": {"name": "Apple Inc", "Market Cap": "$2.91T"}},
+        {"MSFT": {"name": "Microsoft Corp", "Market Cap": "$2.45T"}},
+    ]
+
+    def setUp(self):
+        """Set up a scrapper without a browser, whose pages are stand-ins."""
+        patcher = mock.patch("macrotrends_data_scrapper.scrap_the_table.DriverManager")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.scrapper = TableScrapper(str_logger="none", boot_in_background=False)
+        self.scrapper._iter_pages = mock.Mock(side_effect=lambda *args: iter(self.pages))
+
+    def test_iter_rows(self):
+        """Check if the companies of all pages are yielded with their tickers."""
+        rows = list(self.scrapper.iter_rows(["Market Cap"], ticker_column_str="Symbol"))
+        self.assertEqual(rows, [
+            {"Symbol": "AAPL", "name": "Apple Inc", "Market Cap": "$2.91T"},
+            {"Symbol": "MSFT", "name": "Microsoft Corp", "Market Cap": "$2.45T"},
+        ])
+
+    def test_scrap_the_table_saves_each_page(self):
+        """Check if scrap_the_table saves each yielded page to the recorder."""
+        data_recorder = mock.Mock()
+        self.scrapper.scrap_the_table(["Market Cap"], data_recorder=data_recorder)
+        self.assertEqual(
+            data_recorder.save_to_csv.call_args_list,
+            [mock.call(scrapped_data=page, ticker_column_str="Ticker") for page in self.pages]
+        )
+        data_recorder.flush.assert_called_once()
+        # Pages of the tickers are recorded only if requested
+        self.assertFalse(os.path.exists("result.csv.positions"))
+
+    def test_scrap_the_table_records_ticker_positions(self):
+        """Check if the pages of the tickers are recorded to the requested file."""
+        self.scrapper._get_rows_per_page = mock.Mock(return_value=1)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            ticker_positions_file = os.path.join(temp_dir, "Output.csv.positions")
+            self.scrapper.scrap_the_table(
+                ["Market Cap"], data_recorder=mock.Mock(),
+                ticker_positions_file=ticker_positions_file
+            )
+            ticker_positions = TickerPositionCache(ticker_positions_file)
+            ticker_positions.load(rows_per_page=1)
+            self.assertEqual(ticker_positions.positions, {"AAPL": 0, "MSFT": 1})
+
+
+class TestRefreshTickers(unittest.TestCase):
+    """Class to be used to test refreshing a few tickers without a full traversal.
+
+    Pages of the grid are stand-ins, no browser is used.
+
+    Methods
+    -------
+    test_refresh_tickers():
+        check if the recorded pages are visited and the other tickers are searched
+    """
+
+    pages = {
+        0: {"AAPL": {"name": "Apple Inc"}, "MSFT": {"name": "Microsoft Corp"}},
+        # JPM moved from page 1 to another page since the positions are recorded
+        1: {"V": {"name": "Visa Inc"}, "WMT": {"name": "Walmart Inc"}},
+    }
+
+    def setUp(self):
+        """Set up a scrapper without a browser, whose grid is a stand-in."""
+        patcher = mock.patch("macrotrends_data_scrapper.scrap_the_table.DriverManager")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.scrapper = TableScrapper(str_logger="none", boot_in_background=False)
+
+        self.current_page = None
+        self.scrapper._get_rows_per_page = mock.Mock(return_value=2)
+        self.scrapper._go_to_page = mock.Mock(
+            side_effect=lambda page_index: setattr(self, "current_page", page_index)
+        )
+        self.scrapper._scrap_the_page = mock.Mock(
+            side_effect=lambda scrap_params: self.pages[self.current_page]
+        )
+        self.scrapper._apply_grid_filters = mock.Mock(return_value=1)
+        self.scrapper._iter_pages = mock.Mock(
+            return_value=iter([{"JPM": {"name": "JPMorgan Chase & Co"}}])
+        )
+
+        self.ticker_positions_file = "test_refresh.csv.positions"
+        with open(self.ticker_positions_file, "w") as positions_file:
+            positions_file.write(
+                '{"rows_per_page": 2, "positions": {"AAPL": 0, "MSFT": 0, "JPM": 1}}'
+            )
+
+    def tearDown(self):
+        """Remove the position cache file."""
+        os.remove(self.ticker_positions_file)
+
+    def test_refresh_tickers(self):
+        """Check if the recorded pages are visited and the other tickers are searched."""
+        data_recorder = mock.Mock()
+        missing_tickers = self.scrapper.refresh_tickers(
+            ["msft", "JPM", "XYZ"], ["Industry"], data_recorder=data_recorder,
+            ticker_positions_file=self.ticker_positions_file
+        )
+
+        self.assertEqual(
+            [call.args[0] for call in self.scrapper._go_to_page.call_args_list], [0, 1]
+        )
+        self.assertEqual(
+            [call.kwargs["scrapped_data"] for call in data_recorder.save_to_csv.call_args_list],
+            [{"MSFT": {"name": "Microsoft Corp"}}, {"JPM": {"name": "JPMorgan Chase & Co"}}]
+        )
+        # Tickers not found on their pages are searched, then the filter is cleared
+        self.assertEqual(
+            self.scrapper._apply_grid_filters.call_args_list,
+            [mock.call([{"datafield": "ticker", "values": ["JPM", "XYZ"]}]), mock.call([])]
+        )
+        self.assertEqual(missing_tickers, ["XYZ"])
+        data_recorder.flush.assert_called_once()
+
+
+class TestTraversal(unittest.TestCase):
+    """Class to be used to test the traversal of the pages and the tabs.
+
+    Grid is a stand-in of 3 pages with a company per page, no browser is used.
+
+    Methods
+    -------
+    test_page_major_tracks_active_tab():
+        check if each page starts on the tab the previous page ended and the
+        pager is read once per page
+
+    test_tab_major():
+        check if each tab is visited once and the pages are yielded in order
+
+    test_unknown_active_tab():
+        check if the first tab switch is waited for shortly if the tab is not marked
+    """
+
+    scrap_params = ["Market Cap", "Exchange"]  # on the "overview" and "descriptive" tabs
+
+    def setUp(self):
+        """Set up a scrapper without a browser, whose grid is a stand-in."""
+        patcher = mock.patch("macrotrends_data_scrapper.scrap_the_table.DriverManager")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch("macrotrends_data_scrapper.scrap_the_table.WebDriverWait")
+        self.web_driver_wait = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.scrapper = TableScrapper(
+            str_logger="none", extraction_mode="bulk", boot_in_background=False
+        )
+        self.current_page = 0
+        # Grid shows the first tab when it is loaded, see ACTIVE_TAB_SCRIPT
+        self.scrapper.driver_manager.driver.execute_script.return_value = "overview"
+        self.scrapper._get_grid_signature = mock.Mock(return_value="")
+        self.scrapper._wait_for_grid_change = mock.Mock()
+        self.scrapper._get_num_of_rows = mock.Mock(return_value=(1, 1, 3))
+        self.scrapper._go_to_page = mock.Mock(side_effect=self._show_page)
+        self.scrapper._progress_one_page = mock.Mock(
+            side_effect=lambda: self._show_page(self.current_page + 1)
+        )
+        self.scrapper._scrap_row_matrix = mock.Mock(side_effect=lambda num_of_rows: [
+            [f"T{self.current_page}", f"Company {self.current_page}",
+             f"{self.scrapper._active_tab}1", f"{self.scrapper._active_tab}2",
+             f"{self.scrapper._active_tab}3"]
+        ])
+
+    def _show_page(self, page_index: int):
+        """Show a page of the stand-in grid."""
+        if page_index != self.current_page:
+            self.current_page = page_index
+            self.scrapper._page_state.invalidate()
+
+    def _scrap_pages(self, traversal_strategy: str) -> "tuple[list[dict], list[str]]":
+        """Scrap the pages by the strategy, return them and the tabs clicked in order."""
+        self.scrapper.traversal_strategy = traversal_strategy
+        with mock.patch(
+            "macrotrends_data_scrapper.scrap_the_table.ec.element_to_be_clickable"
+        ) as element_to_be_clickable:
+            pages = list(self.scrapper._scrap_pages_by_strategy(self.scrap_params, 0, 3))
+        clicked_tabs = [
+            call.args[0][1].split("columns_")[1].split("'")[0]
+            for call in element_to_be_clickable.call_args_list
+        ]
+        return pages, clicked_tabs
+
+    def test_page_major_tracks_active_tab(self):
+        """Check if each page starts on the tab the previous page ended."""
+        pages, clicked_tabs = self._scrap_pages("page-major")
+        self.assertEqual(clicked_tabs, ["descriptive", "overview", "descriptive"])
+        # Pager is read once per page
+        self.assertEqual(self.scrapper._get_num_of_rows.call_count, 3)
+        self.assertEqual(
+            pages[1], {"T1": {"name": "Company 1", "Market Cap": "overview2",
+                              "Exchange": "descriptive2"}}
+        )
+
+    def test_tab_major(self):
+        """Check if each tab is visited once and the pages are yielded in order."""
+        pages, clicked_tabs = self._scrap_pages("tab-major")
+        self.assertEqual(clicked_tabs, ["descriptive"])
+        self.assertEqual([list(page) for page in pages], [["T0"], ["T1"], ["T2"]])
+        self.assertEqual(
+            pages[2], {"T2": {"name": "Company 2", "Market Cap": "overview2",
+                              "Exchange": "descriptive2"}}
+        )
+
+    def test_unknown_active_tab(self):
+        """Check if the first tab switch is waited for shortly if the tab is not marked."""
+        self.scrapper.driver_manager.driver.execute_script.return_value = None
+        pages, clicked_tabs = self._scrap_pages("tab-major")
+        self.assertEqual(clicked_tabs, ["overview", "descriptive"])
+        self.assertEqual(
+            self.scrapper._wait_for_grid_change.call_args_list,
+            [mock.call("", TableScrapper.unknown_tab_wait_time, "tab_switch"),
+             mock.call("", 100, "tab_switch")]
+        )
+        self.assertEqual(len(pages), 3)
+
+
+class TestApplyFilters(unittest.TestCase):
+    """Class to be used to test waiting for the grid after the filters are applied.
+
+    Methods
+    -------
+    test_grid_is_waited_for_if_rows_are_changed():
+        check if the grid is waited for if the number of rows or the first row is changed
+
+    test_grid_is_not_waited_for_if_rows_are_kept():
+        check if the grid is not waited for if the filters keep the shown rows
+    """
+
+    def setUp(self):
+        """Set up a scrapper without a browser."""
+        patcher = mock.patch("macrotrends_data_scrapper.scrap_the_table.DriverManager")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.scrapper = TableScrapper(str_logger="none", boot_in_background=False)
+        self.driver = self.scrapper.driver_manager.driver
+        self.scrapper._get_grid_signature = mock.Mock(return_value="1-20 of 45||0")
+        self.scrapper._wait_for_grid_change = mock.Mock()
+
+    def test_grid_is_waited_for_if_rows_are_changed(self):
+        """Check if the grid is waited for if the number of rows or the first row is changed."""
+        grid_filters = [{"datafield": "exchange", "values": ["NYSE"]}]
+        for filter_result in ([45, 10, 0, 3], [45, 45, 0, 3], [45, 45, None, 0]):
+            with self.subTest(filter_result=filter_result):
+                self.scrapper._wait_for_grid_change.reset_mock()
+                self.driver.execute_script.return_value = filter_result
+                self.assertEqual(
+                    self.scrapper._apply_grid_filters(grid_filters), filter_result[1]
+                )
+                self.scrapper._wait_for_grid_change.assert_called_once_with(
+                    "1-20 of 45||0", 100, "filter"
+                )
+
+    def test_grid_is_not_waited_for_if_rows_are_kept(self):
+        """Check if the grid is not waited for if the filters keep the shown rows."""
+        self.driver.execute_script.return_value = [45, 45, 0, 0]
+        self.assertEqual(self.scrapper._apply_grid_filters([]), 45)
+        self.scrapper._wait_for_grid_change.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main()
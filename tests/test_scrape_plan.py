@@ -0,0 +1,64 @@
+import unittest
+
+from macrotrends_data_scrapper.scrape_plan import PageState, ScrapePlan, row_xpaths
+
+
+class TestScrapePlan(unittest.TestCase):
+    """Class to be used to test ScrapePlan and PageState classes.
+
+    Methods
+    -------
+    test_columns_by_tab():
+        check if the parameters are paired with their columns tab by tab
+
+    test_cell_xpaths():
+        check if the XPaths of the cells are built parameter by parameter
+
+    test_row_xpaths():
+        check if the XPaths of the tickers and the names are built row by row
+
+    test_page_state():
+        check if the row counts are kept until they are invalidated
+    """
+
+    def setUp(self):
+        """Set up a plan of parameters on two tabs."""
+        self.scrape_plan = ScrapePlan(["Exchange", "Sector", "Market Cap"])
+
+    def test_columns_by_tab(self):
+        """Check if the parameters are paired with their columns tab by tab."""
+        self.assertEqual(self.scrape_plan.tab_names, ["descriptive", "overview"])
+        self.assertEqual(
+            self.scrape_plan.columns_by_tab,
+            {"descriptive": [("Exchange", 2), ("Sector", 4)], "overview": [("Market Cap", 2)]}
+        )
+
+    def test_cell_xpaths(self):
+        """Check if the XPaths of the cells are built parameter by parameter."""
+        cell_xpaths = self.scrape_plan.cell_xpaths("descriptive", 2)
+        self.assertEqual(cell_xpaths, (
+            ("//*[@id='row0jqxGrid']/div[4]/div", "//*[@id='row1jqxGrid']/div[4]/div"),
+            ("//*[@id='row0jqxGrid']/div[6]/div", "//*[@id='row1jqxGrid']/div[6]/div"),
+        ))
+        # XPaths are built once
+        self.assertIs(self.scrape_plan.cell_xpaths("descriptive", 2), cell_xpaths)
+
+    def test_row_xpaths(self):
+        """Check if the XPaths of the tickers and the names are built row by row."""
+        ticker_xpaths, name_xpaths = row_xpaths(2)
+        self.assertEqual(ticker_xpaths[1], "// *[ @ id = 'row1jqxGrid'] / div[2] / div")
+        self.assertEqual(name_xpaths[0], "//*[@id='row0jqxGrid']/div[1]/div/div/a")
+
+    def test_page_state(self):
+        """Check if the row counts are kept until they are invalidated."""
+        page_state = PageState()
+        self.assertFalse(page_state.is_valid)
+        page_state.pager = (21, 40, 5000)
+        self.assertTrue(page_state.is_valid)
+        self.assertEqual(page_state.num_of_rows_on_page, 20)
+        page_state.invalidate()
+        self.assertFalse(page_state.is_valid)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+
+from macrotrends_data_scrapper.screener_filters import (
+    filter_records,
+    normalize_filters,
+    to_grid_filters,
+)
+
+
+class TestScreenerFilters(unittest.TestCase):
+    """Class to be used to test the filters of the companies.
+
+    Methods
+    -------
+    test_normalize_filters():
+        check if the filters are converted into a single form
+
+    test_invalid_filters():
+        check if invalid filters are rejected
+
+    test_to_grid_filters():
+        check if the filters are keyed by the datafields of the grid
+
+    test_filter_records():
+        check if only the records satisfying every filter are selected
+    """
+
+    records = [
+        {"ticker": "AAPL", "country_code": "USA", "zacks_x_sector_desc": "Computer and Technology",
+         "market_val": "2910000.0"},
+        {"ticker": "JNJ", "country_code": "USA", "zacks_x_sector_desc": "Medical",
+         "market_val": 380000.0},
+        {"ticker": "SAP", "country_code": "Germany",
+         "zacks_x_sector_desc": "Computer and Technology", "market_val": 160000.0},
+        {"ticker": "TINY", "country_code": "USA", "zacks_x_sector_desc": "Medical",
+         "market_val": 50.0},
+        {"ticker": "NOCAP", "country_code": "USA", "zacks_x_sector_desc": "Medical",
+         "market_val": None},
+    ]
+
+    def test_normalize_filters(self):
+        """Check if the filters are converted into a single form."""
+        self.assertEqual(
+            normalize_filters({"Market Cap": {"max": 100}, "Country": "USA"}),
+            {"Country": {"values": ["USA"]}, "Market Cap": {"min": None, "max": 100}}
+        )
+        self.assertEqual(
+            normalize_filters({"Market Cap": {"min": 10, "max": 10.0}}),
+            {"Market Cap": {"min": 10, "max": 10.0}}
+        )
+
+    def test_invalid_filters(self):
+        """Check if invalid filters are rejected."""
+        for filters in (
+            {"Unknown Parameter": "USA"},
+            {"Country": []},
+            {"Country": {"min": 1}},
+            {"Market Cap": 100},
+            {"Market Cap": {"minimum": 100}},
+            {"Market Cap": {"min": "10B"}},
+            {"Market Cap": {"max": True}},
+            {"Market Cap": {"min": 100, "max": 10}},
+        ):
+            with self.subTest(filters=filters), self.assertRaises(ValueError):
+                normalize_filters(filters)
+
+    def test_to_grid_filters(self):
+        """Check if the filters are keyed by the datafields of the grid."""
+        self.assertEqual(
+            to_grid_filters({"Country": ["USA", "Canada"], "Market Cap": {"min": 10}}),
+            [
+                {"datafield": "country_code", "values": ["USA", "Canada"]},
+                {"datafield": "market_val", "min": 10, "max": None},
+            ]
+        )
+
+    def test_filter_records(self):
+        """Check if only the records satisfying every filter are selected."""
+        matching_records = filter_records(
+            self.records,
+            {"Country": "usa", "Sector": ["Medical", "Computer and Technology"],
+             "Market Cap": {"min": 10000}}
+        )
+        self.assertEqual([record["ticker"] for record in matching_records], ["AAPL", "JNJ"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import csv
+import os
+import sqlite3
+import unittest
+
+from macrotrends_data_scrapper.sqlite_recorder import SQLiteDataRecorder
+
+
+class TestSQLiteDataRecorder(unittest.TestCase):
+    """Unit tests for the SQLiteDataRecorder class."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.csv_file_name = "test_sqlite_data.csv"
+        self.database_file_name = "test_sqlite_data.sqlite"
+
+    def tearDown(self):
+        """Tear down the test environment."""
+        for file_name in (self.csv_file_name, self.database_file_name):
+            if os.path.exists(file_name):
+                os.remove(file_name)
+
+    def _read_csv(self):
+        with open(self.csv_file_name, "r", newline="") as file:
+            return list(csv.DictReader(file))
+
+    def test_save_to_csv_upserts_rows(self):
+        """Check that existing tickers are updated and new columns are added."""
+        data_recorder = SQLiteDataRecorder(self.csv_file_name)
+        data_recorder.save_to_csv({
+            "AAPL": {"name": "Apple", "MarketCap": 100},
+            "GOOGL": {"name": "Alphabet", "MarketCap": 200},
+        })
+        data_recorder.save_to_csv({"AAPL": {"Dividend": 0.5}, "MSFT": {"name": "Microsoft"}})
+        data_recorder.flush()
+
+        self.assertEqual(
+            self._read_csv(),
+            [
+                {"Ticker": "AAPL", "name": "Apple", "MarketCap": "100", "Dividend": "0.5"},
+                {"Ticker": "GOOGL", "name": "Alphabet", "MarketCap": "200", "Dividend": ""},
+                {"Ticker": "MSFT", "name": "Microsoft", "MarketCap": "", "Dividend": ""},
+            ]
+        )
+
+    def test_ticker_column_is_indexed(self):
+        """Check that the ticker column is the primary key of the table."""
+        data_recorder = SQLiteDataRecorder(self.csv_file_name)
+        data_recorder.save_to_csv({"AAPL": {"MarketCap": 100}})
+        del data_recorder
+
+        connection = sqlite3.connect(self.database_file_name)
+        table_info = connection.execute("PRAGMA table_info(companies)").fetchall()
+        connection.close()
+        primary_keys = [column_info[1] for column_info in table_info if column_info[5]]
+        self.assertEqual(primary_keys, ["Ticker"])
+
+    def test_existing_csv_is_imported(self):
+        """Check that a csv file from a previous run is merged with the new data."""
+        with open(self.csv_file_name, "w", newline="") as file:
+            file.write("Ticker,name,MarketCap\nAAPL,Apple,100\n")
+
+        data_recorder = SQLiteDataRecorder(self.csv_file_name)
+        data_recorder.save_to_csv({"AAPL": {"Dividend": 0.5}})
+        data_recorder.flush()
+
+        self.assertEqual(
+            self._read_csv(),
+            [{"Ticker": "AAPL", "name": "Apple", "MarketCap": "100", "Dividend": "0.5"}]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
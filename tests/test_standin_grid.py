@@ -0,0 +1,208 @@
+import os
+import shutil
+import unittest
+import urllib.error
+import urllib.request
+
+from macrotrends_data_scrapper.benchmark.run_benchmark import (
+    RECORDERS,
+    benchmark_engine,
+    benchmark_recorder,
+)
+from macrotrends_data_scrapper.benchmark.standin_data import (
+    generate_records,
+    get_tab_columns,
+    load_ground_truth_records,
+    to_scrapped_pages,
+)
+from macrotrends_data_scrapper.benchmark.standin_grid import (
+    StandInServer,
+    get_grid_config,
+    render_standin_page,
+)
+from macrotrends_data_scrapper.http_scrapper import HttpTableScrapper
+from macrotrends_data_scrapper.map_of_headers import MAP_OF_HEADERS
+from macrotrends_data_scrapper.utils.browser_session import CHROME_BINARY_CANDIDATES
+
+GROUND_TRUTH_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ground_truth.xlsx"
+)
+
+
+class TestStandInData(unittest.TestCase):
+    """Class to be used to test the records of the stand-in grid.
+
+    Methods
+    -------
+    test_get_tab_columns():
+        check if every parameter is shown in its column of its tab
+
+    test_generate_records():
+        check if the records are reproducible and their tickers are unique
+
+    test_generate_records_on_ground_truth():
+        check if the ground truth companies are the first records
+
+    test_generate_records_of_params():
+        check if only the values of the scrapped parameters are generated
+
+    test_to_scrapped_pages():
+        check if the records are split into pages of scrapped values
+    """
+
+    def test_get_tab_columns(self):
+        """Check if every parameter is shown in its column of its tab."""
+        tab_columns = get_tab_columns()
+        for param, tab_and_column in MAP_OF_HEADERS.items():
+            ((tab_name, column_index),) = tab_and_column.items()
+            self.assertEqual(tab_columns[tab_name][column_index - 1], param)
+        # Columns which are not scrapped are placeholders
+        self.assertEqual(tab_columns["dividend"][:2], [None, None])
+
+    def test_generate_records(self):
+        """Check if the records are reproducible and their tickers are unique."""
+        records = generate_records(1000, seed=3)
+        self.assertEqual(len(records), 1000)
+        self.assertEqual(len({record["ticker"] for record in records}), 1000)
+        self.assertEqual(records, generate_records(1000, seed=3))
+        self.assertNotEqual(records, generate_records(1000, seed=4))
+
+    def test_generate_records_on_ground_truth(self):
+        """Check if the ground truth companies are the first records."""
+        ground_truth_records = load_ground_truth_records(GROUND_TRUTH_FILE)
+        self.assertEqual(
+            ground_truth_records[0],
+            {"ticker": "JFIN", "comp_name": "Jiayin Group", "market_val": 373,
+             "pe_ratio": 0.71, "roa": 58.36}
+        )
+
+        records = generate_records(
+            len(ground_truth_records) + 50, base_records=ground_truth_records
+        )
+        self.assertEqual(records[0]["market_val"], 373)
+        self.assertEqual(len({record["ticker"] for record in records}), len(records))
+
+    def test_generate_records_of_params(self):
+        """Check if only the values of the scrapped parameters are generated."""
+        records = generate_records(10, params=["Market Cap", "Exchange"])
+        self.assertEqual(set(records[0]), {"ticker", "comp_name", "market_val", "exchange"})
+
+    def test_to_scrapped_pages(self):
+        """Check if the records are split into pages of scrapped values."""
+        records = generate_records(45, params=["Exchange"])
+        records[1]["exchange"] = None
+        pages = list(to_scrapped_pages(records, ["Exchange"], rows_per_page=20))
+        self.assertEqual([len(page) for page in pages], [20, 20, 5])
+        self.assertEqual(
+            pages[0]["A"], {"name": "A Holdings Inc", "Exchange": records[0]["exchange"]}
+        )
+        self.assertEqual(pages[0]["B"]["Exchange"], "")
+
+
+class TestStandInGridConfig(unittest.TestCase):
+    """Class to be used to test the configuration of the stand-in grid.
+
+    Methods
+    -------
+    test_render_latencies():
+        check if the render latencies are embedded in the page
+    """
+
+    def test_render_latencies(self):
+        """Check if the render latencies are embedded in the page."""
+        grid_config = get_grid_config(
+            render_delay_ms=5, render_jitter_ms=10, slow_page_ratio=0.1,
+            slow_page_delay_ms=500, seed=7,
+        )
+        page = render_standin_page(generate_records(5), grid_config)
+        self.assertIn('"renderJitterMs":10', page)
+        self.assertIn('"slowPageRatio":0.1', page)
+        self.assertIn('"slowPageDelayMs":500', page)
+        self.assertIn('"seed":7', page)
+
+
+class TestRecorderBenchmark(unittest.TestCase):
+    """Class to be used to test the benchmark of the data recorders.
+
+    Methods
+    -------
+    test_benchmark_recorder():
+        check if every page is saved by each data recorder
+    """
+
+    def test_benchmark_recorder(self):
+        """Check if every page is saved by each data recorder."""
+        pages = list(to_scrapped_pages(generate_records(45), ["Market Cap"], rows_per_page=20))
+        for recorder in RECORDERS:
+            with self.subTest(recorder=recorder):
+                result = benchmark_recorder(recorder, pages, trace_memory=True)
+                self.assertEqual(result["rows"], 45)
+                self.assertEqual(result["pages"], 3)
+                self.assertIsNotNone(result["peak_memory_mb"])
+
+
+class TestStandInServer(unittest.TestCase):
+    """Class to be used to test serving the stand-in page.
+
+    Methods
+    -------
+    test_http_scrapper():
+        check if the records embedded in the page are scrapped by the http backend
+
+    test_unknown_path():
+        check if only the stock screener page is served
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """Serve a stand-in page of a few records."""
+        cls.records = generate_records(45)
+        cls.server = StandInServer(render_standin_page(cls.records))
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Shut down the server."""
+        cls.server.stop()
+
+    def test_http_scrapper(self):
+        """Check if the records embedded in the page are scrapped by the http backend."""
+        scrapper = HttpTableScrapper(str_logger="none", url=self.server.url)
+        try:
+            company_attr_dict = scrapper.scrap_records(["Market Cap", "Exchange"])
+        finally:
+            scrapper.close()
+        self.assertEqual(list(company_attr_dict), [record["ticker"] for record in self.records])
+        self.assertEqual(company_attr_dict["A"]["Exchange"], self.records[0]["exchange"])
+
+    def test_unknown_path(self):
+        """Check if only the stock screener page is served."""
+        with self.assertRaises(urllib.error.HTTPError) as context:
+            urllib.request.urlopen(self.server.url.replace("stock-screener", "other"))
+        self.assertEqual(context.exception.code, 404)
+
+
+@unittest.skipUnless(
+    any(shutil.which(candidate) for candidate in CHROME_BINARY_CANDIDATES),
+    "a browser is needed to scrap the stand-in grid"
+)
+class TestStandInBenchmark(unittest.TestCase):
+    """Class to be used to test TableScrapper against the stand-in grid.
+
+    Methods
+    -------
+    test_extraction_modes():
+        check if every row of the stand-in table is scrapped by each extraction mode
+    """
+
+    def test_extraction_modes(self):
+        """Check if every row of the stand-in table is scrapped by each extraction mode."""
+        with StandInServer(render_standin_page(generate_records(45))) as server:
+            for extraction_mode in ("element", "bulk", "datasource"):
+                with self.subTest(extraction_mode=extraction_mode):
+                    result = benchmark_engine(
+                        extraction_mode, server.url, ["Market Cap", "Exchange"],
+                        num_of_rows=45, rows_per_page=20,
+                    )
+                    self.assertEqual(result["rows"], 45)
+                    self.assertEqual(result["pages"], 3)
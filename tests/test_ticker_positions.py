@@ -0,0 +1,68 @@
+import os
+import unittest
+
+from macrotrends_data_scrapper.ticker_positions import TickerPositionCache
+
+
+class TestTickerPositionCache(unittest.TestCase):
+    """Class to be used to test TickerPositionCache class.
+
+    Methods
+    -------
+    test_save_and_load():
+        check if the recorded positions are loaded back
+
+    test_load_with_other_rows_per_page():
+        check if positions recorded for another page size are not loaded
+
+    test_group_by_page():
+        check if the tickers are grouped by their pages in order
+    """
+
+    def setUp(self):
+        """Set up the name of the cache file."""
+        self.cache_file_name = "test_output.csv.positions"
+
+    def tearDown(self):
+        """Remove the cache file."""
+        if os.path.exists(self.cache_file_name):
+            os.remove(self.cache_file_name)
+
+    def test_save_and_load(self):
+        """Check if the recorded positions are loaded back."""
+        ticker_positions = TickerPositionCache(self.cache_file_name)
+        self.assertFalse(ticker_positions.load(rows_per_page=20))
+        ticker_positions.record_page(0, ["AAPL", "MSFT"])
+        ticker_positions.record_page(3, ["JPM"])
+        ticker_positions.save()
+
+        loaded_positions = TickerPositionCache(self.cache_file_name)
+        self.assertTrue(loaded_positions.load(rows_per_page=20))
+        self.assertEqual(loaded_positions.positions, {"AAPL": 0, "MSFT": 0, "JPM": 3})
+
+    def test_load_with_other_rows_per_page(self):
+        """Check if positions recorded for another page size are not loaded."""
+        ticker_positions = TickerPositionCache(self.cache_file_name)
+        ticker_positions.load(rows_per_page=20)
+        ticker_positions.record_page(0, ["AAPL"])
+        ticker_positions.save()
+
+        other_positions = TickerPositionCache(self.cache_file_name)
+        self.assertFalse(other_positions.load(rows_per_page=50))
+        self.assertEqual(other_positions.positions, {})
+
+    def test_group_by_page(self):
+        """Check if the tickers are grouped by their pages in order."""
+        ticker_positions = TickerPositionCache(self.cache_file_name)
+        ticker_positions.record_page(5, ["JPM", "V"])
+        ticker_positions.record_page(0, ["AAPL"])
+
+        tickers_per_page, unknown_tickers = ticker_positions.group_by_page(
+            ["V", "NEW", "AAPL", "JPM"]
+        )
+        self.assertEqual(list(tickers_per_page.items()), [(0, ["AAPL"]), (5, ["V", "JPM"])])
+        self.assertEqual(unknown_tickers, ["NEW"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+
+from macrotrends_data_scrapper.traversal_planner import (
+    PAGE_MAJOR,
+    TAB_MAJOR,
+    choose_traversal_strategy,
+    estimate_traversal_seconds,
+    group_params_by_tab,
+    order_tabs,
+)
+
+
+class TestTraversalPlanner(unittest.TestCase):
+    """Class to be used to test the planning of the traversal of the pages and the tabs.
+
+    Methods
+    -------
+    test_group_params_by_tab():
+        check if the parameters are grouped by their tabs in order
+
+    test_order_tabs():
+        check if the active tab is visited first
+
+    test_estimate_traversal_seconds():
+        check if the page turns and the tab switches are counted per strategy
+
+    test_choose_traversal_strategy():
+        check if the strategy with the less estimated seconds is chosen
+    """
+
+    def test_group_params_by_tab(self):
+        """Check if the parameters are grouped by their tabs in order."""
+        self.assertEqual(
+            group_params_by_tab(["Sector", "Exchange", "Market Cap", "Industry"]),
+            {"descriptive": ["Sector", "Exchange"], "overview": ["Market Cap", "Industry"]}
+        )
+
+    def test_order_tabs(self):
+        """Check if the active tab is visited first."""
+        tab_names = ["descriptive", "overview", "dividend"]
+        self.assertEqual(order_tabs(tab_names, None), tab_names)
+        self.assertEqual(order_tabs(tab_names, "ratios"), tab_names)
+        self.assertEqual(
+            order_tabs(tab_names, "dividend"), ["dividend", "descriptive", "overview"]
+        )
+
+    def test_estimate_traversal_seconds(self):
+        """Check if the page turns and the tab switches are counted per strategy."""
+        # 3 pages, 2 tabs, page turn costs 1 second, tab switch costs 10 seconds
+        seconds = estimate_traversal_seconds(3, 2, 1.0, 10.0)
+        # page-major: 2 page turns, 2 + 1 + 1 tab switches
+        self.assertEqual(seconds[PAGE_MAJOR], 2 * 1.0 + 4 * 10.0)
+        # tab-major: 2 * 2 page turns and a jump back, 2 tab switches
+        self.assertEqual(seconds[TAB_MAJOR], 5 * 1.0 + 2 * 10.0)
+
+    def test_choose_traversal_strategy(self):
+        """Check if the strategy with the less estimated seconds is chosen."""
+        self.assertEqual(choose_traversal_strategy(100, 3, [0.1], [1.0]), TAB_MAJOR)
+        self.assertEqual(choose_traversal_strategy(100, 3, [1.0], [0.1]), PAGE_MAJOR)
+        self.assertEqual(choose_traversal_strategy(100, 3, [], []), PAGE_MAJOR)
+
+
+if __name__ == "__main__":
+    unittest.main()
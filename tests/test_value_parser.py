@@ -0,0 +1,85 @@
+import csv
+import math
+import os
+import unittest
+
+import numpy as np
+
+from macrotrends_data_scrapper.value_parser import (
+    parse_column,
+    parse_csv,
+    parse_scrapped_data,
+)
+
+
+class TestParseColumn(unittest.TestCase):
+    """Test the parsing of the columns."""
+
+    def test_parse_money_column(self):
+        """Check that the currency symbols and the magnitude suffixes are handled."""
+        numbers = parse_column(["$2.91T", "$512.3B", "$1,234.50", "-$12M", "-", ""], "money")
+        np.testing.assert_allclose(
+            numbers, [2.91e12, 5.123e11, 1234.5, -1.2e7, np.nan, np.nan]
+        )
+
+    def test_parse_percent_column(self):
+        """Check that the percents are parsed as percentage points."""
+        numbers = parse_column(["12.4%", "-3.05%", "+1.00%", "N/A"], "percent")
+        np.testing.assert_allclose(numbers, [12.4, -3.05, 1.0, np.nan])
+
+    def test_parse_column_with_unparseable_value(self):
+        """Check that a value which is not a number is parsed as NaN."""
+        numbers = parse_column(["28.35", "unknown"], "number")
+        self.assertEqual(numbers[0], 28.35)
+        self.assertTrue(math.isnan(numbers[1]))
+
+    def test_parse_text_column(self):
+        """Check that the text values are kept as they are."""
+        values = ["Computer Hardware", "-"]
+        self.assertEqual(parse_column(values, "text").tolist(), values)
+
+
+class TestParseScrappedData(unittest.TestCase):
+    """Test the parsing of the scrapped data and the csv files."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.csv_file_name = "test_value_parser.csv"
+
+    def tearDown(self):
+        """Tear down the test environment."""
+        if os.path.exists(self.csv_file_name):
+            os.remove(self.csv_file_name)
+
+    def test_parse_scrapped_data(self):
+        """Check that only the numeric parameters are parsed, missing values become None."""
+        parsed_data = parse_scrapped_data({
+            "AAPL": {"name": "Apple Inc", "Market Cap": "$2.91T", "Exchange": "NASDAQ"},
+            "XYZ": {"name": "XYZ Corp", "Market Cap": "-"},
+        })
+        self.assertEqual(
+            parsed_data,
+            {
+                "AAPL": {"name": "Apple Inc", "Market Cap": 2.91e12, "Exchange": "NASDAQ"},
+                "XYZ": {"name": "XYZ Corp", "Market Cap": None},
+            }
+        )
+
+    def test_parse_csv(self):
+        """Check that the numeric columns of a csv file are parsed in place."""
+        with open(self.csv_file_name, "w", newline="") as file:
+            file.write("Ticker,name,Market Cap,Dividend Yield\n")
+            file.write("AAPL,Apple Inc,$2.91T,0.51%\n")
+            file.write("MSFT,Microsoft Corp,$2.78T,-\n")
+        parse_csv(self.csv_file_name)
+
+        with open(self.csv_file_name, "r", newline="") as file:
+            rows = list(csv.DictReader(file))
+        self.assertEqual(float(rows[0]["Market Cap"]), 2.91e12)
+        self.assertEqual(float(rows[0]["Dividend Yield"]), 0.51)
+        self.assertEqual(rows[1]["Dividend Yield"], "")
+        self.assertEqual(rows[1]["name"], "Microsoft Corp")
+
+
+if __name__ == "__main__":
+    unittest.main()